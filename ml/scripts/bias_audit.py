@@ -39,8 +39,10 @@ import json
 import re
 from pathlib import Path
 
-from obiai.bayes import BayesianNetwork, BinaryNode
-from obiai.bayesian import PhiMarginalizedNetwork
+import numpy as np
+
+from obiai.bayesian import PhiMarginalizedNetwork, SufficientStatistics
+from obiai.bias.metrics import demographic_parity_gap
 
 ML_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_INPUT = ML_DIR / "data" / "oasst2" / "sft_pairs.jsonl"
@@ -75,6 +77,7 @@ _TERM_PATTERN = re.compile(
 QUALITY_FLAG_THRESHOLD = 0.3
 TRUST_THRESHOLD = 0.3
 PHI_PRIOR = {"raw": 0.1, "corrected": 0.9}
+STRUCTURE: dict[str, tuple[str, ...]] = {"C": (), "T": ("C",)}
 
 
 def mentions_protected_attribute(text: str) -> bool:
@@ -113,47 +116,25 @@ def compute_evidence(example: dict) -> tuple[bool, bool, bool]:
     return a, c, t
 
 
-def build_cpt(examples: list[tuple[bool, bool, bool]], only_a: bool | None) -> dict[bool, float]:
-    """P(T=1 | C=c) estimated over the given subset (Laplace-smoothed)."""
-    counts = {False: [0, 0], True: [0, 0]}  # c -> [T=1 count, total count]
-    for a, c, t in examples:
-        if only_a is not None and a != only_a:
-            continue
-        counts[c][1] += 1
-        if t:
-            counts[c][0] += 1
-    return {
-        c: (hits + 1) / (total + 2)  # Laplace smoothing avoids 0/1 CPT entries
-        for c, (hits, total) in counts.items()
-    }
-
-
 def build_marginalized_network(evidence: list[tuple[bool, bool, bool]]) -> PhiMarginalizedNetwork:
-    c_prior = (sum(c for _, c, _ in evidence) + 1) / (len(evidence) + 2)
-    raw_cpt = build_cpt(evidence, only_a=None)
-    corrected_cpt = build_cpt(evidence, only_a=False)
-
-    def network(cpt: dict[bool, float]) -> BayesianNetwork:
-        net = BayesianNetwork()
-        net.add(BinaryNode("C", cpt={(): c_prior}))
-        net.add(BinaryNode("T", parents=("C",), cpt={(True,): cpt[True], (False,): cpt[False]}))
-        return net
-
+    a, c, t = np.array(evidence, dtype=bool).reshape(-1, 3).T
+    # Laplace-smoothed counts, one vectorized group-by per CPT. The corrected
+    # estimate of P(T | C) sees only A=0 rows; both share the corpus-wide P(C).
+    raw = SufficientStatistics.empty(STRUCTURE, alpha=1.0)
+    raw.update({"C": c, "T": t})
+    corrected = SufficientStatistics.empty(STRUCTURE, alpha=1.0)
+    corrected.update({"C": c[~a], "T": t[~a]})
+    corrected.counts["C"] = raw.counts["C"].copy()
     return PhiMarginalizedNetwork(
         phi_prior=PHI_PRIOR,
-        networks={"raw": network(raw_cpt), "corrected": network(corrected_cpt)},
+        networks={"raw": raw.network(), "corrected": corrected.network()},
     )
 
 
 def parity_gap(weights: list[float], protected: list[bool]) -> float | None:
     """Theorem 5.2-style demographic-parity gap: |mean(A=1) - mean(A=0)|."""
-    group_a = [w for w, a in zip(weights, protected) if a]
-    group_not_a = [w for w, a in zip(weights, protected) if not a]
-    if not group_a or not group_not_a:
-        return None
-    mean_a = sum(group_a) / len(group_a)
-    mean_not_a = sum(group_not_a) / len(group_not_a)
-    return abs(mean_a - mean_not_a)
+    gap = demographic_parity_gap(weights, np.asarray(protected, dtype=np.intp), n_groups=2)
+    return None if np.isnan(gap) else gap
 
 
 def main() -> None:
@@ -172,8 +153,11 @@ def main() -> None:
     mix = build_marginalized_network(evidence)
     raw_only = mix.networks["raw"]
 
-    raw_weights = [raw_only.query("T", {"C": c}) for _, c, _ in evidence]
-    debiased_weights = [mix.query("T", {"C": c}) for _, c, _ in evidence]
+    # One column of C values: query_many runs inference once per distinct
+    # value (two) and scatters the weights back to every example.
+    c_column = np.array([[c] for _, c, _ in evidence], dtype=bool).reshape(-1, 1)
+    raw_weights = raw_only.query_many("T", c_column, ["C"]).tolist()
+    debiased_weights = mix.query_many("T", c_column, ["C"]).tolist()
     protected = [a for a, _, _ in evidence]
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
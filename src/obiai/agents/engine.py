@@ -11,8 +11,12 @@ or any provider directly.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from obiai.bayesian import PhiPosteriorState
 from obiai.core.config import Settings, ThresholdSettings
-from obiai.core.models import Decision, Observation, TruthState
+from obiai.core.models import BiasReport, Decision, Observation, TruthState
 from obiai.core.protocols import (
     AgentPlanner,
     BayesianReasoner,
@@ -20,11 +24,19 @@ from obiai.core.protocols import (
     OntologyMapperProtocol,
     SafetyAuditorProtocol,
 )
-from obiai.epistemic import build_semantic_dag, traverse_semantic_path
+from obiai.epistemic import SemanticChainCache, SessionSemanticGraph
 from obiai.ontology import Ontology
 
 __all__ = ["UReasoningEngine", "truth_state"]
 
+# Sessions whose per-session state is kept; sessions never deleted through
+# the API are dropped least recently used first.
+DEFAULT_TRACKED_SESSIONS = 1024
+# Folded observations per session whose prior belief is kept, so a replay of
+# any of them (e.g. a client retry) is not counted twice. Replays of older
+# observations are folded in again.
+DEFAULT_REPLAYABLE_OBSERVATIONS = 256
+
 
 def truth_state(
     probability: float, uncertainty: float, thresholds: ThresholdSettings
@@ -42,6 +54,15 @@ def truth_state(
     return TruthState.MAYBE
 
 
+@dataclass(slots=True)
+class _SessionPhi:
+    # P(phi | every observation folded so far).
+    state: PhiPosteriorState
+    # Observation id -> the belief before it was folded, oldest first, so
+    # re-reasoning about a recent observation does not count its evidence twice.
+    before: OrderedDict[str, PhiPosteriorState] = field(default_factory=OrderedDict)
+
+
 class UReasoningEngine:
     def __init__(
         self,
@@ -52,6 +73,7 @@ class UReasoningEngine:
         safety_auditor: SafetyAuditorProtocol,
         planner: AgentPlanner,
         settings: Settings,
+        max_sessions: int = DEFAULT_TRACKED_SESSIONS,
     ) -> None:
         self.reasoner = reasoner
         self.ontology = ontology
@@ -60,6 +82,29 @@ class UReasoningEngine:
         self.safety_auditor = safety_auditor
         self.planner = planner
         self.settings = settings
+        self.max_sessions = max_sessions
+        self._phi_sessions: OrderedDict[str, _SessionPhi] = OrderedDict()
+        self._semantic_chains = SemanticChainCache()
+        self._semantic_graphs: OrderedDict[str, SessionSemanticGraph] = OrderedDict()
+        # Bias verdicts depend only on the ontology and the proposition, so
+        # they are computed once per ontology version.
+        self._bias_reports: dict[str, BiasReport] = {}
+        self._bias_version = ontology.version
+        for proposition in mapper.known_propositions:
+            self._bias_report(proposition)
+
+    def phi_state(self, session_id: str) -> PhiPosteriorState | None:
+        """The session's accumulated P(phi | observations), if any."""
+        tracked = self._phi_sessions.get(session_id)
+        return None if tracked is None else tracked.state
+
+    def semantic_graph(self, session_id: str) -> SessionSemanticGraph | None:
+        """The session's grown semantic DAG, if ``epistemic.session_graph`` is on."""
+        return self._semantic_graphs.get(session_id)
+
+    def forget_session(self, session_id: str) -> None:
+        self._phi_sessions.pop(session_id, None)
+        self._semantic_graphs.pop(session_id, None)
 
     def reason(self, session_id: str, observation: Observation) -> Decision:
         thresholds = self.settings.u.thresholds
@@ -74,16 +119,45 @@ class UReasoningEngine:
 
         # 2. Bayesian update (phi-marginalized when the reasoner supports it)
         evidence_assignment = {mapping.bn_variable: bool(observation.value)}
-        probability = self.reasoner.query(mapping.proposition, evidence_assignment)
+        phi_weights: dict[str, float] | None = None
+        phi_observations: int | None = None
+        query_with_posterior = getattr(self.reasoner, "query_with_posterior", None)
+        if callable(query_with_posterior):
+            # One pass over the stacked phi networks yields both quantities.
+            tracked = self._session_phi(session_id)
+            if tracked is None:
+                result = query_with_posterior(mapping.proposition, evidence_assignment)
+            else:
+                before = tracked.before.get(observation.observation_id)
+                belief = tracked.state if before is None else before
+                result = query_with_posterior(
+                    mapping.proposition, evidence_assignment, prior=belief.posterior()
+                )
+                # This observation and the ones folded before it.
+                phi_observations = belief.observations + 1
+                if before is None:
+                    tracked.before[observation.observation_id] = tracked.state.copy()
+                    if len(tracked.before) > DEFAULT_REPLAYABLE_OBSERVATIONS:
+                        tracked.before.popitem(last=False)
+                    tracked.state.update(result.likelihood)
+            probability, phi_weights = result.posterior, result.phi_posterior
+        else:
+            probability = self.reasoner.query(mapping.proposition, evidence_assignment)
+            phi_posterior = getattr(self.reasoner, "phi_posterior", None)
+            if callable(phi_posterior):
+                phi_weights = phi_posterior(evidence_assignment)
         explanation.append(
             f"Posterior P({mapping.proposition} | {mapping.bn_variable}="
             f"{bool(observation.value)}) = {probability:.4f}."
         )
-        phi_posterior = getattr(self.reasoner, "phi_posterior", None)
-        if callable(phi_posterior):
-            phi_weights = phi_posterior(evidence_assignment)
+        if phi_weights is not None:
             rendered = ", ".join(f"{phi}={weight:.4f}" for phi, weight in phi_weights.items())
-            explanation.append(f"Bias parameter posterior P(phi | evidence): {rendered}.")
+            given = (
+                "evidence"
+                if phi_observations is None
+                else f"{phi_observations} session observation{'s' * (phi_observations != 1)}"
+            )
+            explanation.append(f"Bias parameter posterior P(phi | {given}): {rendered}.")
 
         # 3. Uncertainty and truth state
         uncertainty = 1.0 - abs(probability - 0.5) * 2.0
@@ -94,16 +168,21 @@ class UReasoningEngine:
         )
 
         # 4. Epistemic DAG traversal
-        source, intermediate, target = mapping.semantic_chain
-        dag = build_semantic_dag(
-            probability,
-            self.settings.u.epistemic,
-            source=source,
-            intermediate=intermediate,
-            target=target,
-            source_belief=observation.confidence,
-        )
-        path_result = traverse_semantic_path(dag, source, target, self.settings.u.epistemic)
+        epistemic = self.settings.u.epistemic
+        if epistemic.session_graph:
+            path_result = self._session_graph(session_id).observe(
+                observation.observation_id,
+                mapping.semantic_chain,
+                probability,
+                source_belief=observation.confidence,
+            )
+        else:
+            path_result = self._semantic_chains.traverse(
+                mapping.semantic_chain,
+                probability,
+                epistemic,
+                source_belief=observation.confidence,
+            )
         semantic_path = path_result.path if path_result else []
         if path_result:
             for flash in path_result.flash_events:
@@ -116,7 +195,8 @@ class UReasoningEngine:
             )
 
         # 5. Bias audit (protected-attribute paths in the ontology)
-        bias = self.bias_auditor.audit_paths(self.ontology, mapping.proposition)
+        # A copy, so callers editing the decision cannot alter the cached report.
+        bias = self._bias_report(mapping.proposition).model_copy(deep=True)
         explanation.append(
             "Bias audit passed: no protected attribute reaches the proposition."
             if bias.passed
@@ -151,3 +231,39 @@ class UReasoningEngine:
 
     def _truth_state(self, probability: float, uncertainty: float) -> TruthState:
         return truth_state(probability, uncertainty, self.settings.u.thresholds)
+
+    def _bias_report(self, proposition: str) -> BiasReport:
+        if self.ontology.version != self._bias_version:
+            self._bias_reports.clear()
+            self._bias_version = self.ontology.version
+        report = self._bias_reports.get(proposition)
+        if report is None:
+            report = self.bias_auditor.audit_paths(self.ontology, proposition)
+            self._bias_reports[proposition] = report
+        return report
+
+    def _session_graph(self, session_id: str) -> SessionSemanticGraph:
+        graph = self._semantic_graphs.get(session_id)
+        if graph is None:
+            epistemic = self.settings.u.epistemic
+            graph = SessionSemanticGraph(epistemic, max_nodes=epistemic.session_max_nodes)
+            self._semantic_graphs[session_id] = graph
+            if len(self._semantic_graphs) > self.max_sessions:
+                self._semantic_graphs.popitem(last=False)
+        else:
+            self._semantic_graphs.move_to_end(session_id)
+        return graph
+
+    def _session_phi(self, session_id: str) -> _SessionPhi | None:
+        prior = getattr(self.reasoner, "phi_prior", None)
+        if not self.settings.u.phi.sequential or prior is None:
+            return None
+        tracked = self._phi_sessions.get(session_id)
+        if tracked is None:
+            tracked = _SessionPhi(PhiPosteriorState.from_prior(prior))
+            self._phi_sessions[session_id] = tracked
+            if len(self._phi_sessions) > self.max_sessions:
+                self._phi_sessions.popitem(last=False)
+        else:
+            self._phi_sessions.move_to_end(session_id)
+        return tracked
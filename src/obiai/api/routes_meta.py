@@ -1,10 +1,11 @@
-"""Meta endpoints: health, version, ontology introspection."""
+"""Meta endpoints: health, version, ontology introspection, parity monitoring."""
 
 from __future__ import annotations
 
 from fastapi import APIRouter, Request
 
 import obiai
+from obiai.core.models import BiasReport
 from obiai.training.runtime import UAIModelLoadError
 
 router = APIRouter(tags=["meta"])
@@ -69,3 +70,9 @@ def ontology_relations(request: Request) -> list[dict[str, str]]:
         {"subject": subject, "relation": key, "object": obj}
         for subject, obj, key in sorted(graph.edges(keys=True))
     ]
+
+
+@router.get("/bias/parity", response_model=BiasReport)
+def parity_report(request: Request) -> BiasReport:
+    """Demographic parity of YES decisions over observations submitted with a ``group``."""
+    return request.app.state.service.parity_report()
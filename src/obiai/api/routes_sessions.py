@@ -63,7 +63,7 @@ async def submit_observation(
 ) -> ObservationAccepted:
     try:
         observation, decision = await _service(request).handle_observation(
-            session_id, observation_in
+            session_id, observation_in, group=observation_in.group
         )
     except SessionNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
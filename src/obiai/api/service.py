@@ -14,6 +14,7 @@ from __future__ import annotations
 import re
 
 from obiai.agents import GREETING, UReasoningEngine, render_agent_message
+from obiai.bias import ParityMonitor
 from obiai.core.config import Settings
 from obiai.core.errors import (
     DisallowedEventTypeError,
@@ -21,11 +22,13 @@ from obiai.core.errors import (
     SessionNotFoundError,
 )
 from obiai.core.models import (
+    BiasReport,
     Decision,
     Observation,
     ObservationIn,
     TranscriptEntry,
     TranscriptSegment,
+    TruthState,
 )
 from obiai.knowledge import UAgenticModel, answer_transcript
 from obiai.memory import Session, SessionRepository
@@ -82,6 +85,7 @@ class UService:
         settings: Settings,
         u_model: UAgenticModel,
         uai_models: UAIModelManager | None = None,
+        parity: ParityMonitor | None = None,
     ) -> None:
         self.repo = repo
         self.bus = bus
@@ -89,6 +93,13 @@ class UService:
         self.settings = settings
         self.u_model = u_model
         self.uai_models = uai_models
+        if parity is None:
+            parity = ParityMonitor(
+                settings.bias.maximum_demographic_parity_gap,
+                half_life=settings.bias.parity_half_life,
+                window=settings.bias.parity_window,
+            )
+        self.parity = parity
 
     # --- Sessions -----------------------------------------------------------
 
@@ -105,6 +116,7 @@ class UService:
         if not self.repo.delete(session_id):
             raise SessionNotFoundError(session_id)
         self.bus.drop_session(session_id)
+        self.engine.forget_session(session_id)
 
     # --- Pipeline entry points ----------------------------------------------
 
@@ -115,12 +127,24 @@ class UService:
         )
 
     async def handle_observation(
-        self, session_id: str, observation_in: ObservationIn
+        self, session_id: str, observation_in: ObservationIn, *, group: str | None = None
     ) -> tuple[Observation, Decision]:
+        """Run one observation through the pipeline.
+
+        ``group`` is a demographic label used only for parity monitoring; it
+        never reaches the reasoning engine.
+        """
         self.get_session(session_id)
-        return await self._run_observation_pipeline(
+        observation, decision = await self._run_observation_pipeline(
             session_id, observation_in, publish_default_message=True
         )
+        if group is not None:
+            self.parity.record(group, decision.state is TruthState.YES)
+        return observation, decision
+
+    def parity_report(self) -> BiasReport:
+        """Demographic parity of YES decisions across the monitored groups."""
+        return self.parity.report()
 
     async def handle_chat(self, session_id: str, text: str) -> str:
         """Typed chat: the client already shows the user's own message locally."""
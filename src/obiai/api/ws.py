@@ -106,7 +106,9 @@ async def _dispatch(service, session_id: str, event) -> None:
     elif isinstance(event, ChatMessage):
         await service.handle_chat(session_id, event.text)
     elif isinstance(event, ObservationSubmit):
-        await service.handle_observation(session_id, event.observation)
+        await service.handle_observation(
+            session_id, event.observation, group=event.observation.group
+        )
     elif isinstance(event, ClarificationAnswer):
         await service.handle_chat(session_id, event.answer)
     elif isinstance(event, ClientTranscriptPartial):
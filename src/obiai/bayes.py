@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from itertools import product
-from typing import Mapping
+from typing import TYPE_CHECKING, Callable, Mapping, Protocol, Sequence, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from obiai.bayesian.junction import JunctionTreeStructure
+
+INFERENCE_METHODS = ("enumerate", "ve", "junction_tree")
+
+# Enumeration evaluates the joint in blocks of 2**_BLOCK_BITS assignments so
+# memory stays bounded however many variables are unobserved.
+_BLOCK_BITS = 16
+
+# CPT for observed nodes whose factor is constant given the evidence (see
+# obiai.bayesian.pruning); any value in (0, 1) leaves the conditional intact.
+_PLACEHOLDER = np.array(0.5)
 
 
 @dataclass(slots=True)
@@ -11,45 +26,542 @@ class BinaryNode:
     parents: tuple[str, ...] = ()
     # Maps parent truth tuple to P(node=True). Root nodes use key ().
     cpt: dict[tuple[bool, ...], float] = field(default_factory=dict)
+    # Dense compiled form of ``cpt``: P(node=True) indexed by parent bits,
+    # shape (2,) * len(parents). Built by ``compile()``.
+    table: np.ndarray | None = field(default=None, repr=False, compare=False)
 
     def probability(self, value: bool, assignment: Mapping[str, bool]) -> float:
         key = tuple(bool(assignment[parent]) for parent in self.parents)
         p_true = self.cpt[key]
         return p_true if value else 1.0 - p_true
 
+    def compile(self) -> np.ndarray:
+        """(Re)build ``table`` from ``cpt``; call again after editing ``cpt``."""
+        table = np.empty((2,) * len(self.parents))
+        for index in np.ndindex(table.shape):
+            table[index] = self.cpt[tuple(bool(bit) for bit in index)]
+        self.table = table
+        return table
+
+    def p_true(self, parent_values: list[np.ndarray | bool]) -> np.ndarray:
+        """Vectorized P(node=True) for columns of parent values (one per parent)."""
+        return lookup(self.table if self.table is not None else self.compile(), parent_values)
+
+    def decompose(self) -> list[tuple[str, tuple[str, ...], np.ndarray]]:
+        """``(name, parents, table)`` CPTs equivalent to this node; here just its own."""
+        return [(self.name, self.parents, self.table if self.table is not None else self.compile())]
+
+
+@dataclass(slots=True)
+class ParametricNode(ABC):
+    """Base for CPTs given by O(k) parameters rather than a 2**k table.
+
+    P(node=True) is computed from the parent values; the dense table is only
+    built when an engine or caller explicitly asks for it.
+    """
+
+    name: str
+    parents: tuple[str, ...]
+    table: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
+    @abstractmethod
+    def p_true(
+        self, parent_values: Sequence[np.ndarray | bool], shape: tuple[int, ...] = ()
+    ) -> np.ndarray:
+        """Vectorized P(node=True) for columns of parent values (one per parent)."""
+
+    def probability(self, value: bool, assignment: Mapping[str, bool]) -> float:
+        p_true = float(self.p_true([bool(assignment[parent]) for parent in self.parents]))
+        return p_true if value else 1.0 - p_true
+
+    def compile(self) -> np.ndarray:
+        """Dense P(True) table, shape (2,) * len(parents) -- 2**k entries."""
+        bits = np.indices((2,) * len(self.parents)).astype(bool)
+        self.table = np.broadcast_to(self.p_true(list(bits)), bits.shape[1:]).copy()
+        return self.table
+
+    def decompose(self) -> list[tuple[str, tuple[str, ...], np.ndarray]]:
+        return [(self.name, self.parents, self.compile())]
+
+
+@dataclass(slots=True)
+class _CausalIndependenceNode(ParametricNode):
+    # Noisy-OR / noisy-AND: each parent acts independently, so the CPT is a
+    # chain of binary accumulators A_0 -> A_1 -> ... -> A_k = node, where
+    # A_i depends only on A_{i-1} and parent i. Elimination engines consume
+    # the k small (2, 2) links instead of one 2**k table.
+    p: tuple[float, ...] = ()
+    leak: float = 0.0
+
+    def __post_init__(self) -> None:
+        if len(self.p) != len(self.parents):
+            raise ValueError(
+                f"{self.name}: {len(self.p)} parameters for {len(self.parents)} parents"
+            )
+        if any(not 0.0 <= q <= 1.0 for q in (*self.p, self.leak)):
+            raise ValueError(f"{self.name}: parameters must lie in [0, 1]")
+
+    @abstractmethod
+    def _start(self) -> float:
+        """P(A_0 = True), the accumulator before any parent is seen."""
+
+    @abstractmethod
+    def _link(self, q: float) -> np.ndarray:
+        """P(A_i = True | A_{i-1}, parent i) as a (2, 2) table."""
+
+    def decompose(self) -> list[tuple[str, tuple[str, ...], np.ndarray]]:
+        names = [f"{self.name}#{i}" for i in range(len(self.parents))] + [self.name]
+        chain: list[tuple[str, tuple[str, ...], np.ndarray]] = [
+            (names[0], (), np.array(self._start()))
+        ]
+        for i, (parent, q) in enumerate(zip(self.parents, self.p, strict=True)):
+            chain.append((names[i + 1], (names[i], parent), self._link(q)))
+        return chain
+
+
+@dataclass(slots=True)
+class NoisyOrNode(_CausalIndependenceNode):
+    """P(node=True | x) = 1 - (1 - leak) * prod_i (1 - p_i) ** x_i.
+
+    ``p[i]`` is the chance that parent i being True alone turns the node on;
+    ``leak`` is P(node=True) with every parent False.
+    """
+
+    def p_true(
+        self, parent_values: Sequence[np.ndarray | bool], shape: tuple[int, ...] = ()
+    ) -> np.ndarray:
+        off = np.full(shape, 1.0 - self.leak)
+        for q, value in zip(self.p, parent_values, strict=True):
+            off = off * np.where(value, 1.0 - q, 1.0)
+        return 1.0 - off
+
+    def _start(self) -> float:
+        return self.leak
+
+    def _link(self, q: float) -> np.ndarray:
+        # [accumulated, parent]: once on, stays on; else parent i fires w.p. q.
+        return np.array([[0.0, q], [1.0, 1.0]])
+
+
+@dataclass(slots=True)
+class NoisyAndNode(_CausalIndependenceNode):
+    """P(node=True | x) = (1 - leak) * prod_i (1 - p_i) ** (1 - x_i).
+
+    ``p[i]`` is the chance that parent i being False alone blocks the node;
+    ``leak`` is P(node=False) with every parent True.
+    """
+
+    def p_true(
+        self, parent_values: Sequence[np.ndarray | bool], shape: tuple[int, ...] = ()
+    ) -> np.ndarray:
+        on = np.full(shape, 1.0 - self.leak)
+        for q, value in zip(self.p, parent_values, strict=True):
+            on = on * np.where(value, 1.0, 1.0 - q)
+        return on
+
+    def _start(self) -> float:
+        return 1.0 - self.leak
+
+    def _link(self, q: float) -> np.ndarray:
+        # [accumulated, parent]: once off, stays off; else a False parent
+        # blocks w.p. q.
+        return np.array([[0.0, 0.0], [1.0 - q, 1.0]])
+
+
+@dataclass(slots=True)
+class LogisticNode(ParametricNode):
+    """P(node=True | x) = sigmoid(bias + sum_i weights_i * x_i).
+
+    Enumeration evaluates it directly; a logistic CPT has no exact low-width
+    factorization, so elimination engines use its dense table.
+    """
+
+    weights: tuple[float, ...] = ()
+    bias: float = 0.0
+
+    def __post_init__(self) -> None:
+        if len(self.weights) != len(self.parents):
+            raise ValueError(
+                f"{self.name}: {len(self.weights)} weights for {len(self.parents)} parents"
+            )
+
+    def p_true(
+        self, parent_values: Sequence[np.ndarray | bool], shape: tuple[int, ...] = ()
+    ) -> np.ndarray:
+        logit = np.full(shape, self.bias)
+        for weight, value in zip(self.weights, parent_values, strict=True):
+            logit = logit + weight * np.asarray(value, dtype=float)
+        return 1.0 / (1.0 + np.exp(-logit))
+
+
+Node = BinaryNode | NoisyOrNode | NoisyAndNode | LogisticNode
+
+
+def lookup(
+    table: np.ndarray, parent_values: Sequence[np.ndarray | bool], shape: tuple[int, ...] = ()
+) -> np.ndarray:
+    """Index a compiled P(True) table by columns of parent bits.
+
+    ``table`` may carry leading batch axes (e.g. one slice per phi value)
+    in front of its ``len(parent_values)`` parent axes; they are preserved in
+    front of the broadcast shape of the parent columns (at least ``shape``).
+    """
+    index: np.ndarray | int = np.zeros(shape, dtype=np.intp) if shape else 0
+    for value in parent_values:
+        index = (index << 1) | np.asarray(value, dtype=np.intp)
+    flat = table.reshape((*table.shape[: table.ndim - len(parent_values)], -1))
+    return flat[..., index]
+
+
+def observed(
+    evidence: Mapping[str, bool], variables: Mapping[str, object], exclude: str | None = None
+) -> dict[str, bool]:
+    """Evidence restricted to known variables; ``exclude`` (a query target) is dropped."""
+    return {k: bool(v) for k, v in evidence.items() if k != exclude and k in variables}
+
+
+def conditional(true_mass: np.ndarray, false_mass: np.ndarray) -> np.ndarray:
+    """P(target=True | evidence) from the two joint masses; 0.5 when both are 0."""
+    denominator = true_mass + false_mass
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator == 0, 0.5, true_mass / denominator)
+
+
+class InferenceEngine(Protocol):
+    """Exact engine over (possibly batched) compiled CPT tables.
+
+    Masses carry the tables' leading batch shape; unbatched networks get
+    0-d arrays.
+    """
+
+    def split(self, target: str, evidence: Mapping[str, bool]) -> tuple[np.ndarray, np.ndarray]:
+        """(P(target=True, evidence), P(target=False, evidence))."""
+        ...
+
+    def evidence_mass(self, evidence: Mapping[str, bool]) -> np.ndarray:
+        """P(evidence)."""
+        ...
+
+
+def make_engine(
+    inference: str,
+    parents: Mapping[str, tuple[str, ...]],
+    tables: Mapping[str, np.ndarray | ParametricNode],
+    structure: JunctionTreeStructure | None = None,
+) -> InferenceEngine:
+    """Build the engine named by ``inference`` over compiled tables.
+
+    Enumeration also accepts a parametric node in place of a table;
+    elimination engines need the decomposed tables of
+    :meth:`BayesianNetwork.engine_inputs`, which are all arrays.
+    """
+    # Imported lazily: obiai.bayesian itself imports this module.
+    if inference == "ve":
+        from obiai.bayesian.elimination import VariableElimination
+
+        return VariableElimination(parents, cast(Mapping[str, np.ndarray], tables))
+    if inference == "junction_tree":
+        from obiai.bayesian.junction import JunctionTree
+
+        return JunctionTree(parents, cast(Mapping[str, np.ndarray], tables), structure)
+    if inference == "enumerate":
+        return Enumerator(parents, tables)
+    raise ValueError(f"Unknown inference method {inference!r}; expected one of {INFERENCE_METHODS}")
+
+
+class Enumerator:
+    """Reference engine: sums the joint over every unobserved assignment.
+
+    A CPT may be a compiled table or a parametric node, whose P(True) is
+    computed from the parent columns without building its 2**k table.
+    """
+
+    def __init__(
+        self,
+        parents: Mapping[str, tuple[str, ...]],
+        tables: Mapping[str, np.ndarray | ParametricNode],
+    ) -> None:
+        self.parents = dict(parents)
+        self.tables = dict(tables)
+        self.batch_shape = np.broadcast_shapes(
+            *(
+                table.shape[: table.ndim - len(self.parents[name])]
+                for name, table in self.tables.items()
+                if isinstance(table, np.ndarray)
+            )
+        )
+
+    def joint(self, assignment: Mapping[str, np.ndarray | bool]) -> np.ndarray:
+        shape = np.broadcast_shapes(*(np.shape(assignment[name]) for name in self.parents))
+        # Every lookup spans the full row shape so batched tables always place
+        # their batch axes in front of the same row axes.
+        joint: np.ndarray = np.ones(shape)
+        for name, parents in self.parents.items():
+            table = self.tables[name]
+            columns = [assignment[parent] for parent in parents]
+            if isinstance(table, np.ndarray):
+                p_true = lookup(table, columns, shape)
+            else:
+                p_true = table.p_true(columns, shape)
+            joint = joint * np.where(assignment[name], p_true, 1.0 - p_true)
+        return joint
+
+    def split(self, target: str, evidence: Mapping[str, bool]) -> tuple[np.ndarray, np.ndarray]:
+        return self._sum(observed(evidence, self.parents, exclude=target), split_on=target)
+
+    def evidence_mass(self, evidence: Mapping[str, bool]) -> np.ndarray:
+        return self._sum(observed(evidence, self.parents))[0]
+
+    def _sum(
+        self, fixed: Mapping[str, bool], split_on: str | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Sum the joint over all unobserved assignments.
+
+        Returns ``(mass, 0)``, or with ``split_on`` the mass where that
+        variable is True and where it is False, from a single pass.
+        """
+        unknown = [name for name in self.parents if name not in fixed]
+        n_rows = 1 << len(unknown)
+        block = 1 << _BLOCK_BITS
+        true_mass = np.zeros(self.batch_shape)
+        false_mass = np.zeros(self.batch_shape)
+        for start in range(0, n_rows, block):
+            rows = np.arange(start, min(start + block, n_rows), dtype=np.int64)
+            assignment: dict[str, np.ndarray | bool] = dict(fixed)
+            for position, name in enumerate(unknown):
+                # First unobserved variable is the most significant bit, the
+                # same assignment order as itertools.product.
+                assignment[name] = ((rows >> (len(unknown) - 1 - position)) & 1).astype(bool)
+            joint = self.joint(assignment).reshape((*self.batch_shape, -1))
+            if split_on is None:
+                true_mass = true_mass + joint.sum(axis=-1)
+            else:
+                mask = np.broadcast_to(assignment[split_on], rows.shape)
+                true_mass = true_mass + joint[..., mask].sum(axis=-1)
+                false_mass = false_mass + joint[..., ~mask].sum(axis=-1)
+        return true_mass, false_mass
+
+
+def query_distinct_rows(
+    query: Callable[[dict[str, bool]], float],
+    evidence: np.ndarray,
+    variables: Sequence[str],
+) -> np.ndarray:
+    """Evaluate ``query`` once per distinct evidence row; scatter to all rows."""
+    rows = np.asarray(evidence, dtype=bool)
+    if rows.ndim != 2 or rows.shape[1] != len(variables):
+        raise ValueError(
+            f"evidence must have shape (n_rows, {len(variables)}), got {rows.shape}"
+        )
+    if rows.shape[0] == 0:
+        return np.empty(0)
+    if rows.shape[1] <= 62:
+        # Pack each row into one integer code: a 1-D unique is far cheaper
+        # than the row-wise (axis=0) one.
+        weights = np.left_shift(1, np.arange(rows.shape[1], dtype=np.int64))
+        _, first, inverse = np.unique(rows @ weights, return_index=True, return_inverse=True)
+        distinct = rows[first]
+    else:
+        distinct, inverse = np.unique(rows, axis=0, return_inverse=True)
+    answers = np.array(
+        [query(dict(zip(variables, row.tolist(), strict=True))) for row in distinct]
+    )
+    return answers[inverse.reshape(-1)]
+
 
 class BayesianNetwork:
-    """Small exact binary Bayesian network suitable for auditable prototypes."""
+    """Small exact binary Bayesian network suitable for auditable prototypes.
+
+    ``inference`` selects the exact engine: ``"enumerate"`` sums the full
+    joint (the reference implementation), ``"ve"`` runs variable elimination
+    (:mod:`obiai.bayesian.elimination`) and scales to networks with tens of
+    nodes, ``"junction_tree"`` compiles a clique tree once and reuses its
+    messages across queries (:mod:`obiai.bayesian.junction`). All return the
+    same posterior.
+
+    Every engine reads the compiled NumPy form of each CPT. Compilation happens
+    transparently on first use; call :meth:`compile` again after editing a
+    node's ``cpt`` in place.
 
-    def __init__(self) -> None:
-        self.nodes: dict[str, BinaryNode] = {}
+    Besides :class:`BinaryNode`, nodes may be :class:`NoisyOrNode`,
+    :class:`NoisyAndNode` or :class:`LogisticNode`, which hold O(k)
+    parameters instead of a 2**k table. Enumeration evaluates them directly;
+    elimination engines see noisy-OR/AND nodes as chains of small factors
+    (see :meth:`engine_inputs`).
 
-    def add(self, node: BinaryNode) -> None:
+    Before inference the network is pruned to the part that can affect the
+    answer (:mod:`obiai.bayesian.pruning`): barren nodes for
+    :meth:`probability_of`, barren and d-separated nodes for :meth:`query`.
+    The pruned engine is cached per target and set of observed variables.
+    Junction-tree inference is never pruned: every query runs on the one
+    compiled tree, where barren cliques just send constant messages, so its
+    triangulation and message cache are shared by all queries.
+    """
+
+    def __init__(self, inference: str = "enumerate") -> None:
+        if inference not in INFERENCE_METHODS:
+            raise ValueError(
+                f"Unknown inference method {inference!r}; expected one of {INFERENCE_METHODS}"
+            )
+        self.nodes: dict[str, Node] = {}
+        self.inference = inference
+        # Bumped whenever derived state is dropped (nodes added, recompiled),
+        # so holders of stacked copies of the tables know to rebuild them.
+        self.version = 0
+        self._engine_cache: tuple[str, InferenceEngine] | None = None
+        self._pruned: dict[tuple[str, str | None, frozenset[str]], InferenceEngine] = {}
+        self._compiled = False
+
+    def add(self, node: Node) -> None:
         missing = [parent for parent in node.parents if parent not in self.nodes]
         if missing:
             raise ValueError(f"Parents must be added first: {missing}")
         self.nodes[node.name] = node
+        self._invalidate()
+
+    def compile(self) -> None:
+        """Compile every tabular CPT and drop derived engine state.
+
+        Parametric nodes are only tabulated on demand (:meth:`compiled_tables`).
+        """
+        for node in self.nodes.values():
+            if isinstance(node, BinaryNode):
+                node.compile()
+        self._invalidate()
+        self._compiled = True
+
+    def compiled_tables(self) -> dict[str, np.ndarray]:
+        """Dense P(True) table of every node, expanding parametric ones."""
+        self._ensure_compiled()
+        return {
+            name: node.table
+            if isinstance(node, BinaryNode) and node.table is not None
+            else node.compile()
+            for name, node in self.nodes.items()
+        }
+
+    def engine_inputs(
+        self,
+        inference: str | None = None,
+        names: Mapping[str, tuple[str, ...]] | None = None,
+        placeholders: frozenset[str] = frozenset(),
+    ) -> tuple[dict[str, tuple[str, ...]], dict[str, np.ndarray | ParametricNode]]:
+        """The ``(parents, tables)`` an engine of kind ``inference`` runs over.
+
+        Enumeration keeps parametric nodes as they are; elimination engines
+        get each node's :meth:`~BinaryNode.decompose` chain, whose auxiliary
+        variables (``"<name>#<i>"``) are summed out like any hidden node.
+        ``names`` restricts the graph to a pruned sub-network in which the
+        ``placeholders`` are roots with a constant CPT.
+        """
+        self._ensure_compiled()
+        inference = self.inference if inference is None else inference
+        parents: dict[str, tuple[str, ...]] = {}
+        tables: dict[str, np.ndarray | ParametricNode] = {}
+        for name, node in self.nodes.items():
+            if names is not None and name not in names:
+                continue
+            if name in placeholders:
+                parents[name], tables[name] = (), _PLACEHOLDER
+            elif inference == "enumerate":
+                parents[name] = node.parents
+                if isinstance(node, ParametricNode):
+                    tables[name] = node
+                else:
+                    tables[name] = node.table if node.table is not None else node.compile()
+            else:
+                for part, part_parents, table in node.decompose():
+                    parents[part], tables[part] = part_parents, table
+        return parents, tables
+
+    @property
+    def parents(self) -> dict[str, tuple[str, ...]]:
+        return {name: node.parents for name, node in self.nodes.items()}
+
+    def compile_junction_tree(
+        self, structure: JunctionTreeStructure | None = None
+    ) -> InferenceEngine:
+        """Build the clique tree once and answer later queries from it.
+
+        Pass a ``structure`` compiled from another network with the same
+        graph to share the triangulation (one tree per phi value).
+        """
+        self.inference = "junction_tree"
+        engine = make_engine(self.inference, *self.engine_inputs(), structure)
+        self._engine_cache = (self.inference, engine)
+        self._pruned.clear()
+        return engine
 
     def query(self, target: str, evidence: Mapping[str, bool]) -> float:
         if target not in self.nodes:
             raise KeyError(target)
-        numerator = self._enumerate({**evidence, target: True})
-        denominator = numerator + self._enumerate({**evidence, target: False})
-        return 0.5 if denominator == 0 else numerator / denominator
+        evidence = observed(evidence, self.nodes, exclude=target)
+        return float(conditional(*self._pruned_engine(target, evidence).split(target, evidence)))
+
+    def query_many(
+        self, target: str, evidence: np.ndarray, variables: Sequence[str]
+    ) -> np.ndarray:
+        """P(target=True | row) for every row of a boolean evidence matrix.
+
+        ``evidence`` has shape ``(n_rows, len(variables))``. Inference runs
+        once per *distinct* row and the answers are scattered back, so a
+        column of a few distinct values costs a few queries, not ``n_rows``.
+        """
+        if target not in self.nodes:
+            raise KeyError(target)
+        return query_distinct_rows(lambda row: self.query(target, row), evidence, variables)
 
     def probability_of(self, evidence: Mapping[str, bool]) -> float:
-        """Exact joint probability P(evidence) by enumeration."""
-        return self._enumerate(dict(evidence)) if evidence else 1.0
-
-    def _enumerate(self, fixed: Mapping[str, bool]) -> float:
-        names = list(self.nodes)
-        unknown = [name for name in names if name not in fixed]
-        total = 0.0
-        for values in product([False, True], repeat=len(unknown)):
-            assignment = dict(fixed)
-            assignment.update(dict(zip(unknown, values, strict=True)))
-            joint = 1.0
-            for name in names:
-                joint *= self.nodes[name].probability(assignment[name], assignment)
-            total += joint
-        return total
+        """Exact joint probability P(evidence)."""
+        if not evidence:
+            return 1.0
+        evidence = observed(evidence, self.nodes)
+        return float(self._pruned_engine(None, evidence).evidence_mass(evidence))
+
+    def joint(self, assignment: Mapping[str, np.ndarray | bool]) -> np.ndarray:
+        """P(assignment) for a block of full assignments, one column per node.
+
+        Each value is a bool scalar or a bool array; arrays broadcast against
+        each other, so a whole block of assignments is one product of
+        table lookups rather than a Python loop per assignment.
+        """
+        return Enumerator(*self.engine_inputs("enumerate")).joint(assignment)
+
+    def _ensure_compiled(self) -> None:
+        if not self._compiled:
+            self.compile()
+
+    def _invalidate(self) -> None:
+        self.version += 1
+        self._engine_cache = None
+        self._pruned.clear()
+        self._compiled = False
+
+    def _engine(self) -> InferenceEngine:
+        if self._engine_cache is None or self._engine_cache[0] != self.inference:
+            engine = make_engine(self.inference, *self.engine_inputs())
+            self._engine_cache = (self.inference, engine)
+        return self._engine_cache[1]
+
+    def _pruned_engine(self, target: str | None, evidence: Mapping[str, bool]) -> InferenceEngine:
+        # ``target=None`` asks for P(evidence): only barren nodes may go.
+        key = (self.inference, target, frozenset(evidence))
+        engine = self._pruned.get(key)
+        if engine is None and self.inference == "junction_tree":
+            engine = self._pruned[key] = self._engine()
+        if engine is None:
+            from obiai.bayesian.pruning import barren_pruned, relevant_subnetwork
+
+            placeholders: frozenset[str]
+            if target is None:
+                parents, placeholders = barren_pruned(self.parents, None, evidence), frozenset()
+            else:
+                parents, placeholders = relevant_subnetwork(self.parents, target, evidence)
+            if len(parents) == len(self.nodes) and not placeholders:
+                engine = self._engine()
+            else:
+                engine = make_engine(
+                    self.inference, *self.engine_inputs(names=parents, placeholders=placeholders)
+                )
+            self._pruned[key] = engine
+        return engine
@@ -1,4 +1,28 @@
-from obiai.bayes import BayesianNetwork, BinaryNode
-from obiai.bayesian.marginal import PhiMarginalizedNetwork
+from obiai.bayes import (
+    BayesianNetwork,
+    BinaryNode,
+    LogisticNode,
+    NoisyAndNode,
+    NoisyOrNode,
+    ParametricNode,
+)
+from obiai.bayesian.grid import GridPhiMarginalizedNetwork, GridQueryResult, PhiGrid
+from obiai.bayesian.learning import SufficientStatistics, fit_cpts
+from obiai.bayesian.marginal import PhiMarginalizedNetwork, PhiPosteriorState, PhiQueryResult
 
-__all__ = ["BayesianNetwork", "BinaryNode", "PhiMarginalizedNetwork"]
+__all__ = [
+    "BayesianNetwork",
+    "BinaryNode",
+    "GridPhiMarginalizedNetwork",
+    "GridQueryResult",
+    "LogisticNode",
+    "NoisyAndNode",
+    "NoisyOrNode",
+    "ParametricNode",
+    "PhiGrid",
+    "PhiMarginalizedNetwork",
+    "PhiPosteriorState",
+    "PhiQueryResult",
+    "SufficientStatistics",
+    "fit_cpts",
+]
@@ -0,0 +1,80 @@
+"""Dense factors over binary variables, the currency of exact inference.
+
+A :class:`Factor` is a non-negative table ``phi(X_1, ..., X_k)`` stored as a
+NumPy array of shape ``(2,) * k``; axis ``i`` belongs to ``variables[i]`` and
+index 0/1 means False/True. Variable elimination and the junction tree both
+reduce to three operations on these tables: multiply, sum out, and reduce by
+evidence.
+
+The variable axes are always the *trailing* ones. Any leading axes are a
+batch (e.g. one slice per phi value of a phi-marginalized network) that every
+operation carries through, so a whole family of networks with the same
+structure is eliminated in one pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+__all__ = ["Factor", "cpt_factor", "multiply_all"]
+
+
+@dataclass(frozen=True, slots=True)
+class Factor:
+    variables: tuple[str, ...]
+    values: np.ndarray
+
+    def multiply(self, other: Factor) -> Factor:
+        known = set(self.variables)
+        variables = self.variables + tuple(v for v in other.variables if v not in known)
+        return Factor(variables, self._aligned(variables) * other._aligned(variables))
+
+    def sum_out(self, variable: str) -> Factor:
+        position = self.variables.index(variable)
+        return Factor(
+            self.variables[:position] + self.variables[position + 1 :],
+            self.values.sum(axis=position - len(self.variables)),
+        )
+
+    def reduce(self, evidence: Mapping[str, bool]) -> Factor:
+        """Fix the observed variables, dropping their axes."""
+        if not any(variable in evidence for variable in self.variables):
+            return self
+        index = tuple(
+            int(bool(evidence[v])) if v in evidence else slice(None) for v in self.variables
+        )
+        return Factor(
+            tuple(v for v in self.variables if v not in evidence), self.values[(Ellipsis, *index)]
+        )
+
+    def total(self) -> np.ndarray:
+        """Sum over every variable, keeping the batch axes."""
+        batch = self.values.shape[: self.values.ndim - len(self.variables)]
+        return self.values.reshape((*batch, -1)).sum(axis=-1)
+
+    def _aligned(self, variables: tuple[str, ...]) -> np.ndarray:
+        # Broadcastable view of this factor's table in the axis order of
+        # ``variables``; variables this factor does not mention get size 1.
+        position = {v: i for i, v in enumerate(variables)}
+        n_batch = self.values.ndim - len(self.variables)
+        order = sorted(range(len(self.variables)), key=lambda i: position[self.variables[i]])
+        values = np.transpose(self.values, [*range(n_batch), *(n_batch + i for i in order)])
+        mine = set(self.variables)
+        return values.reshape(
+            (*self.values.shape[:n_batch], *(2 if v in mine else 1 for v in variables))
+        )
+
+
+def multiply_all(factors: Iterable[Factor]) -> Factor:
+    result = Factor((), np.array(1.0))
+    for factor in factors:
+        result = result.multiply(factor)
+    return result
+
+
+def cpt_factor(name: str, parents: tuple[str, ...], table: np.ndarray) -> Factor:
+    """P(name | parents) as a factor over ``(*parents, name)`` from a compiled table."""
+    return Factor(parents + (name,), np.stack([1.0 - table, table], axis=-1))
@@ -0,0 +1,198 @@
+"""Phi-marginalization over a continuous parameter by grid or quadrature.
+
+:class:`~obiai.bayesian.PhiMarginalizedNetwork` mixes a handful of named,
+hand-built networks. When phi is continuous -- e.g. a sensor's true- and
+false-positive rates -- the marginal
+
+    P(theta | D) = integral P(theta | D, phi) P(D | phi) p(phi) d phi / P(D)
+
+is approximated by a weighted sum over nodes phi_i (a :class:`PhiGrid`): a
+uniform midpoint grid or Gauss-Legendre quadrature, optionally a tensor
+product of both across the components of phi.
+
+CPTs are given as vectorized functions of phi, so each node's table is built
+for every grid point in one call. The tables are stacked along a leading grid
+axis and a single engine pass evaluates the likelihood and the conditional at
+every point together.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from obiai.bayes import InferenceEngine, make_engine, query_distinct_rows
+from obiai.bayesian.marginal import mix_phi
+
+__all__ = ["GridPhiMarginalizedNetwork", "GridQueryResult", "PhiGrid"]
+
+_PRIOR_TOLERANCE = 1e-9
+
+# A node's CPT: P(node=True) indexed by (grid point, *parent bits), either as
+# a vectorized function of the grid points or a phi-independent table.
+GridCpt = Callable[[np.ndarray], np.ndarray] | float | np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class PhiGrid:
+    """Quadrature nodes over phi with their normalized prior weights."""
+
+    # Shape (n,) for scalar phi or (n, d) for a d-dimensional phi.
+    points: np.ndarray
+    # Shape (n,); prior mass of each node, summing to 1.
+    weights: np.ndarray
+
+    def __post_init__(self) -> None:
+        if self.points.shape[:1] != self.weights.shape or self.weights.ndim != 1:
+            raise ValueError(
+                f"points {self.points.shape} and weights {self.weights.shape} disagree"
+            )
+        if np.any(self.weights < 0.0):
+            raise ValueError("Grid weights must be non-negative")
+        total = float(self.weights.sum())
+        if abs(total - 1.0) > _PRIOR_TOLERANCE:
+            raise ValueError(f"Grid weights must sum to 1.0, got {total}")
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @classmethod
+    def uniform(
+        cls,
+        low: float,
+        high: float,
+        n: int,
+        density: Callable[[np.ndarray], np.ndarray] | None = None,
+    ) -> PhiGrid:
+        """Midpoints of ``n`` equal cells on ``[low, high]``, weighted by ``density``."""
+        width = (high - low) / n
+        points = low + width * (np.arange(n) + 0.5)
+        return cls._weighted(points, np.full(n, width), density)
+
+    @classmethod
+    def gauss_legendre(
+        cls,
+        low: float,
+        high: float,
+        n: int,
+        density: Callable[[np.ndarray], np.ndarray] | None = None,
+    ) -> PhiGrid:
+        """``n``-point Gauss-Legendre rule on ``[low, high]``, weighted by ``density``.
+
+        Exact for polynomial integrands up to degree ``2n - 1``, so smooth
+        likelihoods need far fewer nodes than a uniform grid.
+        """
+        nodes, weights = np.polynomial.legendre.leggauss(n)
+        half = (high - low) / 2.0
+        return cls._weighted(low + half * (nodes + 1.0), half * weights, density)
+
+    def product(self, other: PhiGrid) -> PhiGrid:
+        """Tensor-product grid: phi is the concatenation of both components."""
+        mine = self.points.reshape(len(self), -1)
+        theirs = other.points.reshape(len(other), -1)
+        points = np.concatenate(
+            [np.repeat(mine, len(other), axis=0), np.tile(theirs, (len(self), 1))], axis=1
+        )
+        return PhiGrid(points, np.outer(self.weights, other.weights).reshape(-1))
+
+    @classmethod
+    def _weighted(
+        cls,
+        points: np.ndarray,
+        rule: np.ndarray,
+        density: Callable[[np.ndarray], np.ndarray] | None,
+    ) -> PhiGrid:
+        mass = rule if density is None else rule * np.asarray(density(points), dtype=float)
+        total = mass.sum()
+        if not total > 0.0:
+            raise ValueError("The prior density has no mass on the grid")
+        return cls(points, mass / total)
+
+
+@dataclass(frozen=True, slots=True)
+class GridQueryResult:
+    """Marginal posterior plus its breakdown over the grid, from one pass."""
+
+    posterior: float
+    # P(target=True | evidence, phi_i) per grid point.
+    conditionals: np.ndarray
+    # P(phi_i | evidence).
+    phi_posterior: np.ndarray
+    # P(evidence | phi_i).
+    likelihood: np.ndarray
+
+
+class GridPhiMarginalizedNetwork:
+    """Binary network whose CPTs are functions of a continuous parameter phi."""
+
+    def __init__(
+        self,
+        parents: Mapping[str, tuple[str, ...]],
+        cpts: Mapping[str, GridCpt],
+        grid: PhiGrid,
+        inference: str = "ve",
+    ) -> None:
+        if set(parents) != set(cpts):
+            raise ValueError(
+                f"parents and cpts must name the same nodes; got {sorted(parents)} vs {sorted(cpts)}"
+            )
+        seen: set[str] = set()
+        for name, node_parents in parents.items():
+            missing = [parent for parent in node_parents if parent not in seen]
+            if missing:
+                raise ValueError(f"Parents must be added first: {missing}")
+            seen.add(name)
+
+        self.parents: dict[str, tuple[str, ...]] = {n: tuple(p) for n, p in parents.items()}
+        self.grid = grid
+        self.inference = inference
+        self.tables = {name: self._table(name, cpts[name]) for name in self.parents}
+        self._engine: InferenceEngine = make_engine(inference, self.parents, self.tables)
+
+    def query(self, target: str, evidence: Mapping[str, bool]) -> float:
+        """P(target=True | evidence), integrated over phi."""
+        return self.query_with_posterior(target, evidence).posterior
+
+    def query_with_posterior(self, target: str, evidence: Mapping[str, bool]) -> GridQueryResult:
+        """Marginal posterior with the per-point conditionals, P(phi | D) and P(D | phi)."""
+        if target not in self.parents:
+            raise KeyError(target)
+        posterior, conditionals, phi_posterior, likelihood = mix_phi(
+            self._engine, self.grid.weights, target, evidence, self.parents
+        )
+        return GridQueryResult(posterior, conditionals, phi_posterior, np.asarray(likelihood))
+
+    def query_many(
+        self, target: str, evidence: np.ndarray, variables: Sequence[str]
+    ) -> np.ndarray:
+        """Marginal posterior for every row of a boolean evidence matrix."""
+        return query_distinct_rows(lambda row: self.query(target, row), evidence, variables)
+
+    def phi_posterior(self, evidence: Mapping[str, bool]) -> np.ndarray:
+        """P(phi_i | evidence) for every grid point."""
+        if not any(name in self.parents for name in evidence):
+            return self.grid.weights.copy()
+        weights = self.grid.weights * self._engine.evidence_mass(evidence)
+        total = float(weights.sum())
+        if total == 0.0:
+            return self.grid.weights.copy()
+        return weights / total
+
+    def phi_mean(self, evidence: Mapping[str, bool]) -> np.ndarray:
+        """Posterior expectation E[phi | evidence]."""
+        return self.phi_posterior(evidence) @ self.grid.points
+
+    def _table(self, name: str, cpt: GridCpt) -> np.ndarray:
+        shape = (len(self.grid), *(2,) * len(self.parents[name]))
+        values = np.asarray(cpt(self.grid.points) if callable(cpt) else cpt, dtype=float)
+        try:
+            table = np.broadcast_to(values, shape)
+        except ValueError:
+            raise ValueError(
+                f"CPT for {name!r} has shape {values.shape}; expected one broadcastable to {shape}"
+            ) from None
+        if np.any((table < 0.0) | (table > 1.0)):
+            raise ValueError(f"CPT for {name!r} has probabilities outside [0, 1]")
+        return table
@@ -0,0 +1,208 @@
+"""Junction-tree (clique-tree) inference with reusable messages.
+
+Production traffic asks the same network structure many queries that differ
+only in their evidence. Compiling the network into a clique tree once lets
+each query be answered by Shafer-Shenoy message passing toward the clique
+holding the target, and every message is cached under the evidence that can
+influence it: the observed values of variables on the *sending* side of its
+edge. A new query recomputes only the messages whose subtree saw different
+evidence; everything else is a dictionary hit, so the per-query cost stops
+growing with the full model size.
+
+The tree shape depends only on the graph, never on the CPTs, so a
+:class:`JunctionTreeStructure` can be shared by every network with the same
+nodes and parents -- e.g. one tree per phi value in
+:class:`~obiai.bayesian.PhiMarginalizedNetwork`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from obiai.bayes import observed
+from obiai.bayesian.elimination import elimination_order
+from obiai.bayesian.factors import Factor, cpt_factor, multiply_all
+
+if TYPE_CHECKING:
+    from obiai.bayes import BayesianNetwork
+
+__all__ = ["JunctionTree", "JunctionTreeStructure"]
+
+DEFAULT_MESSAGE_CACHE_SIZE = 4096
+
+_EvidenceKey = tuple[tuple[str, bool], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class JunctionTreeStructure:
+    """Clique tree of a network's moral graph, independent of its CPTs."""
+
+    # (name, parents) for every node, in insertion order.
+    signature: tuple[tuple[str, tuple[str, ...]], ...]
+    cliques: tuple[tuple[str, ...], ...]
+    neighbours: tuple[tuple[int, ...], ...]
+    # Clique that receives each node's CPT factor.
+    home: dict[str, int]
+    # For the directed edge i -> j: every variable in a clique on i's side.
+    upstream: dict[tuple[int, int], frozenset[str]]
+
+    @classmethod
+    def from_network(cls, network: BayesianNetwork) -> JunctionTreeStructure:
+        return cls.from_parents(network.engine_inputs("junction_tree")[0])
+
+    @classmethod
+    def from_parents(cls, parents: Mapping[str, tuple[str, ...]]) -> JunctionTreeStructure:
+        signature = tuple((name, tuple(p)) for name, p in parents.items())
+        names = [name for name, _ in signature]
+        rank = {name: i for i, name in enumerate(names)}
+        families = [(name, *parents) for name, parents in signature]
+
+        # Triangulate the moral graph by eliminating along a min-fill order;
+        # the elimination cliques are the cliques of the chordal graph.
+        adjacency: dict[str, set[str]] = {name: set() for name in names}
+        for family in families:
+            for variable in family:
+                adjacency[variable].update(set(family) - {variable})
+        candidates: list[frozenset[str]] = []
+        for variable in elimination_order(families, names):
+            candidates.append(frozenset({variable} | adjacency[variable]))
+            for neighbour in adjacency[variable]:
+                adjacency[neighbour].update(adjacency[variable] - {neighbour})
+                adjacency[neighbour].discard(variable)
+            del adjacency[variable]
+        maximal: list[frozenset[str]] = []
+        for clique in sorted(candidates, key=len, reverse=True):
+            if not any(clique <= kept for kept in maximal):
+                maximal.append(clique)
+        cliques = tuple(tuple(sorted(c, key=rank.__getitem__)) for c in maximal)
+
+        # Maximum-weight spanning tree on separator size (Kruskal). Zero-weight
+        # edges join disconnected components into a single tree.
+        root = list(range(len(cliques)))
+
+        def find(i: int) -> int:
+            while root[i] != i:
+                root[i] = root[root[i]]
+                i = root[i]
+            return i
+
+        pairs = sorted(
+            (-len(maximal[i] & maximal[j]), i, j)
+            for i in range(len(cliques))
+            for j in range(i + 1, len(cliques))
+        )
+        links: list[set[int]] = [set() for _ in cliques]
+        for _, i, j in pairs:
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                root[ri] = rj
+                links[i].add(j)
+                links[j].add(i)
+        neighbours = tuple(tuple(sorted(link)) for link in links)
+
+        home = {
+            family[0]: min(
+                (i for i, clique in enumerate(maximal) if clique >= set(family)),
+                key=lambda i: len(maximal[i]),
+            )
+            for family in families
+        }
+
+        upstream: dict[tuple[int, int], frozenset[str]] = {}
+        for i, adjacent in enumerate(neighbours):
+            for j in adjacent:
+                seen, stack, scope = {j, i}, [i], set(maximal[i])
+                while stack:
+                    for k in neighbours[stack.pop()]:
+                        if k not in seen:
+                            seen.add(k)
+                            stack.append(k)
+                            scope |= maximal[k]
+                upstream[(i, j)] = frozenset(scope)
+
+        return cls(signature, cliques, neighbours, home, upstream)
+
+    def matches(self, parents: Mapping[str, tuple[str, ...]]) -> bool:
+        return self.signature == tuple((name, tuple(p)) for name, p in parents.items())
+
+    @property
+    def width(self) -> int:
+        return max((len(clique) for clique in self.cliques), default=1) - 1
+
+
+class JunctionTree:
+    """A :class:`JunctionTreeStructure` bound to compiled (possibly batched) CPTs."""
+
+    def __init__(
+        self,
+        parents: Mapping[str, tuple[str, ...]],
+        tables: Mapping[str, np.ndarray],
+        structure: JunctionTreeStructure | None = None,
+        max_cached_messages: int = DEFAULT_MESSAGE_CACHE_SIZE,
+    ) -> None:
+        if structure is None:
+            structure = JunctionTreeStructure.from_parents(parents)
+        elif not structure.matches(parents):
+            raise ValueError("Junction tree structure does not match the network's graph")
+        self.parents = dict(parents)
+        self.structure = structure
+        self.max_cached_messages = max_cached_messages
+
+        assigned: list[list[Factor]] = [[] for _ in structure.cliques]
+        for name, node_parents in self.parents.items():
+            assigned[structure.home[name]].append(cpt_factor(name, node_parents, tables[name]))
+        self._potentials = [
+            multiply_all([Factor(clique, np.ones((2,) * len(clique))), *factors])
+            for clique, factors in zip(structure.cliques, assigned, strict=True)
+        ]
+        self._messages: OrderedDict[tuple[int, int, _EvidenceKey], Factor] = OrderedDict()
+
+    def split(self, target: str, evidence: Mapping[str, bool]) -> tuple[np.ndarray, np.ndarray]:
+        evidence = observed(evidence, self.parents, exclude=target)
+        belief = self._belief(self.structure.home[target], evidence)
+        for variable in belief.variables:
+            if variable != target:
+                belief = belief.sum_out(variable)
+        return belief.values[..., 1], belief.values[..., 0]
+
+    def evidence_mass(self, evidence: Mapping[str, bool]) -> np.ndarray:
+        return self._belief(0, observed(evidence, self.parents)).total()
+
+    def _belief(self, clique: int, evidence: Mapping[str, bool]) -> Factor:
+        incoming = [
+            self._message(k, clique, evidence) for k in self.structure.neighbours[clique]
+        ]
+        return multiply_all([self._potentials[clique].reduce(evidence), *incoming])
+
+    def _message(self, source: int, sink: int, evidence: Mapping[str, bool]) -> Factor:
+        scope = self.structure.upstream[(source, sink)]
+        key = (source, sink, tuple(sorted((k, v) for k, v in evidence.items() if k in scope)))
+        cached = self._messages.get(key)
+        if cached is not None:
+            self._messages.move_to_end(key)
+            return cached
+
+        factor = multiply_all(
+            [
+                self._potentials[source].reduce(evidence),
+                *(
+                    self._message(k, source, evidence)
+                    for k in self.structure.neighbours[source]
+                    if k != sink
+                ),
+            ]
+        )
+        separator = set(self.structure.cliques[sink])
+        for variable in factor.variables:
+            if variable not in separator:
+                factor = factor.sum_out(variable)
+
+        self._messages[key] = factor
+        if len(self._messages) > self.max_cached_messages:
+            self._messages.popitem(last=False)
+        return factor
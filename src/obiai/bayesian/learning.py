@@ -0,0 +1,159 @@
+"""Maximum a posteriori CPT learning for binary networks of a fixed structure.
+
+Each CPT is estimated from counts with a symmetric Dirichlet(alpha) prior,
+
+    P(X=True | pa) = (n(X=True, pa) + alpha) / (n(pa) + 2 * alpha)
+
+(``alpha=1`` is Laplace smoothing). The counts for a node are one
+``np.bincount`` over its family's packed bits -- a vectorized group-by over
+every row at once -- and they are *sufficient statistics*: keeping them in a
+:class:`SufficientStatistics` lets new labelled observations be folded in
+without revisiting historic data.
+
+Data may be a mapping of column name to 1-D array, a 2-D array with
+``columns`` naming its columns, or any Arrow-style table exposing
+``column_names`` and ``column(name)`` (e.g. ``pyarrow.Table``; pyarrow itself
+is not required).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from obiai.bayes import BayesianNetwork, BinaryNode
+
+__all__ = ["SufficientStatistics", "fit_cpts"]
+
+
+def fit_cpts(
+    parents: Mapping[str, tuple[str, ...]],
+    data: Any,
+    *,
+    columns: Sequence[str] | None = None,
+    alpha: float = 1.0,
+    weights: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """Fit every CPT of ``parents`` from ``data``; returns compiled P(True) tables."""
+    stats = SufficientStatistics.empty(parents, alpha=alpha)
+    stats.update(data, columns=columns, weights=weights)
+    return stats.tables()
+
+
+@dataclass(slots=True)
+class SufficientStatistics:
+    """Per-node (weighted) counts of each family configuration."""
+
+    parents: dict[str, tuple[str, ...]]
+    # counts[name][*parent_bits, value]: shape (2,) * (len(parents) + 1).
+    counts: dict[str, np.ndarray] = field(default_factory=dict)
+    alpha: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.alpha < 0.0:
+            raise ValueError(f"alpha must be non-negative, got {self.alpha}")
+        self.parents = {name: tuple(p) for name, p in self.parents.items()}
+        for name, node_parents in self.parents.items():
+            self.counts.setdefault(name, np.zeros((2,) * (len(node_parents) + 1)))
+
+    @classmethod
+    def empty(
+        cls, parents: Mapping[str, tuple[str, ...]], alpha: float = 1.0
+    ) -> SufficientStatistics:
+        return cls(dict(parents), alpha=alpha)
+
+    def update(
+        self,
+        data: Any,
+        *,
+        columns: Sequence[str] | None = None,
+        weights: np.ndarray | None = None,
+    ) -> None:
+        """Add the counts of new rows; earlier rows are never revisited."""
+        table = _columns(data, columns)
+        for name, node_parents in self.parents.items():
+            family = (*node_parents, name)
+            missing = [variable for variable in family if variable not in table]
+            if missing:
+                raise KeyError(f"Data has no column for {missing}")
+            # First parent is the most significant bit, matching
+            # BinaryNode.compile; the node itself is the least significant.
+            code = np.zeros(len(table[name]), dtype=np.intp)
+            for variable in family:
+                code = (code << 1) | table[variable]
+            counts = np.bincount(code, weights=weights, minlength=1 << len(family))
+            self.counts[name] += counts.reshape((2,) * len(family))
+
+    def tables(self) -> dict[str, np.ndarray]:
+        """MAP P(node=True | parents) tables under the Dirichlet(alpha) prior."""
+        tables: dict[str, np.ndarray] = {}
+        for name, counts in self.counts.items():
+            total = counts.sum(axis=-1) + 2.0 * self.alpha
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Unseen parent configurations with alpha=0 fall back to 0.5.
+                tables[name] = np.where(total > 0, (counts[..., 1] + self.alpha) / total, 0.5)
+        return tables
+
+    def network(self, inference: str = "enumerate") -> BayesianNetwork:
+        """A fresh network with the current MAP CPTs."""
+        network = BayesianNetwork(inference=inference)
+        for name, table in self.tables().items():
+            network.add(BinaryNode(name, parents=self.parents[name], cpt=_cpt(table)))
+        return network
+
+    def apply(self, network: BayesianNetwork) -> None:
+        """Overwrite the CPTs of an existing network in place and recompile it.
+
+        A :class:`~obiai.bayesian.PhiMarginalizedNetwork` holding the network
+        picks up the new CPTs on its next query. Every target must be a
+        :class:`~obiai.bayes.BinaryNode` with the same parents; otherwise
+        ValueError is raised before any CPT is written.
+        """
+        targets: list[tuple[BinaryNode, np.ndarray]] = []
+        for name, table in self.tables().items():
+            node = network.nodes[name]
+            if not isinstance(node, BinaryNode):
+                raise ValueError(  # noqa: TRY004 - a bad target, like mismatched parents
+                    f"Node {name!r} must be a BinaryNode to take a learned CPT, "
+                    f"got {type(node).__name__}"
+                )
+            if node.parents != self.parents[name]:
+                raise ValueError(
+                    f"Node {name!r} has parents {node.parents}, statistics have {self.parents[name]}"
+                )
+            targets.append((node, table))
+        for node, table in targets:
+            node.cpt = _cpt(table)
+        network.compile()
+
+
+def _columns(data: Any, columns: Sequence[str] | None) -> dict[str, np.ndarray]:
+    if hasattr(data, "column_names") and hasattr(data, "column"):
+        names = list(data.column_names) if columns is None else list(columns)
+        return {name: _bits(np.asarray(data.column(name)), name) for name in names}
+    if isinstance(data, Mapping):
+        return {name: _bits(np.asarray(values), name) for name, values in data.items()}
+    rows = np.asarray(data)
+    if columns is None or rows.ndim != 2 or rows.shape[1] != len(columns):
+        raise ValueError(
+            "A 2-D array needs `columns` naming each of its columns; "
+            f"got shape {rows.shape} and columns {columns}"
+        )
+    return {name: _bits(rows[:, i], name) for i, name in enumerate(columns)}
+
+
+def _bits(values: np.ndarray, name: str) -> np.ndarray:
+    if values.ndim != 1:
+        raise ValueError(f"Column {name!r} must be one-dimensional, got shape {values.shape}")
+    if values.dtype != bool and not np.isin(values, (0, 1)).all():
+        raise ValueError(f"Column {name!r} must be binary")
+    return values.astype(np.intp)
+
+
+def _cpt(table: np.ndarray) -> dict[tuple[bool, ...], float]:
+    return {
+        tuple(bool(bit) for bit in index): float(table[index]) for index in np.ndindex(table.shape)
+    }
@@ -14,19 +14,154 @@ Each phi value carries its own :class:`~obiai.bayes.BayesianNetwork` (same
 structure, different CPTs — e.g. a well-calibrated vs. a miscalibrated
 sensor model), so the marginalization is exact, auditable, and requires no
 sampler.
+
+Because the phi networks share one graph, their CPT tables are stacked along
+a leading phi axis and run through a single inference engine: one pass yields
+P(theta | D, phi) and P(D | phi) for every phi at once
+(:meth:`PhiMarginalizedNetwork.query_with_posterior`).
+
+Across a session the phi belief accumulates: :class:`PhiPosteriorState`
+folds each observation's likelihood P(D_t | phi) into running log-weights, so
+P(phi | D_1..D_t) costs O(|phi|) per observation rather than a replay of the
+history.
 """
 
 from __future__ import annotations
 
-from typing import Mapping
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
 
-from obiai.bayes import BayesianNetwork
+from obiai.bayes import (
+    BayesianNetwork,
+    InferenceEngine,
+    ParametricNode,
+    conditional,
+    make_engine,
+    observed,
+    query_distinct_rows,
+)
+from obiai.bayesian.junction import JunctionTreeStructure
+from obiai.bayesian.pruning import barren_pruned
 
-__all__ = ["PhiMarginalizedNetwork"]
+__all__ = ["PhiMarginalizedNetwork", "PhiPosteriorState", "PhiQueryResult"]
 
 _PRIOR_TOLERANCE = 1e-9
 
 
+@dataclass(frozen=True, slots=True)
+class PhiQueryResult:
+    """Marginal posterior plus its per-phi breakdown, from one inference pass."""
+
+    posterior: float
+    # P(target=True | evidence, phi) for every phi value.
+    conditionals: dict[str, float]
+    # P(phi | evidence).
+    phi_posterior: dict[str, float]
+    # P(evidence | phi), to fold into a PhiPosteriorState.
+    likelihood: dict[str, float]
+
+
+@dataclass(slots=True)
+class PhiPosteriorState:
+    """Streaming P(phi | D_1..D_t), held as normalized log-weights."""
+
+    phi: tuple[str, ...]
+    log_weights: np.ndarray
+    observations: int = 0
+
+    @classmethod
+    def from_prior(cls, prior: Mapping[str, float]) -> PhiPosteriorState:
+        return cls(tuple(prior), np.log(np.array(list(prior.values()), dtype=float)))
+
+    def update(self, likelihood: Mapping[str, float]) -> None:
+        """Fold in one observation's P(D_t | phi); O(|phi|) whatever t is."""
+        with np.errstate(divide="ignore"):
+            log_weights = self.log_weights + np.log([likelihood[phi] for phi in self.phi])
+        peak = log_weights.max()
+        if not np.isfinite(peak):
+            # Evidence impossible under every phi; keep the current belief.
+            return
+        # Renormalize (log-sum-exp) so long sessions never underflow.
+        self.log_weights = log_weights - (peak + np.log(np.exp(log_weights - peak).sum()))
+        self.observations += 1
+
+    def posterior(self) -> dict[str, float]:
+        return dict(zip(self.phi, np.exp(self.log_weights).tolist(), strict=True))
+
+    def copy(self) -> PhiPosteriorState:
+        return PhiPosteriorState(self.phi, self.log_weights.copy(), self.observations)
+
+    def snapshot(self) -> dict[str, object]:
+        """JSON-safe form for persistence; see :meth:`restore`."""
+        return {
+            "phi": list(self.phi),
+            "log_weights": self.log_weights.tolist(),
+            "observations": self.observations,
+        }
+
+    @classmethod
+    def restore(cls, snapshot: Mapping[str, object]) -> PhiPosteriorState:
+        return cls(
+            tuple(snapshot["phi"]),  # type: ignore[arg-type]
+            np.array(snapshot["log_weights"], dtype=float),
+            int(snapshot["observations"]),  # type: ignore[call-overload]
+        )
+
+
+def mix_phi(
+    engine: InferenceEngine,
+    prior: np.ndarray,
+    target: str,
+    evidence: Mapping[str, bool],
+    variables: Mapping[str, object],
+) -> tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+    """Mix one split of an engine batched along a leading phi axis.
+
+    Returns the marginal P(target=True | evidence), the per-phi conditionals,
+    P(phi | evidence) and the likelihood P(evidence | phi). A single split on
+    ``target`` gives P(target, D | phi) for both target values; their ratio is
+    the per-phi conditional and their sum (or the observed half, when
+    ``target`` is itself in the evidence) is the likelihood.
+    """
+    true_mass, false_mass = engine.split(target, evidence)
+    conditionals = conditional(true_mass, false_mass)
+    known = observed(evidence, variables)
+    if not known:
+        likelihood = np.ones_like(prior)
+    elif target in known:
+        likelihood = true_mass if known[target] else false_mass
+    else:
+        likelihood = true_mass + false_mass
+
+    weights = prior * likelihood
+    total = float(weights.sum())
+    if total == 0.0:
+        # Evidence impossible under every phi; fall back to ignorance.
+        return 0.5, conditionals, prior.copy(), likelihood
+    return float((weights * conditionals).sum()) / total, conditionals, weights / total, likelihood
+
+
+def _dense(table: np.ndarray | ParametricNode) -> np.ndarray:
+    # Parametric nodes (enumeration only) cannot be stacked as they are.
+    return table if isinstance(table, np.ndarray) else table.compile()
+
+
+class _PerPhiEngine:
+    """Fallback for phi networks whose graphs differ: one engine per phi."""
+
+    def __init__(self, networks: Sequence[BayesianNetwork]) -> None:
+        self.networks = list(networks)
+
+    def split(self, target: str, evidence: Mapping[str, bool]) -> tuple[np.ndarray, np.ndarray]:
+        masses = [network._engine().split(target, evidence) for network in self.networks]
+        return np.array([t for t, _ in masses]), np.array([f for _, f in masses])
+
+    def evidence_mass(self, evidence: Mapping[str, bool]) -> np.ndarray:
+        return np.array([network._engine().evidence_mass(evidence) for network in self.networks])
+
+
 class PhiMarginalizedNetwork:
     """Mixture of exact Bayesian networks indexed by a discrete bias parameter phi."""
 
@@ -50,31 +185,141 @@ class PhiMarginalizedNetwork:
 
         self.phi_prior: dict[str, float] = dict(phi_prior)
         self.networks: dict[str, BayesianNetwork] = dict(networks)
+        self._prior = np.array(list(self.phi_prior.values()))
+        self._structure: JunctionTreeStructure | None = None
+        self._reset()
+
+    def compile(self) -> None:
+        """Recompile every phi network and restack their tables.
+
+        Call after editing a phi network's CPTs in place; changes made
+        through a network's own ``add`` or ``compile`` are picked up
+        automatically.
+        """
+        for network in self.networks.values():
+            network.compile()
+        self._reset()
+
+    def compile_junction_trees(self) -> JunctionTreeStructure:
+        """Compile one junction tree per phi value over a single shared structure.
+
+        The phi networks differ only in their CPTs, so the triangulation is
+        computed once; each network then answers its queries by message
+        passing. Raises ``ValueError`` if the networks' graphs differ.
+        """
+        networks = iter(self.networks.values())
+        structure = JunctionTreeStructure.from_network(next(networks))
+        for network in self.networks.values():
+            network.compile_junction_tree(structure)
+        self._structure = structure
+        self._reset()
+        return structure
 
     def query(self, target: str, evidence: Mapping[str, bool]) -> float:
         """P(target=True | evidence), marginalized over phi."""
-        weights = self._evidence_weights(evidence)
-        total = sum(weights.values())
-        if total == 0.0:
-            # Evidence impossible under every phi; fall back to ignorance.
-            return 0.5
-        posterior = sum(
-            weights[phi] * self.networks[phi].query(target, evidence)
-            for phi in weights
+        return self.query_with_posterior(target, evidence).posterior
+
+    def query_with_posterior(
+        self,
+        target: str,
+        evidence: Mapping[str, bool],
+        prior: Mapping[str, float] | None = None,
+    ) -> PhiQueryResult:
+        """Marginal posterior, per-phi conditionals and P(phi | evidence) at once.
+
+        One split of the stacked engine yields all three (see :func:`mix_phi`).
+        ``prior`` replaces ``phi_prior`` for this query, e.g. with the belief
+        a :class:`PhiPosteriorState` has accumulated over a session.
+        """
+        if any(target not in network.nodes for network in self.networks.values()):
+            raise KeyError(target)
+        base = self._prior if prior is None else np.array([prior[phi] for phi in self.phi_prior])
+        posterior, conditionals, phi_posterior, likelihood = mix_phi(
+            self._engine_for(target, evidence), base, target, evidence, self._variables()
+        )
+        return PhiQueryResult(
+            posterior=posterior,
+            conditionals=dict(zip(self.phi_prior, conditionals.tolist(), strict=True)),
+            phi_posterior=dict(zip(self.phi_prior, phi_posterior.tolist(), strict=True)),
+            likelihood=dict(zip(self.phi_prior, likelihood.tolist(), strict=True)),
         )
-        return posterior / total
+
+    def query_many(
+        self, target: str, evidence: np.ndarray, variables: Sequence[str]
+    ) -> np.ndarray:
+        """Marginal posterior for every row of a boolean evidence matrix.
+
+        See :meth:`BayesianNetwork.query_many`: identical rows share one
+        inference pass.
+        """
+        return query_distinct_rows(lambda row: self.query(target, row), evidence, variables)
 
     def phi_posterior(self, evidence: Mapping[str, bool]) -> dict[str, float]:
         """P(phi | evidence) — surfaced in decision explanations for auditability."""
-        weights = self._evidence_weights(evidence)
-        total = sum(weights.values())
+        if not observed(evidence, self._variables()):
+            return dict(self.phi_prior)
+        # P(D | phi) * P(phi), the unnormalized posterior over phi.
+        weights = self._prior * self._engine_for(None, evidence).evidence_mass(evidence)
+        total = float(weights.sum())
         if total == 0.0:
             return dict(self.phi_prior)
-        return {phi: weight / total for phi, weight in weights.items()}
+        return dict(zip(self.phi_prior, (weights / total).tolist(), strict=True))
 
-    def _evidence_weights(self, evidence: Mapping[str, bool]) -> dict[str, float]:
-        # P(D | phi) * P(phi), the unnormalized posterior over phi.
-        return {
-            phi: self.phi_prior[phi] * self.networks[phi].probability_of(evidence)
-            for phi in self.phi_prior
-        }
+    def _variables(self) -> dict[str, object]:
+        variables: dict[str, object] = {}
+        for network in self.networks.values():
+            variables.update(network.nodes)
+        return variables
+
+    def _reset(self) -> None:
+        self._versions = tuple(network.version for network in self.networks.values())
+        self._stacked: InferenceEngine | None = None
+        self._stacked_parents: dict[str, tuple[str, ...]] = {}
+        self._stacked_tables: dict[str, np.ndarray] | None = None
+        self._pruned: dict[tuple[str | None, frozenset[str]], InferenceEngine] = {}
+
+    def _engine(self) -> InferenceEngine:
+        # One engine over every phi network's tables, stacked along a leading
+        # axis in ``phi_prior`` order, rebuilt once any of them has changed.
+        if self._versions != tuple(network.version for network in self.networks.values()):
+            self._reset()
+        if self._stacked is None:
+            networks = [self.networks[phi] for phi in self.phi_prior]
+            inference = networks[0].inference
+            inputs = [network.engine_inputs(inference) for network in networks]
+            parents = inputs[0][0]
+            if self._structure is not None and not self._structure.matches(parents):
+                self._structure = None
+            if all(other == parents for other, _ in inputs):
+                self._stacked_parents = parents
+                self._stacked_tables = {
+                    name: np.stack([_dense(tables[name]) for _, tables in inputs])
+                    for name in parents
+                }
+                self._stacked = make_engine(
+                    inference, parents, self._stacked_tables, self._structure
+                )
+            else:
+                self._stacked = _PerPhiEngine(networks)
+        return self._stacked
+
+    def _engine_for(self, target: str | None, evidence: Mapping[str, bool]) -> InferenceEngine:
+        # Barren pruning only: the likelihoods P(D | phi) must stay exact, and
+        # dropping d-separated factors would rescale each phi differently.
+        # Junction trees are never pruned, so every query shares the one
+        # stacked tree (and its structure and message cache).
+        engine = self._engine()
+        first = self.networks[next(iter(self.phi_prior))]
+        if self._stacked_tables is None or first.inference == "junction_tree":
+            return engine
+        key = (target, frozenset(observed(evidence, first.nodes)))
+        pruned = self._pruned.get(key)
+        if pruned is None:
+            parents = barren_pruned(self._stacked_parents, target, key[1])
+            if len(parents) == len(self._stacked_parents):
+                pruned = engine
+            else:
+                tables = self._stacked_tables
+                pruned = make_engine(first.inference, parents, {n: tables[n] for n in parents})
+            self._pruned[key] = pruned
+        return pruned
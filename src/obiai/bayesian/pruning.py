@@ -0,0 +1,96 @@
+"""Evidence-aware pruning of a network before inference.
+
+Ontology-derived networks are large, but a single query usually touches a
+small corner of them. Two classic reductions shrink the network an engine has
+to run over without changing the answer:
+
+* **Barren nodes.** A node that is neither the target, observed, nor an
+  ancestor of either sums out to 1 and can be deleted. This preserves every
+  joint mass exactly, so it is also safe for ``P(evidence)`` and for phi
+  likelihoods.
+* **d-separation.** In the moral graph of the remaining (ancestral) network,
+  delete the observed nodes; anything no longer connected to the target is
+  d-separated from it given the evidence. Its factors only scale the masses
+  by a constant, so the *conditional* P(target | evidence) is unchanged.
+  Observed nodes bordering the target's component stay. Their CPTs may
+  mention pruned variables, so they are kept either as roots (when the CPT
+  is a constant given the evidence) or with their observed parents as roots.
+
+Both depend only on the target and the *set* of observed variables, never on
+their values, so callers cache the pruned network per that signature.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+__all__ = ["ancestral_set", "barren_pruned", "relevant_subnetwork"]
+
+
+def ancestral_set(parents: Mapping[str, tuple[str, ...]], nodes: Iterable[str]) -> set[str]:
+    """``nodes`` together with all of their ancestors."""
+    closure: set[str] = set()
+    stack = [node for node in nodes if node in parents]
+    while stack:
+        node = stack.pop()
+        if node not in closure:
+            closure.add(node)
+            stack.extend(parents[node])
+    return closure
+
+
+def barren_pruned(
+    parents: Mapping[str, tuple[str, ...]], target: str | None, evidence: Iterable[str]
+) -> dict[str, tuple[str, ...]]:
+    """The ancestral sub-network of ``target`` and ``evidence``, in the original order."""
+    keep = ancestral_set(parents, [*([] if target is None else [target]), *evidence])
+    return {name: node_parents for name, node_parents in parents.items() if name in keep}
+
+
+def relevant_subnetwork(
+    parents: Mapping[str, tuple[str, ...]], target: str, evidence: Iterable[str]
+) -> tuple[dict[str, tuple[str, ...]], frozenset[str]]:
+    """Sub-network sufficient for P(target | evidence) and its placeholder roots.
+
+    Returns the pruned ``parents`` mapping (original order) and the observed
+    nodes that must be given a constant placeholder CPT instead of their own:
+    they appear as roots in the returned mapping.
+    """
+    ancestral = barren_pruned(parents, target, evidence)
+    observed = {name for name in evidence if name in ancestral and name != target}
+
+    adjacency: dict[str, set[str]] = {name: set() for name in ancestral}
+    for name, node_parents in ancestral.items():
+        family = {name, *node_parents}
+        for variable in family:
+            adjacency[variable].update(family - {variable})
+
+    component = {target}
+    stack = [target]
+    while stack:
+        for neighbour in adjacency[stack.pop()]:
+            if neighbour not in component and neighbour not in observed:
+                component.add(neighbour)
+                stack.append(neighbour)
+    relevant = component | {name for name in observed if adjacency[name] & component}
+
+    needed = set(relevant)
+    placeholders: set[str] = set()
+    for name in relevant & observed:
+        outside = [parent for parent in ancestral[name] if parent not in relevant]
+        if any(parent not in observed for parent in outside):
+            # A hidden parent outside the component means (by moralization)
+            # no hidden parent inside it: the CPT is constant given the
+            # evidence and only rescales the masses.
+            placeholders.add(name)
+        else:
+            needed.update(outside)
+            placeholders.update(outside)
+    return (
+        {
+            name: () if name in placeholders else node_parents
+            for name, node_parents in ancestral.items()
+            if name in needed
+        },
+        frozenset(placeholders),
+    )
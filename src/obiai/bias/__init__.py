@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+from ..ontology import Ontology
+from ..types import BiasReport
+
+# Decayed weights grow by 2 ** (1 / half_life) per decision; rescale them all
+# before they can overflow a float.
+_RENORMALIZE_ABOVE = 1e100
+# A group whose decayed weight is below this fraction of one fresh decision's
+# (about 30 half-lives without a decision) has gone quiet and is dropped, as
+# the window variant drops groups with no decision left in the window.
+_FORGET_BELOW = 1e-9
+
+
+class BiasAuditor:
+    def __init__(self, protected_attributes: Iterable[str], max_gap: float = 0.10) -> None:
+        self.protected_attributes = set(protected_attributes)
+        self.max_gap = max_gap
+
+    def audit_paths(self, ontology: Ontology, decision_node: str) -> BiasReport:
+        # The ontology's reachability index settles the common "no path" case
+        # in O(1); paths are enumerated only for attributes that reach the node.
+        paths: list[list[str]] = []
+        for attribute in sorted(self.protected_attributes):
+            if ontology.reaches(attribute, decision_node):
+                paths.extend(ontology.paths(attribute, decision_node))
+        notes = []
+        if paths:
+            notes.append("Protected attribute has a semantic path to the decision node; review causality.")
+        return BiasReport(protected_paths=paths, passed=not paths, notes=notes)
+
+    def demographic_parity(self, positive_rates: dict[str, float]) -> BiasReport:
+        return _parity_report(positive_rates, self.max_gap)
+
+
+class ParityMonitor:
+    """Running per-group positive rates over a stream of decisions.
+
+    By default every decision counts equally. ``half_life`` (in decisions)
+    weighs each decision by 2 ** (-age / half_life) instead, and ``window``
+    keeps only the most recent decisions. Recording is O(1) amortized and a
+    report is O(groups) in every variant. Both variants forget groups with no
+    recent decisions: a window keeps groups seen inside it, and decay drops a
+    group about 30 half-lives after its last decision.
+    """
+
+    def __init__(
+        self,
+        max_gap: float = 0.10,
+        *,
+        half_life: float | None = None,
+        window: int | None = None,
+    ) -> None:
+        if half_life is not None and window is not None:
+            raise ValueError("Choose either half_life or window, not both")
+        if half_life is not None and half_life <= 0.0:
+            raise ValueError(f"half_life must be positive, got {half_life}")
+        if window is not None and window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.max_gap = max_gap
+        self.half_life = half_life
+        self.window = window
+        self._positives: dict[str, float] = {}
+        self._totals: dict[str, float] = {}
+        self._recent: deque[tuple[str, bool]] = deque()
+        # Decay is applied by giving each new decision a growing weight; only
+        # ratios within a group are reported, so older weights never need
+        # touching until the growing weight is renormalized.
+        self._growth = 1.0 if half_life is None else 2.0 ** (1.0 / half_life)
+        self._weight = 1.0
+
+    def record(self, group: str, positive: bool) -> None:
+        self._weight *= self._growth
+        if self._weight > _RENORMALIZE_ABOVE:
+            for counts in (self._positives, self._totals):
+                for name in counts:
+                    counts[name] /= self._weight
+            self._weight = 1.0
+            for name in [name for name, total in self._totals.items() if total < _FORGET_BELOW]:
+                del self._totals[name], self._positives[name]
+        self._add(group, positive, self._weight)
+        if self.window is not None:
+            self._recent.append((group, positive))
+            if len(self._recent) > self.window:
+                expired, was_positive = self._recent.popleft()
+                self._add(expired, was_positive, -1.0)
+                if self._totals[expired] <= 0.0:
+                    del self._totals[expired], self._positives[expired]
+
+    def _add(self, group: str, positive: bool, weight: float) -> None:
+        self._totals[group] = self._totals.get(group, 0.0) + weight
+        self._positives[group] = self._positives.get(group, 0.0) + (weight if positive else 0.0)
+
+    def positive_rates(self) -> dict[str, float]:
+        floor = _FORGET_BELOW * self._weight
+        return {
+            group: self._positives[group] / total
+            for group, total in self._totals.items()
+            if total >= floor
+        }
+
+    def report(self) -> BiasReport:
+        return _parity_report(self.positive_rates(), self.max_gap)
+
+
+def _parity_report(positive_rates: dict[str, float], max_gap: float) -> BiasReport:
+    if len(positive_rates) < 2:
+        return BiasReport(notes=["At least two groups are required for parity measurement."])
+    gap = max(positive_rates.values()) - min(positive_rates.values())
+    return BiasReport(
+        parity_gap=gap,
+        passed=gap <= max_gap,
+        notes=[f"Maximum permitted demographic-parity gap: {max_gap:.3f}"],
+    )
@@ -43,6 +43,11 @@ class BiasSettings(BaseModel):
         default_factory=lambda: ["age_group", "disability", "ethnicity", "gender"]
     )
     maximum_demographic_parity_gap: float = Field(default=0.10, ge=0.0, le=1.0)
+    # Live parity monitoring over all decisions by default; set one of these
+    # to weigh recent decisions (half-life, in decisions) or keep only the
+    # most recent ones.
+    parity_half_life: float | None = Field(default=None, gt=0.0)
+    parity_window: int | None = Field(default=None, ge=1)
 
 
 class ModulesSettings(BaseModel):
@@ -67,6 +72,9 @@ class PhiSettings(BaseModel):
     prior: dict[str, float] = Field(
         default_factory=lambda: {"calibrated": 0.9, "miscalibrated": 0.1}
     )
+    # Carry P(phi | observations so far) across a session instead of
+    # restarting every observation from ``prior``.
+    sequential: bool = True
 
 
 class EpistemicSettings(BaseModel):
@@ -74,6 +82,13 @@ class EpistemicSettings(BaseModel):
     beta: float = 0.4
     filter_threshold: float = 2.0
     flash_threshold: float = 0.25
+    # "dag" relaxes edges in one topological sweep instead of Dijkstra's heap;
+    # "astar" is goal-directed by landmark lower bounds.
+    algorithm: Literal["dijkstra", "dag", "astar"] = "dijkstra"
+    # Grow one semantic DAG per session instead of traversing each chain in
+    # isolation, bounded by evicting the least recently seen observations.
+    session_graph: bool = False
+    session_max_nodes: int = Field(default=512, ge=3)
 
 
 class VisionSettings(BaseModel):
@@ -82,6 +82,9 @@ class ObservationIn(BaseModel):
     value: bool | int | float | str
     confidence: float = Field(ge=0.0, le=1.0)
     source: str
+    # Demographic label for parity monitoring only; to_observation drops it,
+    # so it never reaches the reasoning engine.
+    group: str | None = Field(default=None, min_length=1, max_length=MAX_SCALAR_TEXT)
 
     @field_validator("value")
     @classmethod
@@ -8,7 +8,7 @@ but intentionally have no implementation yet (deferred phase).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, AsyncIterator, Mapping, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, AsyncIterator, Mapping, Protocol, Sequence, runtime_checkable
 
 from obiai.core.models import (
     Action,
@@ -48,6 +48,11 @@ class BayesianReasoner(Protocol):
 
 @runtime_checkable
 class OntologyMapperProtocol(Protocol):
+    @property
+    def known_propositions(self) -> Sequence[str]:
+        """Every proposition ``map`` can produce, for precomputing bias audits."""
+        ...
+
     def map(self, observation: Observation) -> MappedEvidence: ...
 
 
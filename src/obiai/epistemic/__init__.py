@@ -1,16 +1,26 @@
+from obiai.epistemic.arrays import ArrayEpistemicDAG
 from obiai.epistemic.builder import (
     FlashEvent,
+    SemanticChainCache,
     SemanticPathResult,
     build_semantic_dag,
+    k_best_semantic_paths,
     traverse_semantic_path,
+    traverse_semantic_paths,
 )
 from obiai.epistemic.dag import EpistemicDAG, SemanticBeliefNode
+from obiai.epistemic.session import SessionSemanticGraph
 
 __all__ = [
+    "ArrayEpistemicDAG",
     "EpistemicDAG",
     "FlashEvent",
     "SemanticBeliefNode",
+    "SemanticChainCache",
     "SemanticPathResult",
+    "SessionSemanticGraph",
     "build_semantic_dag",
+    "k_best_semantic_paths",
     "traverse_semantic_path",
+    "traverse_semantic_paths",
 ]
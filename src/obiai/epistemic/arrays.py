@@ -0,0 +1,534 @@
+"""Array-backed storage mode for the epistemic DAG.
+
+:class:`~obiai.epistemic.dag.EpistemicDAG` keeps one small ndarray per node
+and adjacency lists of strings, so every edge cost is a handful of scalar
+NumPy calls on 2-element arrays. :class:`ArrayEpistemicDAG` implements the same
+AEGIS-PROOF-1.2 cost and Filter-Flash traversal over contiguous storage:
+
+* every belief P_i is a row of one ``(n_nodes, n_states)`` float64 matrix and
+  every context entropy H(S_i) an entry of one vector;
+* edges are CSR arrays (``indptr``, ``indices``), with single insertions
+  buffered and merged lazily;
+* string ids are mapped to row indices at the API boundary only.
+
+Edge costs are cached in an array aligned with ``indices``, computed for
+every edge in one vectorized pass and recomputed only for edges touching a
+node whose belief changed. :meth:`ArrayEpistemicDAG.add_edges` validates a
+whole batch with a single Kahn pass, which makes DAGs with 100k+ semantic
+nodes practical.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Sequence
+from itertools import count, pairwise
+from typing import Any
+
+import numpy as np
+
+from obiai.epistemic.dag import (
+    DEFAULT_EPSILON_MIN,
+    EpistemicDAG,
+    SemanticBeliefNode,
+    traversal_costs,
+    validate_cost_weights,
+)
+
+__all__ = ["ArrayEpistemicDAG"]
+
+_INITIAL_CAPACITY = 64
+TRAVERSAL_ALGORITHMS = ("dijkstra", "dag")
+
+
+class ArrayEpistemicDAG:
+    """:class:`EpistemicDAG` with a belief matrix, an entropy vector and CSR edges."""
+
+    def __init__(
+        self,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        epsilon_min: float = DEFAULT_EPSILON_MIN,
+        n_states: int | None = None,
+    ) -> None:
+        validate_cost_weights(alpha, beta)
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon_min = epsilon_min
+        # Fixed by the first node when not given.
+        self.n_states = n_states
+
+        self.ids: list[str] = []
+        self.index: dict[str, int] = {}
+        self._beliefs = np.empty((0, n_states or 0))
+        self._entropies = np.empty(0)
+        # Rows of node i's successors are indices[indptr[i]:indptr[i + 1]], in
+        # insertion order; edges added one at a time wait in _pending.
+        self._indptr = np.zeros(1, dtype=np.intp)
+        self._indices = np.empty(0, dtype=np.intp)
+        self._pending: dict[int, list[int]] = {}
+        # C(i -> j) aligned with _indices, or None before it is first needed.
+        # Edges merged in since then are nan until priced (_unpriced says some
+        # are); _dirty holds nodes whose belief changed since they were.
+        self._edge_costs: np.ndarray | None = None
+        self._unpriced = False
+        self._dirty: set[int] = set()
+        # Node indices in topological order, or None after a structural change.
+        self._order: np.ndarray | None = None
+
+    @classmethod
+    def from_dag(cls, dag: EpistemicDAG) -> ArrayEpistemicDAG:
+        """Copy a dict-backed DAG into array storage."""
+        arrays = cls(dag.alpha, dag.beta, dag.epsilon_min)
+        nodes = list(dag.nodes.values())
+        if nodes:
+            arrays.add_nodes(
+                [node.node_id for node in nodes],
+                np.stack([np.asarray(node.P, dtype=float) for node in nodes]),
+                np.array([node.H_S for node in nodes], dtype=float),
+            )
+        arrays.add_edges(
+            (source, target) for source, targets in dag.edges.items() for target in targets
+        )
+        return arrays
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.index
+
+    @property
+    def beliefs(self) -> np.ndarray:
+        """Read-only ``(n_nodes, n_states)`` view of every P_i."""
+        return _readonly(self._beliefs[: len(self)])
+
+    @property
+    def entropies(self) -> np.ndarray:
+        """Read-only view of every H(S_i)."""
+        return _readonly(self._entropies[: len(self)])
+
+    @property
+    def n_edges(self) -> int:
+        return len(self._indices) + sum(len(targets) for targets in self._pending.values())
+
+    def csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """Read-only ``(indptr, indices)`` adjacency, merging buffered edges first."""
+        self._flush()
+        return _readonly(self._indptr), _readonly(self._indices)
+
+    def node(self, node_id: str) -> SemanticBeliefNode:
+        """A detached copy of one node; write changes back with :meth:`add_node`."""
+        i = self.index[node_id]
+        return SemanticBeliefNode(node_id, P=self._beliefs[i].copy(), H_S=float(self._entropies[i]))
+
+    def successors(self, node_id: str) -> list[str]:
+        i = self.index[node_id]
+        return [self.ids[j] for j in self._successors(i)]
+
+    def add_node(self, node: SemanticBeliefNode) -> None:
+        self.add_nodes([node.node_id], np.asarray(node.P, dtype=float)[None], [node.H_S])
+
+    def add_nodes(
+        self, node_ids: Sequence[str], P: np.ndarray, H_S: Sequence[float] | np.ndarray
+    ) -> None:
+        """Add (or overwrite) many nodes; ``P`` has one row per id."""
+        P = np.asarray(P, dtype=float)
+        entropies = np.asarray(H_S, dtype=float)
+        if self.n_states is None and P.ndim == 2:
+            self.n_states = P.shape[1]
+            self._beliefs = np.empty((0, self.n_states))
+        if P.shape != (len(node_ids), self.n_states) or entropies.shape != (len(node_ids),):
+            raise ValueError(
+                f"Expected beliefs of shape {(len(node_ids), self.n_states)} and "
+                f"{len(node_ids)} entropies; got {P.shape} and {entropies.shape}"
+            )
+
+        known = len(self.ids)
+        rows = np.empty(len(node_ids), dtype=np.intp)
+        for k, node_id in enumerate(node_ids):
+            i = self.index.get(node_id)
+            if i is None:
+                i = self.index[node_id] = len(self.ids)
+                self.ids.append(node_id)
+            rows[k] = i
+        n = len(self.ids)
+        if n > len(self._entropies):
+            capacity = max(_INITIAL_CAPACITY, n, 2 * len(self._entropies))
+            self._beliefs = _grown(self._beliefs, capacity)
+            self._entropies = _grown(self._entropies, capacity)
+        self._beliefs[rows] = P
+        self._entropies[rows] = entropies
+        if self._edge_costs is not None:
+            self._dirty.update(rows[rows < known].tolist())
+        if n + 1 > len(self._indptr):
+            self._indptr = np.concatenate(
+                [self._indptr, np.full(n + 1 - len(self._indptr), self._indptr[-1])]
+            )
+            self._order = None
+
+    def update_belief(
+        self, node_id: str, P: np.ndarray | None = None, H_S: float | None = None
+    ) -> None:
+        """Change a node's belief and/or context entropy, refreshing its edge costs."""
+        i = self.index[node_id]
+        self.add_nodes(
+            [node_id],
+            self._beliefs[i][None] if P is None else np.asarray(P, dtype=float)[None],
+            [self._entropies[i] if H_S is None else H_S],
+        )
+
+    def add_edge(self, from_id: str, to_id: str) -> None:
+        if from_id not in self.index or to_id not in self.index:
+            raise ValueError("Both nodes must exist in the DAG before adding an edge.")
+        source, target = self.index[from_id], self.index[to_id]
+        if target in self._successors(source):
+            return
+        # Invariant: the graph must remain acyclic. Adding from->to creates a
+        # cycle exactly when from is already reachable from to.
+        if self._reachable(target, source):
+            raise ValueError(f"Edge {from_id} -> {to_id} would create a cycle.")
+        self._pending.setdefault(source, []).append(target)
+
+    def add_edges(self, edges: Iterable[tuple[str, str]]) -> None:
+        """Add a batch of edges, validated together by one Kahn pass.
+
+        Edges already present are ignored. If the batch would create a cycle
+        the DAG is left unchanged.
+        """
+        pairs = list(edges)
+        if not pairs:
+            return
+        from_ids, to_ids = zip(*pairs, strict=True)
+        missing = {node_id for node_id in (*from_ids, *to_ids) if node_id not in self.index}
+        if missing:
+            raise ValueError(f"Both nodes must exist in the DAG before adding an edge: {missing}")
+        self._flush()
+        n = len(self)
+        old_sources = self._edge_sources()
+        sources = np.concatenate(
+            [old_sources, np.fromiter((self.index[i] for i in from_ids), np.intp, len(from_ids))]
+        )
+        targets = np.concatenate(
+            [self._indices, np.fromiter((self.index[i] for i in to_ids), np.intp, len(to_ids))]
+        )
+        # Keep the first occurrence of every edge, in insertion order.
+        _, first = np.unique(sources * n + targets, return_index=True)
+        first.sort()
+        indptr, indices, permutation = _csr(sources[first], targets[first], n)
+        order = _topological_order(indptr, indices)
+        if len(order) < n:
+            raise ValueError("Edges would create a cycle.")
+        self._indptr, self._indices = indptr, indices
+        self._carry_edge_costs(first[permutation])
+        self._order = order
+
+    def topological_order(self) -> list[str]:
+        """All node ids, every node before its successors."""
+        return [self.ids[i] for i in self._topological_indices()]
+
+    def edge_cost(self, from_id: str, to_id: str) -> float:
+        """Cached C(from -> to) for an existing edge."""
+        costs = self._refreshed_edge_costs()
+        i, j = self.index[from_id], self.index[to_id]
+        row = self._indices[self._indptr[i] : self._indptr[i + 1]]
+        (position,) = np.flatnonzero(row == j)
+        return float(costs[self._indptr[i] + position])
+
+    # --- Definition 2 & Theorem 1: Traversal Cost Function ---
+    def calculate_traversal_cost(
+        self, node_i: SemanticBeliefNode, node_j: SemanticBeliefNode
+    ) -> float:
+        """C(Node_i -> Node_j), evaluated by the same kernel as the traversal."""
+        return float(
+            traversal_costs(
+                self.alpha,
+                self.beta,
+                self.epsilon_min,
+                np.asarray(node_i.P, dtype=float),
+                np.asarray(node_i.H_S, dtype=float),
+                np.asarray(node_j.P, dtype=float),
+                np.asarray(node_j.H_S, dtype=float),
+            )
+        )
+
+    # --- Algorithm 1: Filter-Flash Integrated Traversal ---
+    def filter_flash_traversal(
+        self,
+        start_id: str,
+        target_id: str,
+        filter_threshold: float,
+        flash_threshold: float,
+        algorithm: str = "dijkstra",
+    ) -> dict[str, Any] | None:
+        """Same result as :meth:`EpistemicDAG.filter_flash_traversal`."""
+        if start_id not in self.index or target_id not in self.index:
+            raise ValueError("Start or target node does not exist in the DAG.")
+        results = self.traverse_from(
+            start_id, filter_threshold, flash_threshold, targets=[target_id], algorithm=algorithm
+        )
+        return results.get(target_id)
+
+    def traverse_from(
+        self,
+        start_id: str,
+        filter_threshold: float,
+        flash_threshold: float,
+        targets: Iterable[str] | None = None,
+        algorithm: str = "dijkstra",
+    ) -> dict[str, dict[str, Any]]:
+        """Same result as :meth:`EpistemicDAG.traverse_from`."""
+        wanted = None if targets is None else list(dict.fromkeys(targets))
+        if start_id not in self.index or any(t not in self.index for t in wanted or ()):
+            raise ValueError("Start or target node does not exist in the DAG.")
+        if algorithm not in TRAVERSAL_ALGORITHMS:
+            raise ValueError(
+                f"Unknown traversal algorithm {algorithm!r}; expected one of {TRAVERSAL_ALGORITHMS}"
+            )
+        edge_costs = self._refreshed_edge_costs()
+        search = self._dag_search if algorithm == "dag" else self._dijkstra_search
+        cost, parent = search(
+            self.index[start_id],
+            None if wanted is None else {self.index[t] for t in wanted},
+            edge_costs,
+            filter_threshold,
+        )
+        rows = cost if wanted is None else [self.index[t] for t in wanted]
+        return {
+            self.ids[i]: self._result(i, cost[i], parent, flash_threshold)
+            for i in rows
+            if i in cost
+        }
+
+    def traverse_many(
+        self,
+        start_ids: Iterable[str],
+        filter_threshold: float,
+        flash_threshold: float,
+        targets: Iterable[str] | None = None,
+        algorithm: str = "dijkstra",
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """:meth:`traverse_from` for several sources over the same cached edge costs."""
+        targets = None if targets is None else list(targets)
+        return {
+            start_id: self.traverse_from(
+                start_id, filter_threshold, flash_threshold, targets=targets, algorithm=algorithm
+            )
+            for start_id in start_ids
+        }
+
+    def _dijkstra_search(
+        self, start: int, wanted: set[int] | None, edge_costs: np.ndarray, filter_threshold: float
+    ) -> tuple[dict[int, float], dict[int, int]]:
+        remaining = 0 if wanted is None else len(wanted)
+        # (cumulative_cost, tiebreak, node, predecessor); a node's parent is
+        # fixed when it is first popped, which is when Dijkstra settles it.
+        tiebreak = count()
+        pq = [(0.0, next(tiebreak), start, -1)]
+        cost: dict[int, float] = {}
+        parent: dict[int, int] = {}
+        while pq:
+            current_cost, _, current, predecessor = heapq.heappop(pq)
+            if current in parent:
+                continue
+            parent[current] = predecessor
+            cost[current] = current_cost
+            if wanted is not None and current in wanted:
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+            row = slice(self._indptr[current], self._indptr[current + 1])
+            neighbours, costs = self._indices[row].tolist(), edge_costs[row].tolist()
+            for neighbour, step in zip(neighbours, costs, strict=True):
+                # --- Semantic Filter Condition ---
+                if neighbour in parent or step >= filter_threshold:
+                    continue
+                heapq.heappush(pq, (current_cost + step, next(tiebreak), neighbour, current))
+        return cost, parent
+
+    def _dag_search(
+        self, start: int, wanted: set[int] | None, edge_costs: np.ndarray, filter_threshold: float
+    ) -> tuple[dict[int, float], dict[int, int]]:
+        """Shortest filtered paths by relaxing edges in topological order."""
+        order = self._topological_indices()
+        remaining = 0 if wanted is None else len(wanted)
+        cost = {start: 0.0}
+        parent = {start: -1}
+        # Costs are final when the sweep reaches a node; nodes ordered before
+        # the start are unreachable from it.
+        for current in order[int(np.flatnonzero(order == start)[0]) :].tolist():
+            if current not in cost:
+                continue
+            if wanted is not None and current in wanted:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            current_cost = cost[current]
+            row = slice(self._indptr[current], self._indptr[current + 1])
+            neighbours, costs = self._indices[row].tolist(), edge_costs[row].tolist()
+            for neighbour, step in zip(neighbours, costs, strict=True):
+                # --- Semantic Filter Condition ---
+                if step >= filter_threshold:
+                    continue
+                candidate = current_cost + step
+                if candidate < cost.get(neighbour, np.inf):
+                    cost[neighbour] = candidate
+                    parent[neighbour] = current
+        return cost, parent
+
+    def _topological_indices(self) -> np.ndarray:
+        self._flush()
+        if self._order is None:
+            self._order = _topological_order(self._indptr, self._indices)
+        return self._order
+
+    def _refreshed_edge_costs(self) -> np.ndarray:
+        self._flush()
+        if self._edge_costs is not None and not self._dirty and not self._unpriced:
+            return self._edge_costs
+        sources = self._edge_sources()
+        if self._edge_costs is None:
+            positions = np.arange(len(self._indices))
+            self._edge_costs = np.empty(len(self._indices))
+        else:
+            stale = np.isnan(self._edge_costs)
+            if self._dirty:
+                dirty = np.fromiter(self._dirty, np.intp, len(self._dirty))
+                stale |= np.isin(sources, dirty) | np.isin(self._indices, dirty)
+            positions = np.flatnonzero(stale)
+        self._dirty.clear()
+        self._unpriced = False
+        sources, targets = sources[positions], self._indices[positions]
+        self._edge_costs[positions] = traversal_costs(
+            self.alpha,
+            self.beta,
+            self.epsilon_min,
+            self._beliefs[sources],
+            self._entropies[sources],
+            self._beliefs[targets],
+            self._entropies[targets],
+        )
+        return self._edge_costs
+
+    def _edge_sources(self) -> np.ndarray:
+        return np.repeat(np.arange(len(self)), np.diff(self._indptr))
+
+    def _carry_edge_costs(self, previous: np.ndarray) -> None:
+        # previous[k] is the position edge k of the new CSR held in the old
+        # edge list with the inserted edges appended; appended ones are unpriced.
+        if self._edge_costs is None:
+            return
+        old = self._edge_costs
+        carried = np.full(len(previous), np.nan)
+        kept = previous < len(old)
+        carried[kept] = old[previous[kept]]
+        self._edge_costs = carried
+        self._unpriced = self._unpriced or not kept.all()
+
+    def _result(
+        self, target: int, total_cost: float, parent: dict[int, int], flash_threshold: float
+    ) -> dict[str, Any]:
+        path = [target]
+        while parent[path[-1]] >= 0:
+            path.append(parent[path[-1]])
+        path.reverse()
+        flashes = []
+        for i, j in pairwise(path):
+            # --- Flash Event Condition ---
+            entropy_gradient = float(self._entropies[i] - self._entropies[j])
+            if entropy_gradient > flash_threshold:
+                flashes.append(
+                    {
+                        "transition": f"{self.ids[i]} -> {self.ids[j]}",
+                        "entropy_gradient": entropy_gradient,
+                        "event_type": "SEMANTIC_DISAMBIGUATION",
+                    }
+                )
+        return {
+            "path": [self.ids[i] for i in path],
+            "total_cost": float(total_cost),
+            "flash_events": flashes,
+        }
+
+    def _successors(self, i: int) -> list[int]:
+        merged = self._indices[self._indptr[i] : self._indptr[i + 1]].tolist()
+        return merged + self._pending.get(i, [])
+
+    def _reachable(self, source: int, target: int) -> bool:
+        stack = [source]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(self._successors(node))
+        return False
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        n = len(self)
+        sources = self._edge_sources()
+        pending_sources = [i for i, targets in self._pending.items() for _ in targets]
+        pending_targets = [j for targets in self._pending.values() for j in targets]
+        self._indptr, self._indices, permutation = _csr(
+            np.concatenate([sources, np.asarray(pending_sources, dtype=np.intp)]),
+            np.concatenate([self._indices, np.asarray(pending_targets, dtype=np.intp)]),
+            n,
+        )
+        self._pending.clear()
+        self._carry_edge_costs(permutation)
+        self._order = None
+
+
+def _topological_order(indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Kahn's algorithm, one frontier layer at a time.
+
+    Returns the nodes in a topological order; fewer than ``len(indptr) - 1``
+    of them means the graph has a cycle.
+    """
+    n = len(indptr) - 1
+    indegree = np.bincount(indices, minlength=n)
+    frontier = np.flatnonzero(indegree == 0)
+    layers = []
+    while len(frontier):
+        layers.append(frontier)
+        successors = indices[_row_positions(indptr, frontier)]
+        np.subtract.at(indegree, successors, 1)
+        frontier = np.unique(successors[indegree[successors] == 0])
+    return np.concatenate(layers) if layers else np.empty(0, dtype=np.intp)
+
+
+def _row_positions(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Positions in ``indices`` of every entry of the given CSR rows, row by row."""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
+def _csr(
+    sources: np.ndarray, targets: np.ndarray, n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR ``indptr`` and ``indices`` of an edge list, plus each entry's input position."""
+    # A stable sort keeps each row's edges in insertion order.
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return indptr, targets[order].astype(np.intp, copy=False), order
+
+
+def _grown(array: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.empty((capacity, *array.shape[1:]))
+    grown[: len(array)] = array
+    return grown
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
@@ -9,25 +9,54 @@ carries the phi-marginalized posterior, and the decision node carries a
 near-certain committed belief. Filter-Flash traversal then yields the
 semantic path and any SEMANTIC_DISAMBIGUATION flash events, which the engine
 surfaces in the decision explanation.
+
+The chain's shape depends only on the mapping, so :class:`SemanticChainCache`
+keeps one DAG skeleton per chain and only rewrites the two beliefs that change
+per observation. A three-node chain has exactly one path, so its cost and
+flash events are also available in closed form without a DAG or a search.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from obiai.core.config import EpistemicSettings
-from obiai.epistemic.dag import EpistemicDAG, SemanticBeliefNode
-
-__all__ = ["FlashEvent", "SemanticPathResult", "build_semantic_dag", "traverse_semantic_path"]
+from obiai.epistemic.dag import (
+    DEFAULT_EPSILON_MIN,
+    EpistemicDAG,
+    SemanticBeliefNode,
+    traversal_costs,
+)
+
+__all__ = [
+    "FlashEvent",
+    "SemanticChainCache",
+    "SemanticPathResult",
+    "build_semantic_dag",
+    "k_best_semantic_paths",
+    "traverse_semantic_path",
+    "traverse_semantic_paths",
+]
 
 DECISION_BELIEF = 0.99
 OBSERVATION_ENTROPY = 1.0
 INTERMEDIATE_ENTROPY = 0.5
 DECISION_ENTROPY = 0.1
+CHAIN_ENTROPIES = (OBSERVATION_ENTROPY, INTERMEDIATE_ENTROPY, DECISION_ENTROPY)
+DEFAULT_CACHED_CHAINS = 256
+
+# (source, intermediate, target, alpha, beta) of a cached chain DAG.
+_SkeletonKey = tuple[str, str, str, float, float]
 
 
 class FlashEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     transition: str
     entropy_gradient: float
     event_type: str = "SEMANTIC_DISAMBIGUATION"
@@ -49,23 +78,120 @@ def build_semantic_dag(
     source_belief: float = 0.85,
 ) -> EpistemicDAG:
     dag = EpistemicDAG(alpha=settings.alpha, beta=settings.beta)
-    dag.add_node(
-        SemanticBeliefNode(source, P=np.array([source_belief, 1.0 - source_belief]),
-                           H_S=OBSERVATION_ENTROPY)
-    )
-    dag.add_node(
-        SemanticBeliefNode(intermediate, P=np.array([posterior, 1.0 - posterior]),
-                           H_S=INTERMEDIATE_ENTROPY)
-    )
-    dag.add_node(
-        SemanticBeliefNode(target, P=np.array([DECISION_BELIEF, 1.0 - DECISION_BELIEF]),
-                           H_S=DECISION_ENTROPY)
-    )
+    beliefs = _chain_beliefs(source_belief, posterior)
+    for node_id, belief, entropy in zip(
+        (source, intermediate, target), beliefs, CHAIN_ENTROPIES, strict=True
+    ):
+        dag.add_node(SemanticBeliefNode(node_id, P=belief, H_S=entropy))
     dag.add_edge(source, intermediate)
     dag.add_edge(intermediate, target)
     return dag
 
 
+class SemanticChainCache:
+    """DAG skeletons per semantic chain, plus the closed-form chain traversal."""
+
+    def __init__(self, max_chains: int = DEFAULT_CACHED_CHAINS) -> None:
+        self.max_chains = max_chains
+        self._skeletons: OrderedDict[_SkeletonKey, EpistemicDAG] = OrderedDict()
+
+    def dag(
+        self,
+        chain: Sequence[str],
+        posterior: float,
+        settings: EpistemicSettings,
+        *,
+        source_belief: float = 0.85,
+    ) -> EpistemicDAG:
+        """The chain's cached DAG with this observation's beliefs written in.
+
+        The DAG is shared: it is only valid until the next call for the same
+        chain and settings.
+        """
+        source, intermediate, target = chain
+        key: _SkeletonKey = (source, intermediate, target, settings.alpha, settings.beta)
+        dag = self._skeletons.get(key)
+        if dag is None:
+            dag = build_semantic_dag(
+                posterior,
+                settings,
+                source=source,
+                intermediate=intermediate,
+                target=target,
+                source_belief=source_belief,
+            )
+            self._skeletons[key] = dag
+            if len(self._skeletons) > self.max_chains:
+                self._skeletons.popitem(last=False)
+        else:
+            self._skeletons.move_to_end(key)
+            source_P, intermediate_P, _ = _chain_beliefs(source_belief, posterior)
+            dag.update_belief(source, P=source_P)
+            dag.update_belief(intermediate, P=intermediate_P)
+        return dag
+
+    def traverse(
+        self,
+        chain: Sequence[str],
+        posterior: float,
+        settings: EpistemicSettings,
+        *,
+        source_belief: float = 0.85,
+    ) -> SemanticPathResult | None:
+        """Same result as traversing :func:`build_semantic_dag`'s DAG.
+
+        With three distinct concepts the chain is the only path, so both
+        edge costs come from one vectorized cost evaluation and the flash
+        events from the fixed entropy gradients; no DAG or heap is involved.
+        """
+        if len(set(chain)) != 3:
+            source, _, target = chain
+            dag = self.dag(chain, posterior, settings, source_belief=source_belief)
+            return traverse_semantic_path(dag, source, target, settings)
+
+        costs = traversal_costs(
+            settings.alpha,
+            settings.beta,
+            DEFAULT_EPSILON_MIN,
+            np.array([[source_belief, 1.0 - source_belief], [posterior, 1.0 - posterior]]),
+            _SOURCE_ENTROPIES,
+            np.array([[posterior, 1.0 - posterior], [DECISION_BELIEF, 1.0 - DECISION_BELIEF]]),
+            _TARGET_ENTROPIES,
+        ).tolist()
+        # --- Semantic Filter Condition ---
+        if max(costs) >= settings.filter_threshold:
+            return None
+        return SemanticPathResult.model_construct(
+            path=list(chain),
+            # Accumulated in traversal order, exactly as the search does.
+            total_cost=0.0 + costs[0] + costs[1],
+            flash_events=list(_chain_flash_events(tuple(chain), settings.flash_threshold)),
+        )
+
+
+_SOURCE_ENTROPIES = np.array(CHAIN_ENTROPIES[:2])
+_TARGET_ENTROPIES = np.array(CHAIN_ENTROPIES[1:])
+
+
+@lru_cache(maxsize=DEFAULT_CACHED_CHAINS)
+def _chain_flash_events(chain: tuple[str, ...], flash_threshold: float) -> tuple[FlashEvent, ...]:
+    # The chain's entropies are fixed, so its flash events depend only on the
+    # concepts and the threshold.
+    return tuple(
+        FlashEvent(transition=f"{i} -> {j}", entropy_gradient=h_i - h_j)
+        for i, j, h_i, h_j in zip(chain, chain[1:], CHAIN_ENTROPIES, CHAIN_ENTROPIES[1:])
+        if h_i - h_j > flash_threshold
+    )
+
+
+def _chain_beliefs(source_belief: float, posterior: float) -> list[np.ndarray]:
+    return [
+        np.array([source_belief, 1.0 - source_belief]),
+        np.array([posterior, 1.0 - posterior]),
+        np.array([DECISION_BELIEF, 1.0 - DECISION_BELIEF]),
+    ]
+
+
 def traverse_semantic_path(
     dag: EpistemicDAG,
     start: str,
@@ -77,9 +203,49 @@ def traverse_semantic_path(
         target_id=target,
         filter_threshold=settings.filter_threshold,
         flash_threshold=settings.flash_threshold,
+        algorithm=settings.algorithm,
     )
     if raw is None:
         return None
+    return _path_result(raw)
+
+
+def traverse_semantic_paths(
+    dag: EpistemicDAG,
+    start: str,
+    targets: list[str],
+    settings: EpistemicSettings,
+) -> dict[str, SemanticPathResult]:
+    """Paths to several candidate decision concepts from one search; unreachable ones are omitted."""
+    raw = dag.traverse_from(
+        start,
+        filter_threshold=settings.filter_threshold,
+        flash_threshold=settings.flash_threshold,
+        targets=targets,
+        algorithm=settings.algorithm,
+    )
+    return {target: _path_result(result) for target, result in raw.items()}
+
+
+def k_best_semantic_paths(
+    dag: EpistemicDAG,
+    start: str,
+    target: str,
+    settings: EpistemicSettings,
+    k: int,
+) -> list[SemanticPathResult]:
+    """The optimal semantic path followed by up to ``k - 1`` runner-up interpretations."""
+    raw = dag.k_best_paths(
+        start,
+        target,
+        filter_threshold=settings.filter_threshold,
+        flash_threshold=settings.flash_threshold,
+        k=k,
+    )
+    return [_path_result(result) for result in raw]
+
+
+def _path_result(raw: dict) -> SemanticPathResult:
     return SemanticPathResult(
         path=raw["path"],
         total_cost=raw["total_cost"],
@@ -13,8 +13,8 @@ original demo now lives under ``__main__`` so importing has no side effects.
 
 import heapq
 from dataclasses import dataclass
-from itertools import count
-from typing import Any, Dict, List, Optional
+from itertools import count, pairwise
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 import numpy as np
 
@@ -37,18 +37,41 @@ class SemanticBeliefNode:
         return -np.sum(self.P * np.log2(p_safe))
 
 
+TRAVERSAL_ALGORITHMS = ("dijkstra", "dag", "astar")
+DEFAULT_EPSILON_MIN = 1e-12
+DEFAULT_LANDMARKS = 8
+
+
+# --- Lemma 1: Parameter Boundedness Constraints ---
+def validate_cost_weights(alpha: float, beta: float) -> None:
+    if not np.isclose(alpha + beta, 1.0):
+        raise ValueError("Normalization constraint violated: alpha + beta must equal 1.0")
+    if alpha <= 0 or beta <= 0:
+        raise ValueError("Non-degeneracy constraint violated: alpha, beta must be > 0")
+
+
+# --- Definition 2 & Theorem 1, vectorized over edges ---
+def traversal_costs(alpha: float, beta: float, epsilon_min: float,
+                    P_i: np.ndarray, H_i: np.ndarray,
+                    P_j: np.ndarray, H_j: np.ndarray) -> np.ndarray:
+    """
+    C(i -> j) for every row of the stacked edge endpoints in one pass.
+    P_* have shape (n_edges, n_states), H_* have shape (n_edges,).
+    """
+    ratio = np.maximum(P_i, epsilon_min) / np.maximum(P_j, epsilon_min)
+    kl_div = np.sum(P_i * np.log2(ratio), axis=-1)
+    return np.maximum(alpha * kl_div + beta * (H_i - H_j), 0.0)
+
+
 class EpistemicDAG:
     """
     Core data structure implementing cost-weighted traversal for the Aegis Framework.
     Complies with AEGIS-PROOF-1.2 mathematical specifications.
     """
 
-    def __init__(self, alpha: float = 0.5, beta: float = 0.5, epsilon_min: float = 1e-12):
-        # Lemma 1: Parameter Boundedness Constraints
-        if not np.isclose(alpha + beta, 1.0):
-            raise ValueError("Normalization constraint violated: alpha + beta must equal 1.0")
-        if alpha <= 0 or beta <= 0:
-            raise ValueError("Non-degeneracy constraint violated: alpha, beta must be > 0")
+    def __init__(self, alpha: float = 0.5, beta: float = 0.5,
+                 epsilon_min: float = DEFAULT_EPSILON_MIN):
+        validate_cost_weights(alpha, beta)
 
         self.alpha = alpha
         self.beta = beta
@@ -56,35 +79,195 @@ class EpistemicDAG:
 
         self.nodes: Dict[str, SemanticBeliefNode] = {}
         self.edges: Dict[str, List[str]] = {}  # Adjacency list for the DAG
+        self._predecessors: Dict[str, List[str]] = {}
+
+        # Cached C(i -> j) per edge. Edges whose endpoints changed are queued
+        # in _stale_edges and recomputed in one vectorized pass on demand.
+        self._edge_costs: Dict[Tuple[str, str], float] = {}
+        self._stale_edges: Set[Tuple[str, str]] = set()
+
+        # Every node in a topological order, kept valid across insertions by
+        # the Pearce-Kelly algorithm; _position is each node's index in it.
+        self._order: List[str] = []
+        self._position: Dict[str, int] = {}
+
+        # ALT tables for A*: each node's shortest distances from and to every
+        # landmark over all edges. Edges whose cost changed since the tables
+        # were computed are queued in _landmark_stale_edges.
+        self._landmarks: List[str] = []
+        self._from_landmarks: Dict[str, np.ndarray] = {}
+        self._to_landmarks: Dict[str, np.ndarray] = {}
+        self._landmark_stale_edges: Set[Tuple[str, str]] = set()
+        self._landmark_tables_outdated = False
 
     def add_node(self, node: SemanticBeliefNode):
+        replaced = node.node_id in self.nodes
         self.nodes[node.node_id] = node
         if node.node_id not in self.edges:
             self.edges[node.node_id] = []
+            self._predecessors[node.node_id] = []
+            self._position[node.node_id] = len(self._order)
+            self._order.append(node.node_id)
+            if self._landmarks:
+                # An isolated node: no landmark reaches it or is reached from it.
+                self._from_landmarks[node.node_id] = np.full(len(self._landmarks), np.inf)
+                self._to_landmarks[node.node_id] = np.full(len(self._landmarks), np.inf)
+        if replaced:
+            self._invalidate(node.node_id)
+
+    def remove_node(self, node_id: str):
+        """
+        Removes a node with all of its edges. The remaining nodes keep their
+        relative topological order and cached edge costs.
+        """
+        for to_id in self.edges.pop(node_id):
+            self._predecessors[to_id].remove(node_id)
+            self._edge_costs.pop((node_id, to_id), None)
+        for from_id in self._predecessors.pop(node_id):
+            self.edges[from_id].remove(node_id)
+            self._edge_costs.pop((from_id, node_id), None)
+        del self.nodes[node_id]
+        self._stale_edges = {edge for edge in self._stale_edges if node_id not in edge}
+
+        position = self._position.pop(node_id)
+        del self._order[position]
+        for i in range(position, len(self._order)):
+            self._position[self._order[i]] = i
+
+        if self._landmarks:
+            # Deleted edges cannot be located in the order any more; rebuild
+            # the landmark tables in full on the next A* query.
+            self._landmarks = [landmark for landmark in self._landmarks if landmark != node_id]
+            self._landmark_tables_outdated = True
+
+    def update_belief(self, node_id: str, P: Optional[np.ndarray] = None,
+                      H_S: Optional[float] = None):
+        """
+        Changes a node's belief and/or context entropy. Beliefs must be changed
+        through here (or add_node), not by mutating the node, so that the cached
+        costs of the edges touching it are refreshed.
+        """
+        node = self.nodes[node_id]
+        if P is not None:
+            node.P = np.asarray(P, dtype=float)
+        if H_S is not None:
+            node.H_S = H_S
+        self._invalidate(node_id)
 
     def add_edge(self, from_id: str, to_id: str):
         if from_id not in self.nodes or to_id not in self.nodes:
             raise ValueError("Both nodes must exist in the DAG before adding an edge.")
         if to_id in self.edges.get(from_id, []):
             return
-        # Invariant: the graph must remain acyclic. Adding from->to creates a
-        # cycle exactly when from is already reachable from to.
-        if self._reachable(to_id, from_id):
-            raise ValueError(f"Edge {from_id} -> {to_id} would create a cycle.")
+        # Invariant: the graph must remain acyclic. An edge that agrees with
+        # the maintained order cannot close a cycle; only a backward edge
+        # needs a search, bounded to the nodes ordered between its endpoints.
+        if self._position[to_id] <= self._position[from_id]:
+            self._reorder(from_id, to_id)
         self.edges[from_id].append(to_id)
+        self._predecessors[to_id].append(from_id)
+        self._stale_edges.add((from_id, to_id))
+
+    def add_edges(self, edges: Iterable[Tuple[str, str]]):
+        """
+        Adds a batch of edges, validated by a single Kahn pass over the
+        resulting graph instead of one search per edge. Edges already present
+        are ignored; if the batch would create a cycle, none of it is added.
+        """
+        batch = list(dict.fromkeys(edges))
+        if any(from_id not in self.nodes or to_id not in self.nodes for from_id, to_id in batch):
+            raise ValueError("Both nodes must exist in the DAG before adding an edge.")
+        new_edges = [(from_id, to_id) for from_id, to_id in batch
+                     if to_id not in self.edges[from_id]]
+        if not new_edges:
+            return
+
+        successors = {node_id: list(to_ids) for node_id, to_ids in self.edges.items()}
+        for from_id, to_id in new_edges:
+            successors[from_id].append(to_id)
+        order = _kahn_order(successors)
+        if len(order) < len(self.nodes):
+            raise ValueError("Edges would create a cycle.")
+
+        for from_id, to_id in new_edges:
+            self.edges[from_id].append(to_id)
+            self._predecessors[to_id].append(from_id)
+            self._stale_edges.add((from_id, to_id))
+        self._order = order
+        self._position = {node_id: i for i, node_id in enumerate(order)}
+
+    def topological_order(self) -> List[str]:
+        """All node ids, every node before its successors."""
+        return list(self._order)
+
+    def _reorder(self, from_id: str, to_id: str):
+        """
+        Pearce-Kelly repair for a new edge from_id -> to_id with to_id ordered
+        first. Only nodes ordered between the two endpoints can be affected:
+        those reachable from to_id move after those reaching from_id.
+        """
+        lower, upper = self._position[to_id], self._position[from_id]
 
-    def _reachable(self, source: str, target: str) -> bool:
-        stack = [source]
-        seen = set()
+        forward, stack = [], [to_id]
+        seen = {to_id}
         while stack:
-            node = stack.pop()
-            if node == target:
-                return True
-            if node in seen:
-                continue
-            seen.add(node)
-            stack.extend(self.edges.get(node, []))
-        return False
+            node_id = stack.pop()
+            if node_id == from_id:
+                raise ValueError(f"Edge {from_id} -> {to_id} would create a cycle.")
+            forward.append(node_id)
+            for successor in self.edges[node_id]:
+                if successor not in seen and self._position[successor] <= upper:
+                    seen.add(successor)
+                    stack.append(successor)
+
+        backward, stack = [], [from_id]
+        seen = {from_id}
+        while stack:
+            node_id = stack.pop()
+            backward.append(node_id)
+            for predecessor in self._predecessors[node_id]:
+                if predecessor not in seen and self._position[predecessor] >= lower:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+
+        moved = sorted(backward, key=self._position.__getitem__)
+        moved += sorted(forward, key=self._position.__getitem__)
+        slots = sorted(self._position[node_id] for node_id in moved)
+        for node_id, slot in zip(moved, slots):
+            self._order[slot] = node_id
+            self._position[node_id] = slot
+
+    def edge_cost(self, from_id: str, to_id: str) -> float:
+        """Cached C(from -> to) for an existing edge."""
+        self._refresh_edge_costs()
+        return self._edge_costs[(from_id, to_id)]
+
+    def _invalidate(self, node_id: str):
+        self._stale_edges.update((node_id, to_id) for to_id in self.edges[node_id])
+        self._stale_edges.update((from_id, node_id) for from_id in self._predecessors[node_id])
+
+    def _refresh_edge_costs(self):
+        if not self._stale_edges:
+            return
+        pairs = list(self._stale_edges)
+        sources = [self.nodes[i] for i, _ in pairs]
+        targets = [self.nodes[j] for _, j in pairs]
+        try:
+            P_i = np.stack([np.asarray(node.P, dtype=float) for node in sources])
+            P_j = np.stack([np.asarray(node.P, dtype=float) for node in targets])
+        except ValueError:
+            # Nodes over different numbers of interpretations cannot be stacked.
+            costs = [float(self.calculate_traversal_cost(i, j)) for i, j in zip(sources, targets)]
+        else:
+            costs = traversal_costs(
+                self.alpha, self.beta, self.epsilon_min,
+                P_i, np.array([node.H_S for node in sources], dtype=float),
+                P_j, np.array([node.H_S for node in targets], dtype=float),
+            ).tolist()
+        self._edge_costs.update(zip(pairs, costs))
+        if self._landmarks:
+            self._landmark_stale_edges.update(pairs)
+        self._stale_edges.clear()
 
     # --- Section 5.1: Handling Singular Probability Distributions ---
     def _kl_divergence_stable(self, P_i: np.ndarray, P_j: np.ndarray) -> float:
@@ -116,72 +299,410 @@ class EpistemicDAG:
 
     # --- Algorithm 1: Filter-Flash Integrated Traversal ---
     def filter_flash_traversal(self, start_id: str, target_id: str,
-                               filter_threshold: float, flash_threshold: float) -> Optional[Dict[str, Any]]:
+                               filter_threshold: float, flash_threshold: float,
+                               algorithm: str = "dijkstra") -> Optional[Dict[str, Any]]:
         """
         Finds the optimal traversal path using Dijkstra's algorithm,
         integrating semantic filtering and consciousness-aware flash events.
+
+        algorithm="dag" instead relaxes edges in one sweep along the topological
+        order, O(V + E) with no heap. It returns the same cost and, unless
+        several paths tie exactly on cost, the same path and flash events.
+
+        algorithm="astar" is goal-directed: the search is guided by ALT
+        landmark lower bounds (see set_landmarks), built on first use.
         """
         if start_id not in self.nodes or target_id not in self.nodes:
             raise ValueError("Start or target node does not exist in the DAG.")
+        results = self.traverse_from(start_id, filter_threshold, flash_threshold,
+                                     targets=[target_id], algorithm=algorithm)
+        return results.get(target_id)  # None: no valid path within filter constraints
 
-        # Priority Queue: (cumulative_cost, tiebreak, current_node_id, path_history, flash_events_log)
-        # The monotonically increasing tiebreak keeps heapq from ever comparing
-        # path/flash payloads when costs are equal.
+    def traverse_from(self, start_id: str, filter_threshold: float, flash_threshold: float,
+                      targets: Optional[Iterable[str]] = None,
+                      algorithm: str = "dijkstra") -> Dict[str, Dict[str, Any]]:
+        """
+        Runs one search from start_id and returns the filter_flash_traversal
+        result for every target (every reachable node when targets is None).
+        Targets with no valid path are left out. The search stops as soon as
+        all requested targets are settled. algorithm="astar" needs exactly one
+        target.
+        """
+        wanted = None if targets is None else list(dict.fromkeys(targets))
+        if start_id not in self.nodes or any(t not in self.nodes for t in wanted or ()):
+            raise ValueError("Start or target node does not exist in the DAG.")
+        if algorithm not in TRAVERSAL_ALGORITHMS:
+            raise ValueError(
+                f"Unknown traversal algorithm {algorithm!r}; expected one of {TRAVERSAL_ALGORITHMS}"
+            )
+        if algorithm == "astar" and (wanted is None or len(wanted) != 1):
+            raise ValueError("A* traversal needs exactly one target.")
+        self._refresh_edge_costs()
+        wanted_ids = None if wanted is None else set(wanted)
+        if algorithm == "astar" and wanted_ids is not None:
+            cost, parent = self._astar_search(start_id, wanted_ids, filter_threshold)
+        else:
+            search = self._dag_search if algorithm == "dag" else self._dijkstra_search
+            cost, parent = search(start_id, wanted_ids, filter_threshold)
+
+        return {
+            target_id: self._result(self._rebuild_path(parent, target_id), cost[target_id],
+                                    flash_threshold)
+            for target_id in (cost if wanted is None else wanted)
+            if target_id in cost
+        }
+
+    def traverse_many(self, start_ids: Iterable[str], filter_threshold: float,
+                      flash_threshold: float, targets: Optional[Iterable[str]] = None,
+                      algorithm: str = "dijkstra") -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """traverse_from for several sources, sharing one refresh of the cached edge costs."""
+        targets = None if targets is None else list(targets)
+        return {
+            start_id: self.traverse_from(start_id, filter_threshold, flash_threshold,
+                                         targets=targets, algorithm=algorithm)
+            for start_id in start_ids
+        }
+
+    def k_best_paths(self, start_id: str, target_id: str, filter_threshold: float,
+                     flash_threshold: float, k: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields filter_flash_traversal results for the k cheapest
+        filtered paths (all of them when k is None), in cost order. The first
+        is the optimal path; each later one is found by Yen's deviation search
+        from the paths already yielded, so work stops with the caller.
+
+        Arguments are checked when called, not on the first next().
+        """
+        if start_id not in self.nodes or target_id not in self.nodes:
+            raise ValueError("Start or target node does not exist in the DAG.")
+        if k is not None and k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        return self._k_best_paths(start_id, target_id, filter_threshold, flash_threshold, k)
+
+    def _k_best_paths(self, start_id: str, target_id: str, filter_threshold: float,
+                      flash_threshold: float, k: Optional[int]) -> Iterator[Dict[str, Any]]:
+        self._refresh_edge_costs()
+        cost, parent = self._dijkstra_search(start_id, {target_id}, filter_threshold)
+        if target_id not in cost:
+            return
+
+        best = [self._rebuild_path(parent, target_id)]
+        seen = {tuple(best[0])}
         tiebreak = count()
-        pq = [(0.0, next(tiebreak), start_id, [start_id], [])]
-        visited = set()
+        candidates: List[Tuple[float, int, List[str]]] = []
+        while True:
+            path = best[-1]
+            yield self._result(path, self._path_cost(path), flash_threshold)
+            if k is not None and len(best) >= k:
+                return
+            # Deviate from the last path at every spur node. The graph is
+            # acyclic, so a spur path can never revisit the root path and only
+            # the next edges of yielded paths sharing this root are banned.
+            for i, spur_id in enumerate(path[:-1]):
+                root = path[:i + 1]
+                banned = frozenset((p[i], p[i + 1]) for p in best
+                                   if len(p) > i + 1 and p[:i + 1] == root)
+                spur_cost, spur_parent = self._dijkstra_search(
+                    spur_id, {target_id}, filter_threshold, banned
+                )
+                if target_id not in spur_cost:
+                    continue
+                candidate = root[:-1] + self._rebuild_path(spur_parent, target_id)
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(
+                        candidates, (self._path_cost(candidate), next(tiebreak), candidate)
+                    )
+            if not candidates:
+                return
+            best.append(heapq.heappop(candidates)[2])
+
+    def set_landmarks(self, landmark_ids: Optional[Iterable[str]] = None,
+                      count: int = DEFAULT_LANDMARKS):
+        """
+        Chooses the ALT landmarks for A* and computes their distance tables.
+        By default the landmarks are spread evenly along the topological order,
+        so they include a source and a sink.
 
+        For a landmark L the triangle inequality gives the lower bounds
+        d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L). They hold
+        on the full graph and hence on the filtered subgraph the traversal walks.
+        """
+        if landmark_ids is None:
+            n = len(self._order)
+            picks = np.linspace(0, n - 1, num=min(count, n)).round().astype(int)
+            landmark_ids = [self._order[i] for i in dict.fromkeys(picks.tolist())]
+        landmarks = list(dict.fromkeys(landmark_ids))
+        if any(node_id not in self.nodes for node_id in landmarks):
+            raise ValueError("Landmarks must be nodes of the DAG.")
+        self._refresh_edge_costs()
+        self._landmarks = landmarks
+        self._from_landmarks.clear()
+        self._to_landmarks.clear()
+        self._landmark_stale_edges.clear()
+        self._landmark_tables_outdated = False
+        if self._order:
+            self._recompute_landmark_tables(0, len(self._order) - 1)
+
+    def _refresh_landmarks(self):
+        if not self._landmarks or self._landmark_tables_outdated:
+            self.set_landmarks(self._landmarks or None)
+            return
+        if not self._landmark_stale_edges:
+            return
+        # A changed edge u -> v can only move distances from a landmark to v
+        # and its descendants, and distances to a landmark from u and its
+        # ancestors. Re-relax just those, and only past nodes whose
+        # distances actually moved.
+        heads = {to_id for _, to_id in self._landmark_stale_edges}
+        tails = {from_id for from_id, _ in self._landmark_stale_edges}
+        self._landmark_stale_edges.clear()
+        self._propagate_landmark_tables(heads, tails)
+
+    def _recompute_landmark_tables(self, first: int, last: int):
+        """Distances from the landmarks for order[first:], to them for order[:last + 1]."""
+        slot = {node_id: i for i, node_id in enumerate(self._landmarks)}
+        for node_id in self._order[first:]:
+            self._from_landmarks[node_id] = self._relax_from_landmarks(node_id, slot)
+        for node_id in reversed(self._order[:last + 1]):
+            self._to_landmarks[node_id] = self._relax_to_landmarks(node_id, slot)
+
+    def _propagate_landmark_tables(self, heads: Set[str], tails: Set[str]):
+        """
+        Re-relaxes the landmark distances from the heads downwards and to the
+        tails upwards. The queues pop in (reverse) topological order, so every
+        node is relaxed once, after all of its changed predecessors (successors).
+        """
+        slot = {node_id: i for i, node_id in enumerate(self._landmarks)}
+
+        queue = [self._position[node_id] for node_id in heads]
+        heapq.heapify(queue)
+        queued = set(heads)
+        while queue:
+            node_id = self._order[heapq.heappop(queue)]
+            distance = self._relax_from_landmarks(node_id, slot)
+            if np.array_equal(distance, self._from_landmarks[node_id]):
+                continue
+            self._from_landmarks[node_id] = distance
+            for to_id in self.edges[node_id]:
+                if to_id not in queued:
+                    queued.add(to_id)
+                    heapq.heappush(queue, self._position[to_id])
+
+        queue = [-self._position[node_id] for node_id in tails]
+        heapq.heapify(queue)
+        queued = set(tails)
+        while queue:
+            node_id = self._order[-heapq.heappop(queue)]
+            distance = self._relax_to_landmarks(node_id, slot)
+            if np.array_equal(distance, self._to_landmarks[node_id]):
+                continue
+            self._to_landmarks[node_id] = distance
+            for from_id in self._predecessors[node_id]:
+                if from_id not in queued:
+                    queued.add(from_id)
+                    heapq.heappush(queue, -self._position[from_id])
+
+    def _relax_from_landmarks(self, node_id: str, slot: Dict[str, int]) -> np.ndarray:
+        distance = np.full(len(self._landmarks), np.inf)
+        for from_id in self._predecessors[node_id]:
+            np.minimum(distance, self._from_landmarks[from_id]
+                       + self._edge_costs[(from_id, node_id)], out=distance)
+        if node_id in slot:
+            distance[slot[node_id]] = 0.0
+        return distance
+
+    def _relax_to_landmarks(self, node_id: str, slot: Dict[str, int]) -> np.ndarray:
+        distance = np.full(len(self._landmarks), np.inf)
+        for to_id in self.edges[node_id]:
+            np.minimum(distance, self._edge_costs[(node_id, to_id)]
+                       + self._to_landmarks[to_id], out=distance)
+        if node_id in slot:
+            distance[slot[node_id]] = 0.0
+        return distance
+
+    def _landmark_bound(self, node_id: str, target_id: str) -> float:
+        """ALT lower bound on d(node, target); inf when the target is unreachable."""
+        unreachable = np.full(len(self._landmarks), np.inf)
+        with np.errstate(invalid="ignore"):
+            bounds = np.concatenate([
+                self._from_landmarks.get(target_id, unreachable)
+                - self._from_landmarks.get(node_id, unreachable),
+                self._to_landmarks.get(node_id, unreachable)
+                - self._to_landmarks.get(target_id, unreachable),
+            ])
+        # inf - inf carries no information; +inf means a landmark reaches
+        # the target but not the node (or vice versa), so no path exists.
+        return float(np.max(bounds, initial=0.0, where=~np.isnan(bounds)))
+
+    def _astar_search(self, start_id: str, wanted: Set[str],
+                      filter_threshold: float) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """Goal-directed search to the single wanted node, guided by ALT bounds."""
+        self._refresh_landmarks()
+        (target_id,) = wanted
+        edge_costs = self._edge_costs
+        bound: Dict[str, float] = {}
+
+        # Priority Queue: (cost + lower bound, tiebreak, cost, current_node_id, predecessor_id)
+        tiebreak = count()
+        pq: List[Tuple[float, int, float, str, Optional[str]]] = [
+            (self._landmark_bound(start_id, target_id), next(tiebreak), 0.0, start_id, None)
+        ]
+        cost: Dict[str, float] = {}
+        parent: Dict[str, Optional[str]] = {}
         while pq:
-            current_cost, _, current_id, path, flashes = heapq.heappop(pq)
-
-            # Goal reached
+            _, _, current_cost, current_id, predecessor_id = heapq.heappop(pq)
+            if current_id in parent:
+                continue
+            parent[current_id] = predecessor_id
+            cost[current_id] = current_cost
             if current_id == target_id:
-                return {
-                    "path": path,
-                    "total_cost": current_cost,
-                    "flash_events": flashes
-                }
+                break
 
-            if current_id in visited:
+            for neighbor_id in self.edges[current_id]:
+                if neighbor_id in parent:
+                    continue
+                cost_i_j = edge_costs[(current_id, neighbor_id)]
+                # --- Semantic Filter Condition ---
+                if cost_i_j >= filter_threshold:
+                    continue
+                if neighbor_id not in bound:
+                    bound[neighbor_id] = self._landmark_bound(neighbor_id, target_id)
+                if bound[neighbor_id] == np.inf:
+                    continue
+                heapq.heappush(pq, (current_cost + cost_i_j + bound[neighbor_id], next(tiebreak),
+                                    current_cost + cost_i_j, neighbor_id, current_id))
+        return cost, parent
+
+    def _path_cost(self, path: List[str]) -> float:
+        """Cumulative cost along a path, summed in traversal order."""
+        total = 0.0
+        for edge in pairwise(path):
+            total += self._edge_costs[edge]
+        return total
+
+    def _result(self, path: List[str], total_cost: float,
+                flash_threshold: float) -> Dict[str, Any]:
+        flashes = (self._flash_event(i, j, flash_threshold) for i, j in pairwise(path))
+        return {
+            "path": path,
+            "total_cost": total_cost,
+            "flash_events": [flash for flash in flashes if flash is not None]
+        }
+
+    def _dijkstra_search(self, start_id: str, wanted: Optional[Set[str]],
+                         filter_threshold: float,
+                         banned: FrozenSet[Tuple[str, str]] = frozenset()
+                         ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """Settled costs and parent pointers from start_id, never using banned edges."""
+        edge_costs = self._edge_costs
+        remaining = 0 if wanted is None else len(wanted)
+
+        # Priority Queue: (cumulative_cost, tiebreak, current_node_id, predecessor_id)
+        # The monotonically increasing tiebreak keeps heapq from ever comparing
+        # node ids when costs are equal. Instead of carrying a copy of the path
+        # and flash log in every entry, a node records its predecessor when it
+        # is settled; paths and flash events are rebuilt from these at the end.
+        tiebreak = count()
+        pq: List[Tuple[float, int, str, Optional[str]]] = [(0.0, next(tiebreak), start_id, None)]
+        cost: Dict[str, float] = {}
+        parent: Dict[str, Optional[str]] = {}
+
+        while pq:
+            current_cost, _, current_id, predecessor_id = heapq.heappop(pq)
+
+            if current_id in parent:
                 continue
-            visited.add(current_id)
+            parent[current_id] = predecessor_id
+            cost[current_id] = current_cost
 
-            current_node = self.nodes[current_id]
-            neighbors = self.edges.get(current_id, [])
+            # Goal(s) reached
+            if wanted is not None and current_id in wanted:
+                remaining -= 1
+                if remaining == 0:
+                    break
 
-            for neighbor_id in neighbors:
-                if neighbor_id in visited:
+            for neighbor_id in self.edges.get(current_id, []):
+                if neighbor_id in parent or (banned and (current_id, neighbor_id) in banned):
                     continue
 
-                neighbor_node = self.nodes[neighbor_id]
-                cost_i_j = self.calculate_traversal_cost(current_node, neighbor_node)
+                cost_i_j = edge_costs[(current_id, neighbor_id)]
 
                 # --- Semantic Filter Condition ---
                 if cost_i_j >= filter_threshold:
                     # If cost exceeds threshold, the semantic filter rejects this transition
                     continue
 
-                # --- Flash Event Condition ---
-                entropy_gradient = current_node.H_S - neighbor_node.H_S  # Delta H
-                new_flashes = list(flashes)
-
-                if entropy_gradient > flash_threshold:
-                    new_flashes.append({
-                        "transition": f"{current_id} -> {neighbor_id}",
-                        "entropy_gradient": entropy_gradient,
-                        "event_type": "SEMANTIC_DISAMBIGUATION"
-                    })
-
                 # Push to priority queue
-                heapq.heappush(pq, (
-                    current_cost + cost_i_j,
-                    next(tiebreak),
-                    neighbor_id,
-                    path + [neighbor_id],
-                    new_flashes
-                ))
-
-        return None  # No valid path found within filter constraints
+                heapq.heappush(pq, (current_cost + cost_i_j, next(tiebreak), neighbor_id, current_id))
+
+        return cost, parent
+
+    def _dag_search(self, start_id: str, wanted: Optional[Set[str]],
+                    filter_threshold: float) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """Shortest filtered paths from start_id by relaxing edges in topological order."""
+        edge_costs = self._edge_costs
+        remaining = 0 if wanted is None else len(wanted)
+        cost: Dict[str, float] = {start_id: 0.0}
+        parent: Dict[str, Optional[str]] = {start_id: None}
+
+        # Every predecessor of a node precedes it, so a node's cost is final
+        # when the sweep reaches it; nodes before start_id are unreachable.
+        for current_id in self._order[self._position[start_id]:]:
+            if current_id not in cost:
+                continue
+            if wanted is not None and current_id in wanted:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            current_cost = cost[current_id]
+            for neighbor_id in self.edges[current_id]:
+                cost_i_j = edge_costs[(current_id, neighbor_id)]
+                # --- Semantic Filter Condition ---
+                if cost_i_j >= filter_threshold:
+                    continue
+                candidate = current_cost + cost_i_j
+                if candidate < cost.get(neighbor_id, np.inf):
+                    cost[neighbor_id] = candidate
+                    parent[neighbor_id] = current_id
+        return cost, parent
+
+    # --- Flash Event Condition ---
+    def _flash_event(self, from_id: str, to_id: str,
+                     flash_threshold: float) -> Optional[Dict[str, Any]]:
+        entropy_gradient = self.nodes[from_id].H_S - self.nodes[to_id].H_S  # Delta H
+        if entropy_gradient <= flash_threshold:
+            return None
+        return {
+            "transition": f"{from_id} -> {to_id}",
+            "entropy_gradient": entropy_gradient,
+            "event_type": "SEMANTIC_DISAMBIGUATION"
+        }
+
+    @staticmethod
+    def _rebuild_path(parent: Dict[str, Optional[str]], target_id: str) -> List[str]:
+        path = [target_id]
+        previous = parent[target_id]
+        while previous is not None:
+            path.append(previous)
+            previous = parent[previous]
+        path.reverse()
+        return path
+
+
+def _kahn_order(successors: Dict[str, List[str]]) -> List[str]:
+    """Topological order of an adjacency mapping; shorter than it if there is a cycle."""
+    indegree = dict.fromkeys(successors, 0)
+    for to_ids in successors.values():
+        for to_id in to_ids:
+            indegree[to_id] += 1
+    order = [node_id for node_id, degree in indegree.items() if degree == 0]
+    for node_id in order:
+        for to_id in successors[node_id]:
+            indegree[to_id] -= 1
+            if indegree[to_id] == 0:
+                order.append(to_id)
+    return order
 
 
 def _demo() -> None:
@@ -0,0 +1,215 @@
+"""A session's semantic DAG, grown one observation at a time.
+
+Instead of a throwaway three-node chain per decision, a session can keep one
+:class:`~obiai.epistemic.dag.EpistemicDAG` that every observation extends:
+the chain's intermediate and decision concepts are shared nodes whose
+beliefs are updated in place, and each observation adds its own source node
+with an edge into its intermediate concept. Concepts are never evicted;
+observation nodes are, least recently observed first, once the DAG exceeds
+its node budget.
+
+Concept nodes are keyed by role (``"<concept>@intermediate"`` and
+``"<concept>@decision"``). A concept's context entropy is fixed by its role,
+so a concept named by two mappings in different roles gets one node per role
+and its costs and flash events do not depend on which chain came first. Edges
+only ever run observation -> intermediate -> decision, so chains naming the
+same concepts in opposite roles (``X -> Y`` and ``Y -> X``) cannot close a
+cycle or overwrite each other's beliefs.
+
+Traversal results are memoized per ``(start, target)`` together with the
+region they were computed over -- every node reachable from ``start``. An
+edge cost, and hence a path, can only change when a node in that region
+changes belief, gains an edge or is removed, so only the entries whose region
+contains such a node are dropped. An observation node has a single outgoing
+edge, so its path is that edge followed by the memoized path from its
+intermediate concept, which repeated observations of the same chain reuse.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+
+from obiai.core.config import EpistemicSettings
+from obiai.epistemic.builder import (
+    CHAIN_ENTROPIES,
+    FlashEvent,
+    SemanticPathResult,
+    _chain_beliefs,
+    _path_result,
+)
+from obiai.epistemic.dag import EpistemicDAG, SemanticBeliefNode
+
+__all__ = ["SessionSemanticGraph"]
+
+DEFAULT_SESSION_NODES = 512
+INTERMEDIATE_ROLE = "intermediate"
+DECISION_ROLE = "decision"
+
+_PathKey = tuple[str, str]
+
+
+class SessionSemanticGraph:
+    """One session's incrementally extended semantic DAG with memoized paths."""
+
+    def __init__(self, settings: EpistemicSettings, max_nodes: int = DEFAULT_SESSION_NODES) -> None:
+        if max_nodes < 3:
+            raise ValueError(f"max_nodes must hold at least one chain (3 nodes), got {max_nodes}")
+        self.settings = settings
+        self.max_nodes = max_nodes
+        self.dag = EpistemicDAG(alpha=settings.alpha, beta=settings.beta)
+        # Observation node ids, least recently observed first.
+        self._observations: OrderedDict[str, None] = OrderedDict()
+        self._paths: dict[_PathKey, tuple[SemanticPathResult | None, frozenset[str]]] = {}
+        # Node -> memoized paths whose region contains it.
+        self._dependents: dict[str, set[_PathKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self.dag.nodes)
+
+    def observe(
+        self,
+        observation_id: str,
+        chain: Sequence[str],
+        posterior: float,
+        *,
+        source_belief: float = 0.85,
+    ) -> SemanticPathResult | None:
+        """Fold one observation into the DAG and traverse its chain.
+
+        The returned path names the chain's source concept rather than the
+        per-observation node, matching :class:`SemanticChainCache`.
+        """
+        source, intermediate, target = chain
+        source_P, intermediate_P, target_P = _chain_beliefs(source_belief, posterior)
+        _, intermediate_H, target_H = CHAIN_ENTROPIES
+        intermediate_id = _concept_id(intermediate, INTERMEDIATE_ROLE)
+        target_id = _concept_id(target, DECISION_ROLE)
+        self._set_concept(intermediate_id, intermediate_P, intermediate_H)
+        self._set_concept(target_id, target_P, target_H)
+        self._add_edge(intermediate_id, target_id)
+
+        node_id = f"{source}#{observation_id}"
+        if node_id in self._observations:
+            self._observations.move_to_end(node_id)
+            self._set_belief(node_id, source_P)
+        else:
+            self.dag.add_node(SemanticBeliefNode(node_id, P=source_P, H_S=CHAIN_ENTROPIES[0]))
+            self._observations[node_id] = None
+        self._add_edge(node_id, intermediate_id)
+        self._evict()
+
+        # --- Semantic Filter Condition ---
+        cost = self.dag.edge_cost(node_id, intermediate_id)
+        if cost >= self.settings.filter_threshold:
+            return None
+        rest = self.traverse(intermediate, target)
+        if rest is None:
+            return None
+        gradient = self.dag.nodes[node_id].H_S - self.dag.nodes[intermediate_id].H_S
+        first = (
+            [FlashEvent(transition=f"{source} -> {intermediate}", entropy_gradient=gradient)]
+            if gradient > self.settings.flash_threshold
+            else []
+        )
+        return SemanticPathResult(
+            path=[source, *rest.path],
+            total_cost=cost + rest.total_cost,
+            flash_events=[*first, *rest.flash_events],
+        )
+
+    def traverse(self, intermediate: str, target: str) -> SemanticPathResult | None:
+        """Filter-Flash path from an intermediate concept to a decision concept.
+
+        The result names concepts, not role-keyed nodes, and is reused until
+        its region changes.
+        """
+        start = _concept_id(intermediate, INTERMEDIATE_ROLE)
+        key = (start, _concept_id(target, DECISION_ROLE))
+        cached = self._paths.get(key)
+        if cached is not None:
+            return cached[0]
+        raw = self.dag.filter_flash_traversal(
+            start_id=start,
+            target_id=key[1],
+            filter_threshold=self.settings.filter_threshold,
+            flash_threshold=self.settings.flash_threshold,
+            algorithm=self.settings.algorithm,
+        )
+        result = None if raw is None else _path_result(_concept_names(raw))
+        region = self._reachable(start)
+        self._paths[key] = (result, region)
+        for node_id in region:
+            self._dependents.setdefault(node_id, set()).add(key)
+        return result
+
+    # --- Incremental updates ---
+
+    def _set_concept(self, node_id: str, P: np.ndarray, H_S: float) -> None:
+        if node_id in self.dag.nodes:
+            self._set_belief(node_id, P)
+        else:
+            self.dag.add_node(SemanticBeliefNode(node_id, P=P, H_S=H_S))
+
+    def _set_belief(self, node_id: str, P: np.ndarray) -> None:
+        if np.array_equal(self.dag.nodes[node_id].P, P):
+            return
+        self.dag.update_belief(node_id, P=P)
+        self._changed(node_id)
+
+    def _add_edge(self, from_id: str, to_id: str) -> None:
+        if to_id in self.dag.edges[from_id]:
+            return
+        self.dag.add_edge(from_id, to_id)
+        self._changed(from_id)
+
+    def _evict(self) -> None:
+        while len(self.dag.nodes) > self.max_nodes and len(self._observations) > 1:
+            node_id, _ = self._observations.popitem(last=False)
+            self._changed(node_id)
+            self.dag.remove_node(node_id)
+
+    def _changed(self, node_id: str) -> None:
+        # Any path whose region reaches this node may now differ.
+        for key in self._dependents.pop(node_id, ()):
+            _, region = self._paths.pop(key)
+            for other in region:
+                if other != node_id:
+                    self._dependents[other].discard(key)
+
+    def _reachable(self, start: str) -> frozenset[str]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for to_id in self.dag.edges[stack.pop()]:
+                if to_id not in seen:
+                    seen.add(to_id)
+                    stack.append(to_id)
+        return frozenset(seen)
+
+
+def _concept_id(concept: str, role: str) -> str:
+    return f"{concept}@{role}"
+
+
+def _concept_name(node_id: str) -> str:
+    return node_id.rsplit("@", 1)[0]
+
+
+def _concept_names(raw: dict) -> dict:
+    # Traversal output in concept names rather than role-keyed node ids.
+    return {
+        **raw,
+        "path": [_concept_name(node_id) for node_id in raw["path"]],
+        "flash_events": [
+            {
+                **event,
+                "transition": " -> ".join(
+                    _concept_name(node_id) for node_id in event["transition"].split(" -> ")
+                ),
+            }
+            for event in raw["flash_events"]
+        ],
+    }
@@ -8,22 +8,72 @@ class Ontology:
 
     def __init__(self) -> None:
         self.graph = nx.MultiDiGraph()
+        # Bumped by every mutation made through add_concept/relate; path
+        # queries rebuild their collapsed DiGraph only when it has moved.
+        self.version = 0
+        self._projection = nx.DiGraph()
+        self._projection_version = 0
+        # Transitive closure as int bitsets over concept indices, maintained
+        # on every relate: bit j of _reach[i] means concept i reaches j, and
+        # _reached_by is its transpose.
+        self._index: dict[str, int] = {}
+        self._reach: list[int] = []
+        self._reached_by: list[int] = []
 
     def add_concept(self, name: str, **attributes: object) -> None:
         self.graph.add_node(name, **attributes)
+        if name not in self._index:
+            self._index[name] = len(self._reach)
+            self._reach.append(0)
+            self._reached_by.append(0)
+        self.version += 1
 
     def relate(self, subject: str, relation: str, obj: str, **attributes: object) -> None:
         self.add_concept(subject)
         self.add_concept(obj)
         self.graph.add_edge(subject, obj, key=relation, relation=relation, **attributes)
+        self._close(self._index[subject], self._index[obj])
+        self.version += 1
+
+    def _close(self, i: int, j: int) -> None:
+        if self._reach[i] >> j & 1:
+            return
+        # Everything reaching i (and i) now reaches everything j reaches (and j).
+        sources = self._reached_by[i] | 1 << i
+        sinks = self._reach[j] | 1 << j
+        for k in _bits(sources):
+            self._reach[k] |= sinks
+        for k in _bits(sinks):
+            self._reached_by[k] |= sources
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether any relation path leads from ``source`` to ``target``, in O(1).
+
+        A concept trivially reaches itself; unknown concepts reach nothing.
+        """
+        i = self._index.get(source)
+        j = self._index.get(target)
+        if i is None or j is None:
+            return False
+        return i == j or bool(self._reach[i] >> j & 1)
+
+    def projection(self) -> nx.DiGraph:
+        """The graph with parallel relations collapsed, cached until the next mutation.
+
+        Shared between calls: treat it as read-only.
+        """
+        if self._projection_version != self.version:
+            self._projection = nx.DiGraph(self.graph)
+            self._projection_version = self.version
+        return self._projection
 
     def ancestors(self, concept: str) -> set[str]:
-        return nx.ancestors(nx.DiGraph(self.graph), concept)
+        return nx.ancestors(self.projection(), concept)
 
     def paths(self, source: str, target: str, cutoff: int = 6) -> list[list[str]]:
-        graph = nx.DiGraph(self.graph)
-        if source not in graph or target not in graph:
+        if not self.reaches(source, target):
             return []
+        graph = self.projection()
         return list(nx.all_simple_paths(graph, source, target, cutoff=cutoff))
 
     def explain_relation(self, source: str, target: str) -> list[str]:
@@ -31,3 +81,12 @@ class Ontology:
         for path in self.paths(source, target):
             explanations.append(" -> ".join(path))
         return explanations
+
+
+def _bits(mask: int) -> list[int]:
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
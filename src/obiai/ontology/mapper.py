@@ -54,6 +54,10 @@ class EventOntologyMapper:
     def known_event_types(self) -> list[str]:
         return sorted(self._registry)
 
+    @property
+    def known_propositions(self) -> list[str]:
+        return sorted({m.proposition for m in self._registry.values()})
+
     def register(self, mapping: EventMapping) -> None:
         self._registry[mapping.event_type] = mapping
 
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 
 from obiai.api.app import create_app
 from obiai.core.config import Settings
+from obiai.core.models import ObservationIn
 
 
 @pytest.fixture()
@@ -160,3 +163,43 @@ def test_chat_explains_how_u_is_working(client: TestClient) -> None:
     assert reply["type"] == "agent.message"
     assert "browser vision emits observable events" in reply["text"]
     assert "obi-uagentic-0.1.1.pkl" in reply["text"]
+
+
+def test_service_monitors_parity_of_labelled_decisions(client: TestClient) -> None:
+    service = client.app.state.service
+    session_id = _create_session(client)
+
+    async def scenario() -> None:
+        for group, value in [("a", True), ("a", True), ("b", True), ("b", False), (None, False)]:
+            await service.handle_observation(
+                session_id, ObservationIn(**{**OBSERVATION, "value": value}), group=group
+            )
+
+    asyncio.run(scenario())
+    assert service.parity.positive_rates() == {"a": 1.0, "b": 0.5}
+    report = service.parity_report()
+    assert report.parity_gap == pytest.approx(0.5)
+    assert not report.passed
+
+
+def test_parity_report_follows_labelled_observations(client: TestClient) -> None:
+    assert client.get("/bias/parity").json()["parity_gap"] is None
+    session_id = _create_session(client)
+    for group, value in [("a", True), ("b", False), (None, False)]:
+        observation = {**OBSERVATION, "value": value, "group": group}
+        response = client.post(f"/sessions/{session_id}/observations", json=observation)
+        assert response.status_code == 201
+    with client.websocket_connect(f"/ws/sessions/{session_id}") as ws:
+        ws.receive_json()  # session.ready
+        ws.send_json({"type": "observation.submit", "observation": {**OBSERVATION, "group": "b"}})
+        events = [ws.receive_json()["type"] for _ in range(5)]
+        assert events[-1] == "agent.message"
+
+    assert client.app.state.service.parity.positive_rates() == {"a": 1.0, "b": 0.5}
+    report = client.get("/bias/parity").json()
+    assert report["parity_gap"] == pytest.approx(0.5)
+    assert report["passed"] is False
+    unlabelled = client.post(
+        f"/sessions/{session_id}/observations", json={**OBSERVATION, "group": ""}
+    )
+    assert unlabelled.status_code == 422
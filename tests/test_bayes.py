@@ -1,3 +1,18 @@
+import random
+from itertools import product
+
+import numpy as np
+import pytest
+
+from obiai.bayes import (
+    BayesianNetwork,
+    BinaryNode,
+    LogisticNode,
+    NoisyAndNode,
+    NoisyOrNode,
+    ParametricNode,
+)
+from obiai.bayesian.pruning import barren_pruned, relevant_subnetwork
 from obiai.demo import build_demo_agent
 
 
@@ -6,3 +21,282 @@ def test_known_evidence_produces_high_probability() -> None:
     decision = agent.reason("wet_grass", {"rain": True, "sprinkler": False})
     assert decision.probability == 0.8
     assert decision.state.value == "YES"
+
+
+def _random_network(
+    n_nodes: int, max_parents: int, seed: int, inference: str = "enumerate"
+) -> BayesianNetwork:
+    rng = random.Random(seed)
+    network = BayesianNetwork(inference=inference)
+    for i in range(n_nodes):
+        earlier = [f"x{j}" for j in range(i)]
+        parents = tuple(rng.sample(earlier, min(len(earlier), rng.randint(0, max_parents))))
+        cpt = {key: rng.uniform(0.05, 0.95) for key in product([False, True], repeat=len(parents))}
+        network.add(BinaryNode(f"x{i}", parents=parents, cpt=cpt))
+    return network
+
+
+def _with_inference(network: BayesianNetwork, inference: str) -> BayesianNetwork:
+    copy = BayesianNetwork(inference=inference)
+    for node in network.nodes.values():
+        copy.add(node)
+    return copy
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_variable_elimination_matches_enumeration(seed: int) -> None:
+    reference = _random_network(9, 3, seed)
+    ve = _with_inference(reference, "ve")
+    rng = random.Random(seed)
+    for target in reference.nodes:
+        observed = rng.sample([n for n in reference.nodes if n != target], 3)
+        evidence = {name: rng.random() < 0.5 for name in observed}
+        assert ve.query(target, evidence) == pytest.approx(
+            reference.query(target, evidence), abs=1e-12
+        )
+        assert ve.probability_of(evidence) == pytest.approx(
+            reference.probability_of(evidence), abs=1e-12
+        )
+
+
+def test_variable_elimination_scales_to_wide_networks() -> None:
+    # A 48-node chain with side observations is intractable by enumeration
+    # (2^47 assignments) but has elimination width 2.
+    network = BayesianNetwork(inference="ve")
+    network.add(BinaryNode("c0", cpt={(): 0.3}))
+    for i in range(1, 24):
+        network.add(BinaryNode(f"c{i}", parents=(f"c{i-1}",), cpt={(True,): 0.9, (False,): 0.2}))
+    for i in range(24):
+        network.add(BinaryNode(f"o{i}", parents=(f"c{i}",), cpt={(True,): 0.8, (False,): 0.1}))
+    evidence = {f"o{i}": i % 3 == 0 for i in range(24)}
+    posterior = network.query("c0", evidence)
+    assert 0.0 < posterior < 1.0
+
+    # Cross-check on the first three links against enumeration.
+    small = BayesianNetwork()
+    for name in ("c0", "c1", "c2", "o0", "o1", "o2"):
+        small.add(network.nodes[name])
+    partial = {k: evidence[k] for k in ("o0", "o1", "o2")}
+    sub_ve = _with_inference(small, "ve")
+    assert sub_ve.query("c0", partial) == pytest.approx(small.query("c0", partial), abs=1e-12)
+
+
+def test_elimination_order_cached_per_evidence_signature() -> None:
+    network = _random_network(8, 2, seed=11, inference="ve")
+    network.query("x7", {"x0": True, "x3": False})
+    network.query("x7", {"x0": False, "x3": True})
+    engine = network._pruned_engine("x7", {"x0": True, "x3": False})
+    assert len(network._pruned) == 1
+    assert len(engine._orders) == 1
+    network.add(BinaryNode("x8", parents=("x7",), cpt={(True,): 0.5, (False,): 0.5}))
+    assert network._engine_cache is None
+    assert not network._pruned
+
+
+def test_unknown_inference_method_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown inference method"):
+        BayesianNetwork(inference="gibbs")
+
+
+def test_compiled_table_indexed_by_parent_bits() -> None:
+    node = BinaryNode("wet", parents=("rain", "sprinkler"), cpt={
+        (False, False): 0.01, (False, True): 0.9, (True, False): 0.8, (True, True): 0.99,
+    })
+    table = node.compile()
+    assert table.shape == (2, 2)
+    assert table[1, 0] == 0.8
+    assert node.p_true([np.array([True, False]), np.array([False, True])]).tolist() == [0.8, 0.9]
+
+
+def test_vectorized_joint_matches_per_assignment_product() -> None:
+    network = _random_network(6, 3, seed=3)
+    names = list(network.nodes)
+    rows = np.array(list(product([False, True], repeat=len(names))))
+    joint = network.joint({name: rows[:, i] for i, name in enumerate(names)})
+    for row, value in zip(rows, joint):
+        assignment = dict(zip(names, row.tolist()))
+        expected = 1.0
+        for node in network.nodes.values():
+            expected *= node.probability(assignment[node.name], assignment)
+        assert value == pytest.approx(expected, abs=1e-15)
+    assert joint.sum() == pytest.approx(1.0, abs=1e-12)
+
+
+def test_compile_picks_up_in_place_cpt_edits() -> None:
+    network = BayesianNetwork()
+    network.add(BinaryNode("a", cpt={(): 0.2}))
+    network.add(BinaryNode("b", parents=("a",), cpt={(True,): 0.9, (False,): 0.1}))
+    assert network.probability_of({"b": True}) == pytest.approx(0.26)
+    network.nodes["a"].cpt[()] = 0.5
+    network.compile()
+    assert network.probability_of({"b": True}) == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_junction_tree_matches_enumeration(seed: int) -> None:
+    reference = _random_network(9, 3, seed)
+    tree = _with_inference(reference, "enumerate")
+    compiled = tree.compile_junction_tree()
+    assert tree.inference == "junction_tree"
+    rng = random.Random(seed)
+    for target in reference.nodes:
+        observed = rng.sample([n for n in reference.nodes if n != target], 3)
+        evidence = {name: rng.random() < 0.5 for name in observed}
+        assert tree.query(target, evidence) == pytest.approx(
+            reference.query(target, evidence), abs=1e-12
+        )
+        assert tree.probability_of(evidence) == pytest.approx(
+            reference.probability_of(evidence), abs=1e-12
+        )
+    # Queries that could prune still run on the compiled tree.
+    assert all(engine is compiled for engine in tree._pruned.values())
+
+
+def test_junction_tree_reuses_messages_untouched_by_new_evidence() -> None:
+    network = BayesianNetwork(inference="junction_tree")
+    network.add(BinaryNode("c0", cpt={(): 0.3}))
+    for i in range(1, 21):
+        network.add(BinaryNode(f"c{i}", parents=(f"c{i-1}",), cpt={(True,): 0.9, (False,): 0.2}))
+    for end in ("c0", "c20"):
+        network.add(BinaryNode(f"o_{end}", parents=(end,), cpt={(True,): 0.8, (False,): 0.1}))
+    network.query("c10", {"o_c0": True, "o_c20": True})
+    tree = network._engine()
+    first_pass = len(tree._messages)
+
+    # Changing the evidence at one end only recomputes the messages flowing
+    # out of that half of the chain; the other half is served from cache.
+    posterior = network.query("c10", {"o_c0": False, "o_c20": True})
+    recomputed = len(tree._messages) - first_pass
+    assert 0 < recomputed < first_pass
+    reference = BayesianNetwork(inference="ve")
+    for node in network.nodes.values():
+        reference.add(node)
+    assert posterior == pytest.approx(
+        reference.query("c10", {"o_c0": False, "o_c20": True}), abs=1e-12
+    )
+
+
+def test_query_many_scatters_distinct_rows() -> None:
+    network = build_demo_agent().network
+    rows = np.array([[True, False], [False, False], [True, False], [False, True]] * 250)
+    posteriors = network.query_many("wet_grass", rows, ["rain", "sprinkler"])
+    assert posteriors.shape == (1000,)
+    for row, value in zip(rows[:4], posteriors[:4]):
+        evidence = {"rain": bool(row[0]), "sprinkler": bool(row[1])}
+        assert value == network.query("wet_grass", evidence)
+    with pytest.raises(ValueError, match="shape"):
+        network.query_many("wet_grass", rows, ["rain"])
+
+
+def _brute_force_mass(network: BayesianNetwork, fixed: dict[str, bool]) -> float:
+    names = list(network.nodes)
+    total = 0.0
+    for values in product([False, True], repeat=len(names)):
+        assignment = dict(zip(names, values))
+        if any(assignment[k] != v for k, v in fixed.items()):
+            continue
+        mass = 1.0
+        for node in network.nodes.values():
+            mass *= node.probability(assignment[node.name], assignment)
+        total += mass
+    return total
+
+
+@pytest.mark.parametrize("inference", ["enumerate", "ve", "junction_tree"])
+@pytest.mark.parametrize("seed", range(8))
+def test_pruned_queries_match_unpruned_reference(inference: str, seed: int) -> None:
+    network = _random_network(10, 3, seed=seed, inference=inference)
+    rng = random.Random(100 + seed)
+    names = list(network.nodes)
+    for _ in range(4):
+        target = rng.choice(names)
+        observed = rng.sample([n for n in names if n != target], rng.randint(0, 4))
+        evidence = {name: rng.random() < 0.5 for name in observed}
+        joint_true = _brute_force_mass(network, {**evidence, target: True})
+        expected = joint_true / _brute_force_mass(network, evidence)
+        assert network.query(target, evidence) == pytest.approx(expected, abs=1e-12)
+        assert network.probability_of(evidence) == pytest.approx(
+            _brute_force_mass(network, evidence), abs=1e-12
+        )
+
+
+def test_pruning_drops_barren_and_d_separated_nodes() -> None:
+    parents = {
+        "a": (),
+        "b": ("a",),
+        "c": ("b",),
+        "d": ("c",),
+        "barren": ("d",),
+        "e": (),
+        "f": ("e", "c"),
+    }
+    assert list(barren_pruned(parents, "c", ["b"])) == ["a", "b", "c"]
+    # Observing b blocks the chain a -> b -> c: a is d-separated from c.
+    pruned, placeholders = relevant_subnetwork(parents, "c", ["b"])
+    assert pruned == {"b": (), "c": ("b",)}
+    assert placeholders == {"b"}
+    # Observing the collider f opens e -> f <- c, so e stays relevant.
+    pruned, placeholders = relevant_subnetwork(parents, "e", ["f", "b"])
+    assert set(pruned) == {"b", "c", "e", "f"}
+    assert placeholders == {"b"}
+    # Only ancestors of the evidence matter for P(evidence).
+    assert list(barren_pruned(parents, None, ["c"])) == ["a", "b", "c"]
+
+
+def _noisy_network(inference: str, n_parents: int) -> BayesianNetwork:
+    network = BayesianNetwork(inference=inference)
+    for i in range(n_parents):
+        network.add(BinaryNode(f"cue{i}", cpt={(): 0.1 + 0.8 * i / max(n_parents - 1, 1)}))
+    cues = tuple(f"cue{i}" for i in range(n_parents))
+    strengths = tuple(0.2 + 0.6 * ((7 * i) % n_parents) / n_parents for i in range(n_parents))
+    network.add(NoisyOrNode("turn", cues, strengths, leak=0.05))
+    network.add(NoisyAndNode("speak", ("turn", "cue0"), (0.7, 0.4), leak=0.1))
+    network.add(LogisticNode("nod", ("turn", "cue1"), (2.0, -1.0), bias=-0.5))
+    return network
+
+
+@pytest.mark.parametrize("inference", ["enumerate", "ve", "junction_tree"])
+def test_parametric_nodes_match_brute_force(inference: str) -> None:
+    network = _noisy_network(inference, 5)
+    for target, evidence in [
+        ("turn", {"speak": True}),
+        ("cue2", {"nod": True, "speak": False}),
+        ("cue0", {"turn": True, "cue1": False}),
+    ]:
+        expected = _brute_force_mass(network, {**evidence, target: True}) / _brute_force_mass(
+            network, evidence
+        )
+        assert network.query(target, evidence) == pytest.approx(expected, abs=1e-12)
+
+
+def test_noisy_or_closed_form_and_dense_table() -> None:
+    node = NoisyOrNode("y", ("a", "b"), (0.6, 0.3), leak=0.1)
+    assert node.compile().ravel().tolist() == pytest.approx(
+        [0.1, 1 - 0.9 * 0.7, 1 - 0.9 * 0.4, 1 - 0.9 * 0.4 * 0.7]
+    )
+    gate = NoisyAndNode("z", ("a", "b"), (0.6, 0.3), leak=0.1)
+    assert gate.p_true([True, True]) == pytest.approx(0.9)
+    assert gate.p_true([False, True]) == pytest.approx(0.9 * 0.4)
+    with pytest.raises(ValueError, match="parameters"):
+        NoisyOrNode("y", ("a", "b"), (0.5,))
+    with pytest.raises(TypeError, match="abstract"):
+        ParametricNode("y", ())  # type: ignore[abstract]
+
+
+def test_noisy_or_fan_in_stays_factorized() -> None:
+    n_parents = 24
+    network = _noisy_network("ve", n_parents)
+    parents, tables = network.engine_inputs()
+    assert max(table.ndim for table in tables.values()) <= 2
+    # One accumulator per noisy-OR and noisy-AND parent (24 + 2).
+    assert len(parents) == len(network.nodes) + n_parents + 2
+
+    # Parents independent a priori: P(turn) = 1 - (1 - leak) * prod(1 - p_i P(cue_i)).
+    node = network.nodes["turn"]
+    priors = [network.nodes[cue].cpt[()] for cue in node.parents]
+    off = (1 - node.leak) * np.prod([1 - q * prior for q, prior in zip(node.p, priors)])
+    assert network.query("turn", {}) == pytest.approx(1 - off, abs=1e-12)
+    tree = _noisy_network("junction_tree", n_parents)
+    assert tree.query("cue3", {"turn": True}) == pytest.approx(
+        network.query("cue3", {"turn": True}), abs=1e-12
+    )
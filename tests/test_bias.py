@@ -1,4 +1,19 @@
-from obiai.bias import BiasAuditor
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from obiai.bias import BiasAuditor, ParityMonitor
+from obiai.bias.metrics import (
+    bootstrap_ci,
+    calibration_within_groups,
+    demographic_parity_gap,
+    equalized_odds_gap,
+    group_codes,
+    group_means,
+    phi_posterior_shift,
+)
 from obiai.ontology import Ontology
 
 
@@ -9,3 +24,185 @@ def test_protected_path_is_detected() -> None:
     report = BiasAuditor(["disability"]).audit_paths(ontology, "decision")
     assert not report.passed
     assert report.protected_paths == [["disability", "score", "decision"]]
+
+
+def test_path_queries_reuse_the_projection_until_the_ontology_changes() -> None:
+    ontology = Ontology()
+    ontology.relate("disability", "influences", "score")
+    ontology.relate("disability", "correlates", "score")
+    projection = ontology.projection()
+    assert projection.number_of_edges() == 1
+    assert ontology.paths("disability", "score") == [["disability", "score"]]
+    assert ontology.projection() is projection
+
+    ontology.relate("score", "controls", "decision")
+    assert ontology.projection() is not projection
+    assert ontology.ancestors("decision") == {"disability", "score"}
+
+
+def test_reachability_index_matches_graph_search() -> None:
+    rng = random.Random(7)
+    ontology = Ontology()
+    concepts = [f"c{i}" for i in range(30)]
+    for _ in range(60):  # cycles included
+        ontology.relate(rng.choice(concepts), "rel", rng.choice(concepts))
+        graph = ontology.projection()
+        for source in graph:
+            for target in graph:
+                assert ontology.reaches(source, target) == nx.has_path(graph, source, target)
+    assert not ontology.reaches("c0", "unknown")
+
+
+def test_audit_enumerates_paths_only_for_reaching_attributes(monkeypatch) -> None:
+    ontology = Ontology()
+    ontology.relate("age", "influences", "preference")
+    ontology.relate("score", "controls", "decision")
+
+    enumerated: list[str] = []
+    paths = ontology.paths
+
+    def counting_paths(source: str, target: str, cutoff: int = 6) -> list[list[str]]:
+        enumerated.append(source)
+        return paths(source, target, cutoff)
+
+    monkeypatch.setattr(ontology, "paths", counting_paths)
+    report = BiasAuditor(["age", "disability"]).audit_paths(ontology, "decision")
+    assert report.passed
+    assert report.protected_paths == []
+    assert enumerated == []
+
+    ontology.relate("preference", "feeds", "score")
+    report = BiasAuditor(["age", "disability"]).audit_paths(ontology, "decision")
+    assert not report.passed
+    assert report.protected_paths == [["age", "preference", "score", "decision"]]
+    assert enumerated == ["age"]
+
+
+def _stream(n: int = 500) -> list[tuple[str, bool]]:
+    rng = random.Random(3)
+    return [(rng.choice("abc"), rng.random() < 0.3 + 0.2 * (i > n // 2)) for i in range(n)]
+
+
+def _rates(weighted: list[tuple[str, bool, float]]) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    positives: dict[str, float] = {}
+    for group, positive, weight in weighted:
+        totals[group] = totals.get(group, 0.0) + weight
+        positives[group] = positives.get(group, 0.0) + weight * positive
+    # Decayed groups fall silent below 1e-9 of a fresh decision's weight.
+    return {group: positives[group] / total for group, total in totals.items() if total >= 1e-9}
+
+
+@pytest.mark.parametrize(
+    ("half_life", "window"), [(None, None), (25.0, None), (0.5, None), (None, 40)]
+)
+def test_parity_monitor_matches_recomputation(half_life: float | None, window: int | None) -> None:
+    stream = _stream()
+    monitor = ParityMonitor(half_life=half_life, window=window)
+    for t, (group, positive) in enumerate(stream, start=1):
+        monitor.record(group, positive)
+        kept = stream[:t] if window is None else stream[max(0, t - window) : t]
+        weighted = [
+            (g, p, 1.0 if half_life is None else 2.0 ** (-(len(kept) - 1 - k) / half_life))
+            for k, (g, p) in enumerate(kept)
+        ]
+        expected = _rates(weighted)
+        assert monitor.positive_rates() == pytest.approx(expected)
+    report = monitor.report()
+    gap = max(expected.values()) - min(expected.values())
+    assert report.parity_gap == pytest.approx(gap)
+    assert report == BiasAuditor([]).demographic_parity(monitor.positive_rates())
+
+
+def test_decayed_parity_monitor_forgets_quiet_groups() -> None:
+    monitor = ParityMonitor(half_life=25.0)
+    monitor.record("a", True)
+    for _ in range(1000):
+        monitor.record("b", False)
+    assert monitor.positive_rates() == {"b": 0.0}
+    # Long enough for several renormalizations, where "a" would underflow.
+    for _ in range(40_000):
+        monitor.record("b", False)
+    assert monitor.positive_rates() == {"b": 0.0}
+    assert monitor.report().parity_gap is None
+    monitor.record("a", True)
+    assert monitor.report().parity_gap == 1.0
+
+
+def test_parity_monitor_rejects_conflicting_variants() -> None:
+    with pytest.raises(ValueError, match="either"):
+        ParityMonitor(half_life=10.0, window=10)
+    with pytest.raises(ValueError, match="window"):
+        ParityMonitor(window=0)
+
+
+def _audit_data(n: int = 400) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(11)
+    groups = rng.integers(0, 3, n)
+    labels = rng.random(n) < 0.3 + 0.1 * groups
+    scores = np.clip(rng.random(n) * 0.6 + 0.3 * labels, 0.0, 1.0)
+    return scores, labels, groups
+
+
+def test_fairness_metrics_match_per_group_loops() -> None:
+    scores, labels, groups = _audit_data()
+    predictions = scores > 0.5
+    members = [groups == g for g in range(3)]
+
+    means = [scores[m].mean() for m in members]
+    assert demographic_parity_gap(scores, groups) == pytest.approx(max(means) - min(means))
+
+    tpr = [predictions[m & labels].mean() for m in members]
+    fpr = [predictions[m & ~labels].mean() for m in members]
+    assert equalized_odds_gap(predictions, labels, groups) == pytest.approx(
+        max(max(tpr) - min(tpr), max(fpr) - min(fpr))
+    )
+
+    bins = np.minimum((scores * 5).astype(int), 4)
+    expected = [
+        sum(abs(scores[m & (bins == b)].sum() - labels[m & (bins == b)].sum()) for b in range(5))
+        / m.sum()
+        for m in members
+    ]
+    assert calibration_within_groups(scores, labels, groups, n_bins=5) == pytest.approx(expected)
+
+    phi = np.stack([scores, 1.0 - scores], axis=1)
+    shift = phi_posterior_shift(phi, groups)
+    assert shift.shape == (3, 2)
+    assert shift[:, 0] == pytest.approx([scores[m].mean() - scores.mean() for m in members])
+    assert shift[:, 1] == pytest.approx(-shift[:, 0])
+    batched = phi_posterior_shift(np.stack([phi, phi[::-1]]), np.stack([groups, groups[::-1]]))
+    assert batched.shape == (2, 3, 2)
+    assert batched[0] == pytest.approx(shift)
+    assert batched[1] == pytest.approx(shift)
+
+
+def test_fairness_metrics_handle_labels_and_empty_groups() -> None:
+    codes, names = group_codes(["b", "a", "b", "c"])
+    assert names.tolist() == ["a", "b", "c"]
+    assert demographic_parity_gap([1.0, 0.0, 0.5, 0.2], codes) == pytest.approx(0.75)
+    assert np.isnan(demographic_parity_gap([1.0, 0.0], [0, 0], n_groups=3))
+    means, counts = group_means([1.0, 3.0], [2, 2], n_groups=3)
+    assert counts.tolist() == [0.0, 0.0, 2.0]
+    assert np.isnan(means[:2]).all() and means[2] == 2.0
+
+
+def test_bootstrap_ci_batches_resamples_through_the_metric() -> None:
+    scores, labels, groups = _audit_data()
+    point = demographic_parity_gap(scores, groups)
+    low, high = bootstrap_ci(
+        demographic_parity_gap, scores, groups, n_resamples=300, seed=5, batch_size=64
+    )
+    assert low < point < high
+    assert (low, high) == bootstrap_ci(
+        demographic_parity_gap, scores, groups, n_resamples=300, seed=5, batch_size=64
+    )
+
+    index = np.random.default_rng(0).integers(0, len(groups), size=(4, len(groups)))
+    batched = equalized_odds_gap(scores[index] > 0.5, labels[index], groups[index], n_groups=3)
+    assert batched == pytest.approx(
+        [equalized_odds_gap(scores[i] > 0.5, labels[i], groups[i], n_groups=3) for i in index]
+    )
+    low, high = bootstrap_ci(calibration_within_groups, scores, labels, groups, n_resamples=50)
+    assert low.shape == high.shape == (3,)
+    assert (low <= high).all()
@@ -87,6 +87,122 @@ def test_bias_failure_withholds() -> None:
 def test_explanation_traces_phi_and_flash(engine) -> None:
     decision = engine.reason("session-001", _observation())
     text = " ".join(decision.explanation)
-    assert "P(phi | evidence)" in text
+    assert "P(phi | 1 session observation)" in text
     assert "Flash: observation.hand_raised -> communication.request_turn" in text
     assert "Selected action: announce_hand_raise." in text
+
+
+def test_phi_belief_accumulates_per_session(engine) -> None:
+    engine.reason("session-001", _observation())
+    state = engine.phi_state("session-001")
+    assert state is not None
+    assert state.posterior()["calibrated"] == pytest.approx(0.45 / 0.505, abs=1e-12)
+
+    # A second raised hand: each phi's likelihood is P(D=true | phi), now
+    # weighted by the belief carried over from the first observation.
+    second = engine.reason("session-001", _observation())
+    expected = 0.9 * 0.5 * 0.5 / (0.9 * 0.5 * 0.5 + 0.1 * 0.55 * 0.55)
+    assert state.posterior()["calibrated"] == pytest.approx(expected, abs=1e-12)
+    assert second.probability == pytest.approx(
+        expected * 0.97 + (1 - expected) * 7 / 11, abs=1e-12
+    )
+    assert state.observations == 2
+
+    # Re-reasoning about the latest observation does not fold it in again.
+    third = _observation()
+    first_run = engine.reason("session-001", third)
+    assert engine.reason("session-001", third).probability == first_run.probability
+    assert state.observations == 3
+    assert "P(phi | 3 session observations)" in " ".join(first_run.explanation)
+
+    # Other sessions start from the prior; forgetting drops the state.
+    assert engine.reason("session-002", _observation()).probability == pytest.approx(
+        POSTERIOR_TRUE, abs=1e-12
+    )
+    engine.forget_session("session-001")
+    assert engine.phi_state("session-001") is None
+
+
+def test_replaying_an_earlier_observation_is_not_double_counted(engine) -> None:
+    earlier = _observation()
+    first = engine.reason("session-001", earlier)
+    engine.reason("session-001", _observation(value=False))
+    state = engine.phi_state("session-001")
+    posterior = state.posterior()
+
+    replay = engine.reason("session-001", earlier)
+    assert replay.probability == first.probability
+    assert replay.explanation == first.explanation
+    assert state.observations == 2
+    assert state.posterior() == posterior
+
+
+def test_tracked_phi_sessions_are_bounded(engine) -> None:
+    engine.max_sessions = 2
+    for session_id in ("s1", "s2", "s1", "s3"):
+        engine.reason(session_id, _observation())
+    assert engine.phi_state("s2") is None
+    assert engine.phi_state("s1").observations == 2
+    assert engine.phi_state("s3").observations == 1
+
+
+def test_tracked_semantic_graphs_are_bounded() -> None:
+    settings = Settings()
+    settings.u.epistemic.session_graph = True
+    engine = build_u_engine(settings)
+    engine.max_sessions = 2
+    for session_id in ("s1", "s2", "s1", "s3"):
+        engine.reason(session_id, _observation())
+    assert engine.semantic_graph("s2") is None
+    assert len(engine.semantic_graph("s1")) == 4
+    assert len(engine.semantic_graph("s3")) == 3
+
+
+def test_stateless_phi_when_sequential_disabled() -> None:
+    settings = Settings()
+    settings.u.phi.sequential = False
+    engine = build_u_engine(settings)
+    for _ in range(3):
+        decision = engine.reason("session-001", _observation())
+        assert decision.probability == pytest.approx(POSTERIOR_TRUE, abs=1e-12)
+    assert engine.phi_state("session-001") is None
+
+
+def test_session_graph_matches_per_chain_traversal(engine) -> None:
+    settings = Settings()
+    settings.u.epistemic.session_graph = True
+    settings.u.epistemic.session_max_nodes = 4
+    grown = build_u_engine(settings)
+    for value in (True, True, False, True):
+        observation = _observation(value=value)
+        expected = engine.reason("session-001", observation)
+        decision = grown.reason("session-001", observation)
+        assert decision.semantic_path == expected.semantic_path
+        assert decision.explanation == expected.explanation
+    graph = grown.semantic_graph("session-001")
+    assert graph is not None and len(graph) == 4
+    assert engine.semantic_graph("session-001") is None
+
+    grown.forget_session("session-001")
+    assert grown.semantic_graph("session-001") is None
+    decision = grown.reason("session-001", _observation())
+    assert decision.semantic_path == engine.reason("session-001", _observation()).semantic_path
+    assert len(grown.semantic_graph("session-001")) == 3
+
+
+def test_bias_reports_are_precomputed_and_follow_ontology_changes(engine) -> None:
+    assert set(engine._bias_reports) == {"participant_requests_turn"}
+    first = engine.reason("session-001", _observation())
+    second = engine.reason("session-001", _observation())
+    assert second.bias_audit == first.bias_audit
+    assert second.bias_audit is not first.bias_audit
+    first.bias_audit.protected_paths.append(["tampered"])
+    assert engine.reason("session-001", _observation()).bias_audit == second.bias_audit
+    assert first.bias_audit.passed
+
+    engine.ontology.relate("ethnicity", "influences", "participant_requests_turn")
+    poisoned = engine.reason("session-001", _observation())
+    assert not poisoned.bias_audit.passed
+    assert poisoned.bias_audit == engine.bias_auditor.audit_paths(
+        engine.ontology, "participant_requests_turn"
+    )
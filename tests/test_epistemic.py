@@ -4,12 +4,18 @@ import sys
 import numpy as np
 import pytest
 
+import obiai.epistemic.arrays as arrays_module
 from obiai.core.config import EpistemicSettings
 from obiai.epistemic import (
+    ArrayEpistemicDAG,
     EpistemicDAG,
     SemanticBeliefNode,
+    SemanticChainCache,
+    SessionSemanticGraph,
     build_semantic_dag,
+    k_best_semantic_paths,
     traverse_semantic_path,
+    traverse_semantic_paths,
 )
 
 POSTERIOR = 943 / 1010  # raised-hand posterior from tests/test_marginal.py
@@ -87,3 +93,431 @@ def test_legacy_import_is_silent_and_compatible() -> None:
         check=True,
     )
     assert proc.stdout == ""
+
+
+def _random_dags(
+    seed: int, n: int = 40, n_edges: int = 120
+) -> tuple[EpistemicDAG, ArrayEpistemicDAG]:
+    rng = np.random.default_rng(seed)
+    dag = EpistemicDAG(alpha=0.6, beta=0.4)
+    for i, p in enumerate(rng.dirichlet([1.0, 1.0, 1.0], size=n)):
+        dag.add_node(SemanticBeliefNode(f"n{i}", P=p, H_S=float(rng.uniform(0.0, 3.0))))
+    for _ in range(n_edges):
+        i, j = sorted(rng.choice(n, size=2, replace=False))
+        dag.add_edge(f"n{i}", f"n{j}")
+    return dag, ArrayEpistemicDAG.from_dag(dag)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_array_dag_matches_dict_dag(seed: int) -> None:
+    dag, arrays = _random_dags(seed)
+    for start in ("n0", "n3", "n7"):
+        for target in ("n20", "n33", "n39", start):
+            for filter_threshold in (0.5, 2.0):
+                expected = dag.filter_flash_traversal(start, target, filter_threshold, 0.3)
+                actual = arrays.filter_flash_traversal(start, target, filter_threshold, 0.3)
+                if expected is None:
+                    assert actual is None
+                    continue
+                assert actual["path"] == expected["path"]
+                assert actual["total_cost"] == pytest.approx(expected["total_cost"])
+                assert actual["flash_events"] == pytest.approx(expected["flash_events"])
+
+
+def test_array_dag_hand_raise_chain(settings: EpistemicSettings) -> None:
+    arrays = ArrayEpistemicDAG.from_dag(_hand_raise_dag(settings))
+    result = traverse_semantic_path(arrays, SOURCE, TARGET, settings)
+    assert result is not None
+    assert result.path == [SOURCE, INTERMEDIATE, TARGET]
+    assert [e.entropy_gradient for e in result.flash_events] == pytest.approx([0.5, 0.4])
+    assert arrays.beliefs.shape == (3, 2)
+    assert arrays.node(INTERMEDIATE).P == pytest.approx([POSTERIOR, 1.0 - POSTERIOR])
+
+
+def test_array_dag_bulk_edges_reject_cycles_atomically() -> None:
+    arrays = ArrayEpistemicDAG()
+    arrays.add_nodes(["a", "b", "c"], np.full((3, 2), 0.5), [1.0, 1.0, 1.0])
+    arrays.add_edges([("a", "b"), ("a", "b")])
+    assert arrays.n_edges == 1
+    with pytest.raises(ValueError, match="cycle"):
+        arrays.add_edges([("b", "c"), ("c", "a")])
+    assert arrays.successors("b") == []
+    arrays.add_edge("b", "c")
+    with pytest.raises(ValueError, match="cycle"):
+        arrays.add_edge("c", "a")
+    indptr, indices = arrays.csr()
+    assert indptr.tolist() == [0, 1, 2, 2]
+    assert indices.tolist() == [1, 2]
+
+
+def test_edge_costs_are_cached_and_refreshed_on_belief_change() -> None:
+    dag, arrays = _random_dags(3)
+    source = next(node_id for node_id, targets in dag.edges.items() if targets)
+    target = dag.edges[source][0]
+    expected = dag.calculate_traversal_cost(dag.nodes[source], dag.nodes[target])
+    assert dag.edge_cost(source, target) == pytest.approx(expected)
+    assert arrays.edge_cost(source, target) == pytest.approx(expected)
+
+    for graph in (dag, arrays):
+        graph.update_belief(target, P=np.array([0.01, 0.01, 0.98]), H_S=0.0)
+    changed = dag.calculate_traversal_cost(dag.nodes[source], dag.nodes[target])
+    assert changed != pytest.approx(expected)
+    assert dag.edge_cost(source, target) == pytest.approx(changed)
+    assert arrays.edge_cost(source, target) == pytest.approx(changed)
+
+    expected_path = dag.filter_flash_traversal("n0", "n39", 2.0, 0.3)
+    actual_path = arrays.filter_flash_traversal("n0", "n39", 2.0, 0.3)
+    assert (actual_path is None) == (expected_path is None)
+    if expected_path is not None:
+        assert actual_path["path"] == expected_path["path"]
+        assert actual_path["total_cost"] == pytest.approx(expected_path["total_cost"])
+
+
+def test_edge_insertions_price_only_new_and_stale_edges(monkeypatch: pytest.MonkeyPatch) -> None:
+    dag, arrays = _random_dags(4)
+    arrays.edge_cost("n0", dag.edges["n0"][0])
+    priced: list[int] = []
+    traversal_costs = arrays_module.traversal_costs
+
+    def counting(*args):
+        priced.append(len(args[3]))
+        return traversal_costs(*args)
+
+    monkeypatch.setattr(arrays_module, "traversal_costs", counting)
+    missing = [
+        (f"n{i}", f"n{j}")
+        for i in range(40)
+        for j in range(i + 1, 40)
+        if f"n{j}" not in dag.edges[f"n{i}"]
+    ]
+    for source, target in missing[:3]:
+        dag.add_edge(source, target)
+        arrays.add_edge(source, target)
+    dag.update_belief("n39", P=np.array([0.2, 0.3, 0.5]))
+    arrays.update_belief("n39", P=np.array([0.2, 0.3, 0.5]))
+    arrays.edge_cost(*missing[0])
+    into_n39 = {(source, "n39") for source, targets in dag.edges.items() if "n39" in targets}
+    stale = len(into_n39 | set(missing[:3]))
+    assert priced == [stale]
+
+    dag.add_edges(missing[3:8])
+    arrays.add_edges(missing[3:8])
+    arrays.edge_cost(*missing[3])
+    assert priced == [stale, 5]
+    for source, targets in dag.edges.items():
+        for target in targets:
+            assert arrays.edge_cost(source, target) == pytest.approx(dag.edge_cost(source, target))
+
+
+def test_long_chain_path_and_flashes_rebuilt_from_parents() -> None:
+    dag = EpistemicDAG()
+    n = 2000
+    for i in range(n):
+        dag.add_node(SemanticBeliefNode(f"c{i}", P=np.array([0.5, 0.5]), H_S=float(n - i)))
+    for i in range(n - 1):
+        dag.add_edge(f"c{i}", f"c{i + 1}")
+    result = dag.filter_flash_traversal("c0", f"c{n - 1}", filter_threshold=1.0, flash_threshold=0.5)
+    assert result is not None
+    assert result["path"] == [f"c{i}" for i in range(n)]
+    assert result["total_cost"] == pytest.approx(0.5 * (n - 1))
+    assert [e["transition"] for e in result["flash_events"]] == [
+        f"c{i} -> c{i + 1}" for i in range(n - 1)
+    ]
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_dag_sweep_matches_dijkstra(seed: int) -> None:
+    dag, arrays = _random_dags(seed, n=60, n_edges=240)
+    for graph in (dag, arrays):
+        for start in ("n0", "n2", "n9"):
+            for target in ("n30", "n45", "n59", start):
+                expected = graph.filter_flash_traversal(start, target, 1.0, 0.3)
+                actual = graph.filter_flash_traversal(start, target, 1.0, 0.3, algorithm="dag")
+                assert actual == expected
+
+
+def test_unknown_traversal_algorithm_rejected(settings: EpistemicSettings) -> None:
+    dag = _hand_raise_dag(settings)
+    with pytest.raises(ValueError, match="Unknown traversal algorithm"):
+        dag.filter_flash_traversal(SOURCE, TARGET, 2.0, 0.25, algorithm="bfs")
+
+
+def test_incremental_order_tracks_backward_edges() -> None:
+    rng = np.random.default_rng(6)
+    dag = EpistemicDAG()
+    n = 80
+    for i in rng.permutation(n):
+        dag.add_node(SemanticBeliefNode(f"n{i}", P=np.array([0.5, 0.5]), H_S=1.0))
+    rank = rng.permutation(n)
+    for _ in range(400):
+        i, j = rng.choice(n, size=2, replace=False)
+        if rank[i] > rank[j]:
+            i, j = j, i
+        dag.add_edge(f"n{i}", f"n{j}")
+        position = {node_id: k for k, node_id in enumerate(dag.topological_order())}
+        assert all(
+            position[a] < position[b] for a, targets in dag.edges.items() for b in targets
+        )
+    top, bottom = f"n{np.argmin(rank)}", f"n{np.argmax(rank)}"
+    with pytest.raises(ValueError, match="cycle"):
+        dag.add_edge(bottom, top)
+    with pytest.raises(ValueError, match="cycle"):
+        dag.add_edge(top, top)
+
+
+def test_bulk_add_edges_validates_once_and_is_atomic() -> None:
+    dag = EpistemicDAG()
+    for node_id in ("a", "b", "c", "d"):
+        dag.add_node(SemanticBeliefNode(node_id, P=np.array([0.5, 0.5]), H_S=1.0))
+    dag.add_edges([("c", "d"), ("b", "c"), ("a", "b"), ("a", "b")])
+    assert dag.edges["a"] == ["b"]
+    assert dag.topological_order() == ["a", "b", "c", "d"]
+    with pytest.raises(ValueError, match="cycle"):
+        dag.add_edges([("a", "d"), ("d", "a")])
+    assert dag.edges["a"] == ["b"] and dag.edges["d"] == []
+
+
+@pytest.mark.parametrize("algorithm", ["dijkstra", "dag"])
+def test_traverse_from_matches_pairwise_traversals(algorithm: str) -> None:
+    dag, arrays = _random_dags(7, n=50, n_edges=200)
+    for graph in (dag, arrays):
+        everything = graph.traverse_from("n1", 1.0, 0.3, algorithm=algorithm)
+        assert "n1" in everything
+        for target in (f"n{i}" for i in range(50)):
+            expected = graph.filter_flash_traversal("n1", target, 1.0, 0.3, algorithm=algorithm)
+            assert everything.get(target) == expected
+        chosen = graph.traverse_from("n1", 1.0, 0.3, targets=["n40", "n20"], algorithm=algorithm)
+        assert chosen == {t: everything[t] for t in ("n40", "n20") if t in everything}
+
+    batch = dag.traverse_many(["n0", "n1"], 1.0, 0.3, targets=["n49"], algorithm=algorithm)
+    assert batch == {
+        start: dag.traverse_from(start, 1.0, 0.3, targets=["n49"], algorithm=algorithm)
+        for start in ("n0", "n1")
+    }
+
+
+def test_semantic_paths_to_several_decisions(settings: EpistemicSettings) -> None:
+    dag = _hand_raise_dag(settings)
+    results = traverse_semantic_paths(dag, SOURCE, [TARGET, INTERMEDIATE], settings)
+    assert results[TARGET] == traverse_semantic_path(dag, SOURCE, TARGET, settings)
+    assert results[INTERMEDIATE].path == [SOURCE, INTERMEDIATE]
+
+
+def _all_filtered_paths(dag: EpistemicDAG, start: str, target: str, limit: float) -> list:
+    if start == target:
+        return [([start], 0.0)]
+    paths = []
+    for neighbour in dag.edges[start]:
+        step = dag.edge_cost(start, neighbour)
+        if step < limit:
+            for rest, cost in _all_filtered_paths(dag, neighbour, target, limit):
+                paths.append(([start, *rest], step + cost))
+    return paths
+
+
+def test_k_best_paths_enumerates_in_cost_order() -> None:
+    dag, _ = _random_dags(9, n=14, n_edges=60)
+    expected = sorted(cost for _, cost in _all_filtered_paths(dag, "n0", "n13", 1.5))
+    results = list(dag.k_best_paths("n0", "n13", 1.5, 0.3))
+    assert [r["total_cost"] for r in results] == pytest.approx(expected)
+    assert len({tuple(r["path"]) for r in results}) == len(results)
+    assert results[0] == dag.filter_flash_traversal("n0", "n13", 1.5, 0.3)
+    assert len(list(dag.k_best_paths("n0", "n13", 1.5, 0.3, k=3))) == min(3, len(expected))
+    assert list(dag.k_best_paths("n13", "n0", 1.5, 0.3)) == []
+    with pytest.raises(ValueError, match="k must be at least 1"):
+        dag.k_best_paths("n0", "n13", 1.5, 0.3, k=0)
+    with pytest.raises(ValueError, match="does not exist"):
+        dag.k_best_paths("n0", "missing", 1.5, 0.3)
+
+
+def test_runner_up_semantic_paths(settings: EpistemicSettings) -> None:
+    dag = _hand_raise_dag(settings)
+    dag.add_edge(SOURCE, TARGET)  # a direct semantic jump competes with the chain
+    results = k_best_semantic_paths(dag, SOURCE, TARGET, settings, k=5)
+    assert [r.path for r in results] == [[SOURCE, INTERMEDIATE, TARGET], [SOURCE, TARGET]]
+    assert results[0].total_cost <= results[1].total_cost
+
+
+def test_astar_matches_dijkstra_and_tracks_changes() -> None:
+    dag, _ = _random_dags(10, n=60, n_edges=240)
+    pairs = [("n0", "n59"), ("n2", "n40"), ("n5", "n31"), ("n9", "n9"), ("n40", "n2")]
+
+    def check() -> None:
+        for start, target in pairs:
+            expected = dag.filter_flash_traversal(start, target, 1.0, 0.3)
+            actual = dag.filter_flash_traversal(start, target, 1.0, 0.3, algorithm="astar")
+            if expected is None:
+                assert actual is None
+            else:
+                assert actual["total_cost"] == pytest.approx(expected["total_cost"])
+
+    check()
+    dag.update_belief("n20", P=np.array([0.98, 0.01, 0.01]), H_S=0.0)
+    dag.add_node(SemanticBeliefNode("late", P=np.array([0.2, 0.3, 0.5]), H_S=0.5))
+    dag.add_edge("n3", "late")
+    dag.add_edge("late", "n50")
+    check()
+
+    # The incrementally refreshed tables equal freshly built ones.
+    incremental = {node: dag._from_landmarks[node].copy() for node in dag.nodes}
+    dag.set_landmarks(dag._landmarks)
+    for node, distances in incremental.items():
+        np.testing.assert_allclose(dag._from_landmarks[node], distances)
+
+
+def test_belief_updates_refresh_only_affected_landmark_distances(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dag, _ = _random_dags(11, n=400, n_edges=1600)
+    dag.set_landmarks()
+    relaxed: list[str] = []
+    for name in ("_relax_from_landmarks", "_relax_to_landmarks"):
+        relax = getattr(dag, name)
+
+        def counting(node_id, slot, relax=relax):
+            relaxed.append(node_id)
+            return relax(node_id, slot)
+
+        monkeypatch.setattr(dag, name, counting)
+
+    for node in ["n50", "n100", "n200", "n300"]:
+        relaxed.clear()
+        dag.update_belief(node, P=np.array([0.98, 0.01, 0.01]), H_S=0.0)
+        expected = dag.filter_flash_traversal("n0", "n399", 1.0, 0.3)
+        actual = dag.filter_flash_traversal("n0", "n399", 1.0, 0.3, algorithm="astar")
+        assert actual == expected
+        # A mid-graph update used to re-relax a whole suffix and prefix of
+        # the order, costing more than the A* query it was meant to speed up.
+        assert 0 < len(relaxed) < len(dag.nodes) // 10
+
+    incremental = {
+        node: (dag._from_landmarks[node].copy(), dag._to_landmarks[node].copy())
+        for node in dag.nodes
+    }
+    dag.set_landmarks(dag._landmarks)
+    for node, (from_distances, to_distances) in incremental.items():
+        np.testing.assert_allclose(dag._from_landmarks[node], from_distances)
+        np.testing.assert_allclose(dag._to_landmarks[node], to_distances)
+
+
+def test_astar_needs_a_single_target(settings: EpistemicSettings) -> None:
+    dag = _hand_raise_dag(settings)
+    with pytest.raises(ValueError, match="exactly one target"):
+        dag.traverse_from(SOURCE, 2.0, 0.25, algorithm="astar")
+
+
+@pytest.mark.parametrize("posterior", [POSTERIOR, 0.5, 0.02])
+@pytest.mark.parametrize("filter_threshold", [0.1, 2.0])
+def test_chain_cache_matches_fresh_dag(posterior: float, filter_threshold: float) -> None:
+    settings = EpistemicSettings(filter_threshold=filter_threshold, flash_threshold=0.45)
+    cache = SemanticChainCache()
+    chain = [SOURCE, INTERMEDIATE, TARGET]
+    for source_belief in (0.85, 0.6):
+        fresh = build_semantic_dag(
+            posterior,
+            settings,
+            source=SOURCE,
+            intermediate=INTERMEDIATE,
+            target=TARGET,
+            source_belief=source_belief,
+        )
+        expected = traverse_semantic_path(fresh, SOURCE, TARGET, settings)
+        closed_form = cache.traverse(chain, posterior, settings, source_belief=source_belief)
+        skeleton = cache.dag(chain, posterior, settings, source_belief=source_belief)
+        via_skeleton = traverse_semantic_path(skeleton, SOURCE, TARGET, settings)
+        for actual in (closed_form, via_skeleton):
+            if expected is None:
+                assert actual is None
+                continue
+            assert actual.path == expected.path
+            assert actual.total_cost == pytest.approx(expected.total_cost)
+            assert actual.flash_events == expected.flash_events
+    assert cache.dag(chain, posterior, settings) is skeleton
+
+
+def test_remove_node_keeps_order_costs_and_landmarks_consistent() -> None:
+    dag, _ = _random_dags(seed=4)
+    victim = dag.topological_order()[len(dag.nodes) // 2]
+    dag.set_landmarks(count=4)
+    dag.remove_node(victim)
+
+    assert victim not in dag.nodes and victim not in dag.topological_order()
+    assert all(victim not in to_ids for to_ids in dag.edges.values())
+    position = {node_id: i for i, node_id in enumerate(dag.topological_order())}
+    assert all(
+        position[from_id] < position[to_id]
+        for from_id, to_ids in dag.edges.items()
+        for to_id in to_ids
+    )
+    start = dag.topological_order()[0]
+    for target in dag.topological_order()[1:]:
+        expected = dag.filter_flash_traversal(start, target, 2.0, 0.25)
+        actual = dag.filter_flash_traversal(start, target, 2.0, 0.25, algorithm="astar")
+        assert (actual is None) == (expected is None)
+        if expected is not None:
+            assert actual["total_cost"] == pytest.approx(expected["total_cost"])
+
+
+def test_session_graph_matches_chain_and_reuses_paths(settings: EpistemicSettings) -> None:
+    graph = SessionSemanticGraph(settings)
+    chain = [SOURCE, INTERMEDIATE, TARGET]
+    cache = SemanticChainCache()
+    memoized = []
+    for i, (posterior, source_belief) in enumerate(
+        [(POSTERIOR, 0.85), (POSTERIOR, 0.6), (0.5, 0.9)]
+    ):
+        expected = cache.traverse(chain, posterior, settings, source_belief=source_belief)
+        actual = graph.observe(f"obs-{i}", chain, posterior, source_belief=source_belief)
+        assert actual.path == expected.path
+        assert actual.total_cost == pytest.approx(expected.total_cost)
+        assert actual.flash_events == expected.flash_events
+        memoized.append(graph.traverse(INTERMEDIATE, TARGET))
+    # Same posterior reuses the intermediate's path; a new one recomputes it.
+    assert memoized[1] is memoized[0]
+    assert memoized[2] is not memoized[1]
+    assert len(graph) == 2 + 3
+
+
+def test_session_graph_keeps_reversed_chains_apart(settings: EpistemicSettings) -> None:
+    graph = SessionSemanticGraph(settings)
+    cache = SemanticChainCache()
+    forward, reversed_chain = ["a", "b", "c"], ["z", "c", "b"]
+    graph.observe("obs-0", forward, 0.9)
+    memoized = graph.traverse("b", "c")
+    belief = graph.dag.nodes["b@intermediate"].P.copy()
+
+    expected = cache.traverse(reversed_chain, 0.1, settings)
+    assert graph.observe("obs-1", reversed_chain, 0.1) == expected
+    # The reversed chain neither closes a cycle nor touches the forward one.
+    assert graph.dag.nodes["b@intermediate"].P == pytest.approx(belief)
+    assert graph.traverse("b", "c") is memoized
+    assert graph.observe("obs-2", forward, 0.9) == cache.traverse(forward, 0.9, settings)
+
+
+@pytest.mark.parametrize("first", [0, 1])
+def test_session_graph_results_do_not_depend_on_arrival_order(
+    settings: EpistemicSettings, first: int
+) -> None:
+    chains = [["a", "b", "c"], ["x", "c", "d"]]
+    graph = SessionSemanticGraph(settings)
+    cache = SemanticChainCache()
+    for k, chain in enumerate([chains[first], chains[1 - first]]):
+        assert graph.observe(f"obs-{k}", chain, POSTERIOR) == cache.traverse(
+            chain, POSTERIOR, settings
+        )
+    assert graph.dag.nodes["c@intermediate"].H_S != graph.dag.nodes["c@decision"].H_S
+
+
+def test_session_graph_evicts_least_recent_observations(settings: EpistemicSettings) -> None:
+    graph = SessionSemanticGraph(settings, max_nodes=6)
+    chain = [SOURCE, INTERMEDIATE, TARGET]
+    for i in range(10):
+        graph.observe(f"obs-{i}", chain, POSTERIOR)
+    graph.observe("obs-6", chain, POSTERIOR)  # refreshes its recency
+    graph.observe("obs-10", chain, POSTERIOR)
+
+    assert len(graph) == 6
+    kept = sorted(node_id.split("#")[1] for node_id in graph.dag.nodes if "#" in node_id)
+    assert kept == ["obs-10", "obs-6", "obs-8", "obs-9"]
+    with pytest.raises(ValueError, match="max_nodes"):
+        SessionSemanticGraph(settings, max_nodes=2)
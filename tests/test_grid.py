@@ -0,0 +1,98 @@
+"""Grid / quadrature phi-marginalization against closed-form integrals.
+
+Sensor model with a continuous true-positive rate phi ~ Uniform(0, 1):
+
+    T (root, P=0.5) -> D,  P(D | T) = phi,  P(D | ~T) = 0.1
+
+    P(T, D)  = 0.5 * E[phi] = 0.25,  P(~T, D) = 0.05  =>  P(T | D) = 5/6
+    E[phi | D] = (1/6 + 0.025) / 0.3 = 23/36
+"""
+
+import numpy as np
+import pytest
+
+from obiai.bayes import BayesianNetwork, BinaryNode
+from obiai.bayesian import GridPhiMarginalizedNetwork, PhiGrid, PhiMarginalizedNetwork
+
+T = "participant_requests_turn"
+D = "participant_raised_hand"
+PARENTS = {T: (), D: (T,)}
+
+
+def _tpr_network(grid: PhiGrid, inference: str = "ve") -> GridPhiMarginalizedNetwork:
+    return GridPhiMarginalizedNetwork(
+        PARENTS,
+        {T: 0.5, D: lambda phi: np.stack([np.full_like(phi, 0.1), phi], axis=-1)},
+        grid,
+        inference=inference,
+    )
+
+
+@pytest.mark.parametrize("inference", ["enumerate", "ve", "junction_tree"])
+def test_gauss_legendre_is_exact_for_polynomial_likelihoods(inference: str) -> None:
+    network = _tpr_network(PhiGrid.gauss_legendre(0.0, 1.0, 4), inference)
+    assert network.query(T, {D: True}) == pytest.approx(5 / 6, abs=1e-12)
+    assert network.phi_mean({D: True}) == pytest.approx(23 / 36, abs=1e-12)
+    assert network.phi_mean({}) == pytest.approx(0.5, abs=1e-12)
+
+
+def test_uniform_grid_converges() -> None:
+    network = _tpr_network(PhiGrid.uniform(0.0, 1.0, 256))
+    result = network.query_with_posterior(T, {D: True})
+    assert result.posterior == pytest.approx(5 / 6, abs=1e-9)
+    assert result.phi_posterior.shape == (256,)
+    assert result.phi_posterior.sum() == pytest.approx(1.0, abs=1e-12)
+    assert result.phi_posterior @ network.grid.points == pytest.approx(23 / 36, abs=1e-5)
+    assert result.conditionals[-1] > result.conditionals[0]
+
+
+def test_product_grid_matches_discrete_mixture() -> None:
+    tpr = PhiGrid.uniform(0.6, 1.0, 3)
+    fpr = PhiGrid.gauss_legendre(0.0, 0.4, 3, density=lambda x: 1.0 - x)
+    grid = tpr.product(fpr)
+    assert grid.points.shape == (9, 2)
+    network = GridPhiMarginalizedNetwork(
+        PARENTS,
+        {T: 0.5, D: lambda phi: np.stack([phi[:, 1], phi[:, 0]], axis=-1)},
+        grid,
+    )
+
+    networks = {}
+    for i, (p_tp, p_fp) in enumerate(grid.points):
+        discrete = BayesianNetwork()
+        discrete.add(BinaryNode(T, cpt={(): 0.5}))
+        discrete.add(BinaryNode(D, parents=(T,), cpt={(True,): p_tp, (False,): p_fp}))
+        networks[str(i)] = discrete
+    mixture = PhiMarginalizedNetwork(dict(zip(networks, grid.weights.tolist())), networks)
+    for value in (True, False):
+        assert network.query(T, {D: value}) == pytest.approx(
+            mixture.query(T, {D: value}), abs=1e-12
+        )
+        assert network.phi_posterior({D: value}).tolist() == pytest.approx(
+            list(mixture.phi_posterior({D: value}).values()), abs=1e-12
+        )
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError, match="sum to 1"):
+        PhiGrid(np.array([0.1, 0.2]), np.array([0.5, 0.6]))
+    with pytest.raises(ValueError, match="no mass"):
+        PhiGrid.uniform(0.0, 1.0, 4, density=lambda x: np.zeros_like(x))
+    grid = PhiGrid.uniform(0.0, 1.0, 4)
+    with pytest.raises(ValueError, match="shape"):
+        GridPhiMarginalizedNetwork(PARENTS, {T: 0.5, D: lambda phi: phi}, grid)
+    with pytest.raises(ValueError, match=r"\[0, 1\]"):
+        GridPhiMarginalizedNetwork(PARENTS, {T: 1.5, D: 0.5}, grid)
+    with pytest.raises(ValueError, match="added first"):
+        GridPhiMarginalizedNetwork({D: (T,), T: ()}, {T: 0.5, D: 0.5}, grid)
+    with pytest.raises(KeyError):
+        _tpr_network(grid).query("unknown", {D: True})
+
+
+def test_impossible_evidence_returns_a_copy_of_the_prior() -> None:
+    network = GridPhiMarginalizedNetwork(PARENTS, {T: 1.0, D: 0.0}, PhiGrid.uniform(0.0, 1.0, 4))
+    result = network.query_with_posterior(T, {D: True})
+    assert result.posterior == 0.5
+    assert result.phi_posterior.tolist() == network.grid.weights.tolist()
+    result.phi_posterior[:] = 0.0
+    assert network.grid.weights.sum() == pytest.approx(1.0)
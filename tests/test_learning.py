@@ -0,0 +1,114 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from obiai.bayes import BayesianNetwork, BinaryNode, NoisyOrNode
+from obiai.bayesian import PhiMarginalizedNetwork, SufficientStatistics, fit_cpts
+
+STRUCTURE = {"a": (), "b": (), "c": ("a", "b")}
+
+
+def _data(n: int, seed: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = rng.random(n) < 0.3
+    b = rng.random(n) < 0.6
+    c = rng.random(n) < np.where(a & b, 0.9, np.where(a, 0.6, 0.2))
+    return {"a": a, "b": b, "c": c}
+
+
+def test_fit_matches_smoothed_counts() -> None:
+    data = _data(500, seed=1)
+    tables = fit_cpts(STRUCTURE, data, alpha=2.0)
+    assert tables["a"].shape == ()
+    assert tables["a"] == pytest.approx((data["a"].sum() + 2.0) / (500 + 4.0))
+    for a in (False, True):
+        for b in (False, True):
+            rows = (data["a"] == a) & (data["b"] == b)
+            expected = (data["c"][rows].sum() + 2.0) / (rows.sum() + 4.0)
+            assert tables["c"][int(a), int(b)] == pytest.approx(expected)
+
+
+def test_online_updates_equal_batch_fit() -> None:
+    data = _data(900, seed=2)
+    stats = SufficientStatistics.empty(STRUCTURE)
+    for start in range(0, 900, 300):
+        stats.update({name: values[start : start + 300] for name, values in data.items()})
+    batch = fit_cpts(STRUCTURE, data)
+    for name, table in stats.tables().items():
+        np.testing.assert_allclose(table, batch[name])
+
+
+def test_array_and_arrow_style_inputs() -> None:
+    data = _data(200, seed=3)
+    columns = ["c", "a", "b"]
+    matrix = np.column_stack([data[name] for name in columns])
+
+    class ArrowLike:
+        column_names = columns
+
+        def column(self, name: str) -> np.ndarray:
+            return matrix[:, columns.index(name)]
+
+    expected = fit_cpts(STRUCTURE, data)
+    for source, names in ((matrix, columns), (ArrowLike(), None)):
+        fitted = fit_cpts(STRUCTURE, source, columns=names)
+        for name in STRUCTURE:
+            np.testing.assert_allclose(fitted[name], expected[name])
+    with pytest.raises(ValueError, match="columns"):
+        fit_cpts(STRUCTURE, matrix)
+    with pytest.raises(KeyError):
+        fit_cpts(STRUCTURE, {"a": data["a"], "b": data["b"]})
+
+
+def test_apply_updates_network_in_place() -> None:
+    network = BayesianNetwork()
+    network.add(BinaryNode("a", cpt={(): 0.5}))
+    network.add(BinaryNode("b", cpt={(): 0.5}))
+    flat = {key: 0.5 for key in product([False, True], repeat=2)}
+    network.add(BinaryNode("c", parents=("a", "b"), cpt=flat))
+    assert network.query("c", {"a": True, "b": True}) == pytest.approx(0.5)
+
+    stats = SufficientStatistics.empty(STRUCTURE)
+    stats.update({"a": [True] * 8, "b": [True] * 8, "c": [True] * 7 + [False]})
+    stats.apply(network)
+    assert network.query("c", {"a": True, "b": True}) == pytest.approx(8 / 10)
+    assert stats.network().query("c", {"a": True, "b": True}) == pytest.approx(8 / 10)
+
+
+def test_apply_rejects_parametric_nodes_before_writing() -> None:
+    network = BayesianNetwork()
+    network.add(BinaryNode("a", cpt={(): 0.5}))
+    network.add(BinaryNode("b", cpt={(): 0.5}))
+    network.add(NoisyOrNode("c", parents=("a", "b"), p=(0.6, 0.3)))
+    before = network.query("c", {})
+
+    stats = SufficientStatistics.empty(STRUCTURE)
+    stats.update({"a": [True] * 8, "b": [True] * 8, "c": [True] * 8})
+    with pytest.raises(ValueError, match="BinaryNode"):
+        stats.apply(network)
+    assert network.query("a", {}) == pytest.approx(0.5)
+    assert network.query("c", {}) == pytest.approx(before)
+
+
+
+def test_constructor_starts_from_zero_counts() -> None:
+    stats = SufficientStatistics(STRUCTURE, alpha=0.5)
+    stats.update(_data(50, seed=3))
+    expected = SufficientStatistics.empty(STRUCTURE, alpha=0.5)
+    expected.update(_data(50, seed=3))
+    for name in STRUCTURE:
+        assert stats.counts[name].tolist() == expected.counts[name].tolist()
+    with pytest.raises(ValueError, match="alpha"):
+        SufficientStatistics(STRUCTURE, alpha=-1.0)
+
+
+def test_apply_to_a_phi_member_updates_the_mixture() -> None:
+    networks = {phi: SufficientStatistics.empty({"A": ()}).network() for phi in ("lo", "hi")}
+    mixture = PhiMarginalizedNetwork({"lo": 0.5, "hi": 0.5}, networks)
+    assert mixture.query("A", {}) == pytest.approx(0.5)
+
+    stats = SufficientStatistics.empty({"A": ()})
+    stats.update({"A": [True] * 8})
+    stats.apply(networks["lo"])
+    assert mixture.query("A", {}) == pytest.approx(0.5 * 9 / 10 + 0.5 * 0.5)
@@ -13,10 +13,12 @@ Hand-derived posteriors (see docs/traceability.md):
     P(T | D=false) = 0.0285 / 0.495 = 19/330   = 0.05757575...
 """
 
+import numpy as np
 import pytest
 
 from obiai.bayes import BayesianNetwork, BinaryNode
-from obiai.bayesian import PhiMarginalizedNetwork
+from obiai.bayesian import PhiMarginalizedNetwork, PhiPosteriorState
+from obiai.bayesian.junction import JunctionTreeStructure
 
 T = "participant_requests_turn"
 D = "participant_raised_hand"
@@ -106,3 +108,107 @@ def test_prior_validation() -> None:
         PhiMarginalizedNetwork({"a": 1.0, "b": 0.0}, networks)
     with pytest.raises(ValueError, match="same phi"):
         PhiMarginalizedNetwork({"a": 1.0}, networks)
+
+
+def test_junction_trees_share_structure_across_phi(phimix: PhiMarginalizedNetwork) -> None:
+    structure = phimix.compile_junction_trees()
+    trees = [network._engine() for network in phimix.networks.values()]
+    assert all(tree.structure is structure for tree in trees)
+    assert phimix._engine().structure is structure
+    assert phimix.query(T, {D: True}) == pytest.approx(943 / 1010, abs=1e-12)
+    assert phimix.query(T, {D: False}) == pytest.approx(19 / 330, abs=1e-12)
+    assert phimix.phi_posterior({D: True})["calibrated"] == pytest.approx(0.45 / 0.505, abs=1e-12)
+    # Barren nodes are not pruned away from the shared tree.
+    assert phimix._engine_for(D, {}) is phimix._engine()
+
+
+def test_junction_tree_structure_must_match() -> None:
+    other = BayesianNetwork()
+    other.add(BinaryNode(T, cpt={(): 0.5}))
+    structure = JunctionTreeStructure.from_network(_network(0.9, 0.1))
+    with pytest.raises(ValueError, match="does not match"):
+        other.compile_junction_tree(structure)
+
+
+def test_query_many_matches_scalar_queries(phimix: PhiMarginalizedNetwork) -> None:
+    column = np.array([True, False, False, True, True]).reshape(-1, 1)
+    posteriors = phimix.query_many(T, column, [D])
+    assert posteriors.tolist() == pytest.approx(
+        [943 / 1010, 19 / 330, 19 / 330, 943 / 1010, 943 / 1010], abs=1e-12
+    )
+
+
+def test_query_with_posterior_single_pass(phimix: PhiMarginalizedNetwork) -> None:
+    result = phimix.query_with_posterior(T, {D: True})
+    assert result.posterior == pytest.approx(943 / 1010, abs=1e-12)
+    assert result.conditionals == pytest.approx(
+        {"calibrated": 0.97, "miscalibrated": 7 / 11}, abs=1e-12
+    )
+    assert result.phi_posterior == pytest.approx(phimix.phi_posterior({D: True}), abs=1e-12)
+    assert result.phi_posterior["calibrated"] == pytest.approx(0.45 / 0.505, abs=1e-12)
+
+
+def test_query_with_posterior_target_observed(phimix: PhiMarginalizedNetwork) -> None:
+    result = phimix.query_with_posterior(T, {T: True, D: True})
+    # Observing the target still weights phi by P(T, D | phi).
+    assert result.phi_posterior["calibrated"] == pytest.approx(
+        0.9 * 0.485 / (0.9 * 0.485 + 0.1 * 0.35), abs=1e-12
+    )
+    with pytest.raises(KeyError):
+        phimix.query_with_posterior("unknown", {D: True})
+
+
+def test_query_with_posterior_with_differing_graphs() -> None:
+    wider = _network(0.70, 0.40)
+    wider.add(BinaryNode("noise", cpt={(): 0.5}))
+    mixture = PhiMarginalizedNetwork(
+        {"calibrated": 0.9, "miscalibrated": 0.1},
+        {"calibrated": _network(0.97, 0.03), "miscalibrated": wider},
+    )
+    result = mixture.query_with_posterior(T, {D: True})
+    assert result.posterior == pytest.approx(943 / 1010, abs=1e-12)
+
+
+def test_phi_posterior_state_streams_observations(phimix: PhiMarginalizedNetwork) -> None:
+    state = PhiPosteriorState.from_prior(phimix.phi_prior)
+    for value in (True, True, False):
+        result = phimix.query_with_posterior(T, {D: value}, prior=state.posterior())
+        state.update(result.likelihood)
+    # Three conditionally independent observations given phi.
+    calibrated = 0.9 * 0.5 * 0.5 * 0.5
+    miscalibrated = 0.1 * 0.55 * 0.55 * 0.45
+    assert state.posterior()["calibrated"] == pytest.approx(
+        calibrated / (calibrated + miscalibrated), abs=1e-12
+    )
+    assert state.observations == 3
+
+    restored = PhiPosteriorState.restore(state.snapshot())
+    assert restored.posterior() == pytest.approx(state.posterior(), abs=0)
+    restored.update({"calibrated": 0.0, "miscalibrated": 0.0})
+    assert restored.observations == 3
+
+
+def test_barren_nodes_pruned_from_stacked_engine() -> None:
+    networks = {"calibrated": _network(0.97, 0.03), "miscalibrated": _network(0.70, 0.40)}
+    for network in networks.values():
+        network.add(BinaryNode("echo", parents=(D,), cpt={(True,): 0.6, (False,): 0.2}))
+    mixture = PhiMarginalizedNetwork({"calibrated": 0.9, "miscalibrated": 0.1}, networks)
+    result = mixture.query_with_posterior(T, {D: True})
+    assert result.posterior == pytest.approx(943 / 1010, abs=1e-12)
+    assert result.likelihood == pytest.approx({"calibrated": 0.5, "miscalibrated": 0.55})
+    assert mixture._engine_for(T, {D: True}) is not mixture._engine()
+    assert mixture._engine_for("echo", {D: True}) is mixture._engine()
+
+
+def test_member_edits_restack_without_explicit_compile(phimix: PhiMarginalizedNetwork) -> None:
+    assert phimix.query(T, {D: True}) == pytest.approx(943 / 1010, abs=1e-12)
+    calibrated = phimix.networks["calibrated"]
+    calibrated.nodes[D].cpt = {(True,): 0.70, (False,): 0.40}
+    calibrated.compile()
+    assert phimix.query(T, {D: True}) == pytest.approx(7 / 11, abs=1e-12)
+
+    calibrated.add(BinaryNode("E", parents=(D,), cpt={(True,): 0.9, (False,): 0.1}))
+    phimix.networks["miscalibrated"].add(
+        BinaryNode("E", parents=(D,), cpt={(True,): 0.9, (False,): 0.1})
+    )
+    assert phimix.query(T, {D: True, "E": True}) == pytest.approx(7 / 11, abs=1e-12)